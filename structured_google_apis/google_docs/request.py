@@ -3,7 +3,7 @@ from __future__ import annotations
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict, Field, alias_generators
+from pydantic import BaseModel, ConfigDict, Field
 
 from .resource import (
     DocumentStyle,
@@ -18,6 +18,11 @@ from .resource import (
     TextStyle,
 )
 
+_CAMEL_CONFIG = ConfigDict(
+    populate_by_name=True,
+    defer_build=True,
+)
+
 
 class HeaderFooterType(str, Enum):
     """
@@ -95,19 +100,18 @@ class CreateNamedRangeRequest(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#createnamedrangerequest
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     name: Optional[str] = Field(
+        alias="name",
         description=(
-            "The name of the NamedRange. Names do not need to be unique. Names must be at least 1 character and n",
-            "o more than 256 characters, measured in UTF-16 code units.",
+            "The name of the NamedRange. Names do not need to be unique. Names must be at least 1 character and n"
+            "o more than 256 characters, measured in UTF-16 code units."
         ),
         default=None,
     )
     range: Optional[Range] = Field(
+        alias="range",
         description="The range to apply the name to.",
         default=None,
     )
@@ -119,16 +123,15 @@ class CreateParagraphBulletsRequest(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#createparagraphbulletsrequest
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     range: Optional[Range] = Field(
+        alias="range",
         description="The range to apply the bullet preset to.",
         default=None,
     )
-    bullet_preset: BulletGlyphPreset = Field(
+    bullet_preset: Optional[BulletGlyphPreset] = Field(
+        alias="bulletPreset",
         description="The kinds of bullet glyphs to be used.",
         default=None,
     )
@@ -140,17 +143,15 @@ class DeleteContentRangeRequest(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#deletecontentrangerequest
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     range: Optional[Range] = Field(
+        alias="range",
         description=(
-            "The range of content to delete. Deleting text that crosses a paragraph boundary may result in change",
-            "s to paragraph styles, lists, positioned objects and bookmarks as the two paragraphs are merged. Att",
-            "empting to delete certain ranges can result in an invalid document structure in which case a 400 bad",
-            " request error is returned. Some examples of invalid delete requests include:",
+            "The range of content to delete. Deleting text that crosses a paragraph boundary may result in change"
+            "s to paragraph styles, lists, positioned objects and bookmarks as the two paragraphs are merged. Att"
+            "empting to delete certain ranges can result in an invalid document structure in which case a 400 bad"
+            " request error is returned. Some examples of invalid delete requests include:"
         ),
         default=None,
     )
@@ -162,26 +163,25 @@ class DeleteFooterRequest(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#deletefooterrequest
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     footer_id: Optional[str] = Field(
+        alias="footerId",
         description=(
-            "The id of the footer to delete. If this footer is defined on DocumentStyle, the reference to this fo",
-            "oter is removed, resulting in no footer of that type for the first section of the document. If this ",
-            "footer is defined on a SectionStyle, the reference to this footer is removed and the footer of that ",
-            "type is now continued from the previous section.",
+            "The id of the footer to delete. If this footer is defined on DocumentStyle, the reference to this fo"
+            "oter is removed, resulting in no footer of that type for the first section of the document. If this "
+            "footer is defined on a SectionStyle, the reference to this footer is removed and the footer of that "
+            "type is now continued from the previous section."
         ),
         default=None,
     )
     tab_id: Optional[str] = Field(
+        alias="tabId",
         description=(
-            "The tab that contains the footer to delete. When omitted, the request is applied to the first tab. I",
-            "n a document containing a single tab: If provided, must match the singular tab's ID. If omitted, the",
-            " request applies to the singular tab. In a document containing multiple tabs: If provided, the reque",
-            "st applies to the specified tab. If omitted, the request applies to the first tab in the document.",
+            "The tab that contains the footer to delete. When omitted, the request is applied to the first tab. I"
+            "n a document containing a single tab: If provided, must match the singular tab's ID. If omitted, the"
+            " request applies to the singular tab. In a document containing multiple tabs: If provided, the reque"
+            "st applies to the specified tab. If omitted, the request applies to the first tab in the document."
         ),
         default=None,
     )
@@ -193,26 +193,25 @@ class DeleteHeaderRequest(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#deleteheaderrequest
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     header_id: Optional[str] = Field(
+        alias="headerId",
         description=(
-            "The id of the header to delete. If this header is defined on DocumentStyle, the reference to this he",
-            "ader is removed, resulting in no header of that type for the first section of the document. If this ",
-            "header is defined on a SectionStyle, the reference to this header is removed and the header of that ",
-            "type is now continued from the previous section.",
+            "The id of the header to delete. If this header is defined on DocumentStyle, the reference to this he"
+            "ader is removed, resulting in no header of that type for the first section of the document. If this "
+            "header is defined on a SectionStyle, the reference to this header is removed and the header of that "
+            "type is now continued from the previous section."
         ),
         default=None,
     )
     tab_id: Optional[str] = Field(
+        alias="tabId",
         description=(
-            "The tab containing the header to delete. When omitted, the request is applied to the first tab. In a",
-            " document containing a single tab: If provided, must match the singular tab's ID. If omitted, the re",
-            "quest applies to the singular tab. In a document containing multiple tabs: If provided, the request ",
-            "applies to the specified tab. If omitted, the request applies to the first tab in the document.",
+            "The tab containing the header to delete. When omitted, the request is applied to the first tab. In a"
+            " document containing a single tab: If provided, must match the singular tab's ID. If omitted, the re"
+            "quest applies to the singular tab. In a document containing multiple tabs: If provided, the request "
+            "applies to the specified tab. If omitted, the request applies to the first tab in the document."
         ),
         default=None,
     )
@@ -224,12 +223,10 @@ class DeleteParagraphBulletsRequest(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#deleteparagraphbulletsrequest
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     range: Optional[Range] = Field(
+        alias="range",
         description="The range to delete bullets from.",
         default=None,
     )
@@ -241,22 +238,21 @@ class DeletePositionedObjectRequest(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#deletepositionedobjectrequest
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     object_id: Optional[str] = Field(
+        alias="objectId",
         description="The ID of the positioned object to delete.",
         default=None,
     )
     tab_id: Optional[str] = Field(
+        alias="tabId",
         description=(
-            "The tab that the positioned object to delete is in. When omitted, the request is applied to the firs",
-            "t tab. In a document containing a single tab: If provided, must match the singular tab's ID. If omit",
-            "ted, the request applies to the singular tab. In a document containing multiple tabs: If provided, t",
-            "he request applies to the specified tab. If omitted, the request applies to the first tab in the doc",
-            "ument.",
+            "The tab that the positioned object to delete is in. When omitted, the request is applied to the firs"
+            "t tab. In a document containing a single tab: If provided, must match the singular tab's ID. If omit"
+            "ted, the request applies to the singular tab. In a document containing multiple tabs: If provided, t"
+            "he request applies to the specified tab. If omitted, the request applies to the first tab in the doc"
+            "ument."
         ),
         default=None,
     )
@@ -268,24 +264,23 @@ class EndOfSegmentLocation(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#endofsegmentlocation
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     segment_id: Optional[str] = Field(
+        alias="segmentId",
         description=(
-            "The ID of the header, footer or footnote the location is in. An empty segment ID signifies the docum",
-            "ent's body.",
+            "The ID of the header, footer or footnote the location is in. An empty segment ID signifies the docum"
+            "ent's body."
         ),
         default=None,
     )
     tab_id: Optional[str] = Field(
+        alias="tabId",
         description=(
-            "The tab that the location is in. When omitted, the request is applied to the first tab. In a documen",
-            "t containing a single tab: If provided, must match the singular tab's ID. If omitted, the request ap",
-            "plies to the singular tab. In a document containing multiple tabs: If provided, the request applies ",
-            "to the specified tab. If omitted, the request applies to the first tab in the document.",
+            "The tab that the location is in. When omitted, the request is applied to the first tab. In a documen"
+            "t containing a single tab: If provided, must match the singular tab's ID. If omitted, the request ap"
+            "plies to the singular tab. In a document containing multiple tabs: If provided, the request applies "
+            "to the specified tab. If omitted, the request applies to the first tab in the document."
         ),
         default=None,
     )
@@ -311,31 +306,31 @@ class Location(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#location
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     segment_id: Optional[str] = Field(
+        alias="segmentId",
         description=(
-            "The ID of the header, footer or footnote the location is in. An empty segment ID signifies the docum",
-            "ent's body.",
+            "The ID of the header, footer or footnote the location is in. An empty segment ID signifies the docum"
+            "ent's body."
         ),
         default=None,
     )
     index: Optional[int] = Field(
+        alias="index",
         description=(
-            "The zero-based index, in UTF-16 code units. The index is relative to the beginning of the segment sp",
-            "ecified by segmentId.",
+            "The zero-based index, in UTF-16 code units. The index is relative to the beginning of the segment sp"
+            "ecified by segmentId."
         ),
         default=None,
     )
     tab_id: Optional[str] = Field(
+        alias="tabId",
         description=(
-            "The tab that the location is in. When omitted, the request is applied to the first tab. In a documen",
-            "t containing a single tab: If provided, must match the singular tab's ID. If omitted, the request ap",
-            "plies to the singular tab. In a document containing multiple tabs: If provided, the request applies ",
-            "to the specified tab. If omitted, the request applies to the first tab in the document.",
+            "The tab that the location is in. When omitted, the request is applied to the first tab. In a documen"
+            "t containing a single tab: If provided, must match the singular tab's ID. If omitted, the request ap"
+            "plies to the singular tab. In a document containing multiple tabs: If provided, the request applies "
+            "to the specified tab. If omitted, the request applies to the first tab in the document."
         ),
         default=None,
     )
@@ -347,16 +342,15 @@ class PinTableHeaderRowsRequest(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#pintableheaderrowsrequest
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     table_start_location: Optional[Location] = Field(
+        alias="tableStartLocation",
         description="The location where the table starts in the document.",
         default=None,
     )
     pinned_header_rows_count: Optional[int] = Field(
+        alias="pinnedHeaderRowsCount",
         description="The number of table rows to pin, where 0 implies that all rows are unpinned.",
         default=None,
     )
@@ -368,37 +362,38 @@ class ReplaceImageRequest(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#replaceimagerequest
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     image_object_id: Optional[str] = Field(
+        alias="imageObjectId",
         description=(
-            "The ID of the existing image that will be replaced. The ID can be retrieved from the response of a g",
-            "et request.",
+            "The ID of the existing image that will be replaced. The ID can be retrieved from the response of a g"
+            "et request."
         ),
         default=None,
     )
     uri: Optional[str] = Field(
+        alias="uri",
         description=(
-            "The URI of the new image. The image is fetched once at insertion time and a copy is stored for displ",
-            "ay inside the document. Images must be less than 50MB, cannot exceed 25 megapixels, and must be in P",
-            "NG, JPEG, or GIF format. The provided URI can't surpass 2 KB in length. The URI is saved with the im",
-            "age, and exposed through the ImageProperties.source_uri field.",
+            "The URI of the new image. The image is fetched once at insertion time and a copy is stored for displ"
+            "ay inside the document. Images must be less than 50MB, cannot exceed 25 megapixels, and must be in P"
+            "NG, JPEG, or GIF format. The provided URI can't surpass 2 KB in length. The URI is saved with the im"
+            "age, and exposed through the ImageProperties.source_uri field."
         ),
         default=None,
     )
-    image_replace_method: ImageReplaceMethod = Field(
+    image_replace_method: Optional[ImageReplaceMethod] = Field(
+        alias="imageReplaceMethod",
         description="The replacement method.",
         default=None,
     )
     tab_id: Optional[str] = Field(
+        alias="tabId",
         description=(
-            "The tab that the image to be replaced is in. When omitted, the request is applied to the first tab. ",
-            "In a document containing a single tab: If provided, must match the singular tab's ID. If omitted, th",
-            "e request applies to the singular tab. In a document containing multiple tabs: If provided, the requ",
-            "est applies to the specified tab. If omitted, the request applies to the first tab in the document.",
+            "The tab that the image to be replaced is in. When omitted, the request is applied to the first tab. "
+            "In a document containing a single tab: If provided, must match the singular tab's ID. If omitted, th"
+            "e request applies to the singular tab. In a document containing multiple tabs: If provided, the requ"
+            "est applies to the specified tab. If omitted, the request applies to the first tab in the document."
         ),
         default=None,
     )
@@ -410,23 +405,23 @@ class SubstringMatchCriteria(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#substringmatchcriteria
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     text: Optional[str] = Field(
+        alias="text",
         description="The text to search for in the document.",
         default=None,
     )
     match_case: Optional[bool] = Field(
+        alias="matchCase",
         description="Indicates whether the search should respect case:",
         default=None,
     )
-    search_by_regex: Optional[list[bool]] = Field(
+    search_by_regex: Optional[bool] = Field(
+        alias="searchByRegex",
         description=(
-            "Optional. True if the find value should be treated as a regular expression. Any backslashes in the p",
-            "attern should be escaped.",
+            "Optional. True if the find value should be treated as a regular expression. Any backslashes in the p"
+            "attern should be escaped."
         ),
         default=None,
     )
@@ -438,20 +433,20 @@ class TableCellLocation(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#tablecelllocation
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     table_start_location: Optional[Location] = Field(
+        alias="tableStartLocation",
         description="The location where the table starts in the document.",
         default=None,
     )
     row_index: Optional[int] = Field(
+        alias="rowIndex",
         description="The zero-based row index. For example, the second row in the table has a row index of 1.",
         default=None,
     )
     column_index: Optional[int] = Field(
+        alias="columnIndex",
         description="The zero-based column index. For example, the second column in the table has a column index of 1.",
         default=None,
     )
@@ -463,20 +458,20 @@ class TableRange(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#tablerange
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     table_cell_location: Optional[TableCellLocation] = Field(
+        alias="tableCellLocation",
         description="The cell location where the table range starts.",
         default=None,
     )
     row_span: Optional[int] = Field(
+        alias="rowSpan",
         description="The row span of the table range.",
         default=None,
     )
     column_span: Optional[int] = Field(
+        alias="columnSpan",
         description="The column span of the table range.",
         default=None,
     )
@@ -488,12 +483,10 @@ class TabsCriteria(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#tabscriteria
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
-    tab_ids: Optional[str] = Field(
+    tab_ids: Optional[list[str]] = Field(
+        alias="tabIds",
         description="The list of tab IDs in which the request executes.",
         default=None,
     )
@@ -505,18 +498,16 @@ class UnmergeTableCellsRequest(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#unmergetablecellsrequest
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     table_range: Optional[TableRange] = Field(
+        alias="tableRange",
         description=(
-            "The table range specifying which cells of the table to unmerge. All merged cells in this range will ",
-            "be unmerged, and cells that are already unmerged will not be affected. If the range has no merged ce",
-            "lls, the request will do nothing. If there is text in any of the merged cells, the text will remain ",
-            'in the "head" cell of the resulting block of unmerged cells. The "head" cell is the upper-left c',
-            "ell when the content direction is from left to right, and the upper-right otherwise.",
+            "The table range specifying which cells of the table to unmerge. All merged cells in this range will "
+            "be unmerged, and cells that are already unmerged will not be affected. If the range has no merged ce"
+            "lls, the request will do nothing. If there is text in any of the merged cells, the text will remain "
+            'in the "head" cell of the resulting block of unmerged cells. The "head" cell is the upper-left c'
+            "ell when the content direction is from left to right, and the upper-right otherwise."
         ),
         default=None,
     )
@@ -528,33 +519,33 @@ class UpdateDocumentStyleRequest(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#updatedocumentstylerequest
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     document_style: Optional[DocumentStyle] = Field(
+        alias="documentStyle",
         description=(
-            "The styles to set on the document. Certain document style changes may cause other changes in order t",
-            "o mirror the behavior of the Docs editor. See the documentation of DocumentStyle for more informatio",
-            "n.",
+            "The styles to set on the document. Certain document style changes may cause other changes in order t"
+            "o mirror the behavior of the Docs editor. See the documentation of DocumentStyle for more informatio"
+            "n."
         ),
         default=None,
     )
     fields: Optional[str] = Field(
+        alias="fields",
         description=(
-            "The fields that should be updated. At least one field must be specified. The root documentStyle is i",
-            'mplied and should not be specified. A single "*" can be used as short-hand for listing every field',
-            '. For example to update the background, set fields to "background".',
+            "The fields that should be updated. At least one field must be specified. The root documentStyle is i"
+            'mplied and should not be specified. A single "*" can be used as short-hand for listing every field'
+            '. For example to update the background, set fields to "background".'
         ),
         default=None,
     )
     tab_id: Optional[str] = Field(
+        alias="tabId",
         description=(
-            "The tab that contains the style to update. When omitted, the request applies to the first tab. In a ",
-            "document containing a single tab: If provided, must match the singular tab's ID. If omitted, the req",
-            "uest applies to the singular tab. In a document containing multiple tabs: If provided, the request a",
-            "pplies to the specified tab. If not provided, the request applies to the first tab in the document.",
+            "The tab that contains the style to update. When omitted, the request applies to the first tab. In a "
+            "document containing a single tab: If provided, must match the singular tab's ID. If omitted, the req"
+            "uest applies to the singular tab. In a document containing multiple tabs: If provided, the request a"
+            "pplies to the specified tab. If not provided, the request applies to the first tab in the document."
         ),
         default=None,
     )
@@ -566,30 +557,30 @@ class UpdateParagraphStyleRequest(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#updateparagraphstylerequest
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     paragraph_style: Optional[ParagraphStyle] = Field(
+        alias="paragraphStyle",
         description=(
-            "The styles to set on the paragraphs. Certain paragraph style changes may cause other changes in orde",
-            "r to mirror the behavior of the Docs editor. See the documentation of ParagraphStyle for more inform",
-            "ation.",
+            "The styles to set on the paragraphs. Certain paragraph style changes may cause other changes in orde"
+            "r to mirror the behavior of the Docs editor. See the documentation of ParagraphStyle for more inform"
+            "ation."
         ),
         default=None,
     )
     fields: Optional[str] = Field(
+        alias="fields",
         description=(
-            "The fields that should be updated. At least one field must be specified. The root paragraphStyle is ",
-            'implied and should not be specified. A single "*" can be used as short-hand for listing every fiel',
-            'd. For example, to update the paragraph style\'s alignment property, set fields to "alignment". To ',
-            "reset a property to its default value, include its field name in the field mask but leave the field ",
-            "itself unset.",
+            "The fields that should be updated. At least one field must be specified. The root paragraphStyle is "
+            'implied and should not be specified. A single "*" can be used as short-hand for listing every fiel'
+            'd. For example, to update the paragraph style\'s alignment property, set fields to "alignment". To '
+            "reset a property to its default value, include its field name in the field mask but leave the field "
+            "itself unset."
         ),
         default=None,
     )
     range: Optional[Range] = Field(
+        alias="range",
         description="The range overlapping the paragraphs to style.",
         default=None,
     )
@@ -601,31 +592,31 @@ class UpdateSectionStyleRequest(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#updatesectionstylerequest
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     range: Optional[Range] = Field(
+        alias="range",
         description=(
-            "The range overlapping the sections to style. Because section breaks can only be inserted inside the ",
-            "body, the segment ID field must be empty.",
+            "The range overlapping the sections to style. Because section breaks can only be inserted inside the "
+            "body, the segment ID field must be empty."
         ),
         default=None,
     )
     section_style: Optional[SectionStyle] = Field(
+        alias="sectionStyle",
         description=(
-            "The styles to be set on the section. Certain section style changes may cause other changes in order ",
-            "to mirror the behavior of the Docs editor. See the documentation of SectionStyle for more informatio",
-            "n.",
+            "The styles to be set on the section. Certain section style changes may cause other changes in order "
+            "to mirror the behavior of the Docs editor. See the documentation of SectionStyle for more informatio"
+            "n."
         ),
         default=None,
     )
     fields: Optional[str] = Field(
+        alias="fields",
         description=(
-            "The fields that should be updated. At least one field must be specified. The root sectionStyle is im",
-            'plied and must not be specified. A single "*" can be used as short-hand for listing every field. F',
-            'or example to update the left margin, set fields to "marginLeft".',
+            "The fields that should be updated. At least one field must be specified. The root sectionStyle is im"
+            'plied and must not be specified. A single "*" can be used as short-hand for listing every field. F'
+            'or example to update the left margin, set fields to "marginLeft".'
         ),
         default=None,
     )
@@ -637,38 +628,39 @@ class UpdateTableCellStyleRequest(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#updatetablecellstylerequest
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     table_cell_style: Optional[TableCellStyle] = Field(
+        alias="tableCellStyle",
         description=(
-            "The style to set on the table cells. When updating borders, if a cell shares a border with an adjace",
-            "nt cell, the corresponding border property of the adjacent cell is updated as well. Borders that are",
-            " merged and invisible are not updated. Since updating a border shared by adjacent cells in the same ",
-            "request can cause conflicting border updates, border updates are applied in the following order:",
+            "The style to set on the table cells. When updating borders, if a cell shares a border with an adjace"
+            "nt cell, the corresponding border property of the adjacent cell is updated as well. Borders that are"
+            " merged and invisible are not updated. Since updating a border shared by adjacent cells in the same "
+            "request can cause conflicting border updates, border updates are applied in the following order:"
         ),
         default=None,
     )
     fields: Optional[str] = Field(
+        alias="fields",
         description=(
-            "The fields that should be updated. At least one field must be specified. The root tableCellStyle is ",
-            'implied and should not be specified. A single "*" can be used as short-hand for listing every fiel',
-            'd. For example to update the table cell background color, set fields to "backgroundColor". To rese',
-            "t a property to its default value, include its field name in the field mask but leave the field itse",
-            "lf unset.",
+            "The fields that should be updated. At least one field must be specified. The root tableCellStyle is "
+            'implied and should not be specified. A single "*" can be used as short-hand for listing every fiel'
+            'd. For example to update the table cell background color, set fields to "backgroundColor". To rese'
+            "t a property to its default value, include its field name in the field mask but leave the field itse"
+            "lf unset."
         ),
         default=None,
     )
     table_range: Optional[TableRange] = Field(
+        alias="tableRange",
         description="The table range representing the subset of the table to which the updates are applied.",
         default=None,
     )
     table_start_location: Optional[Location] = Field(
+        alias="tableStartLocation",
         description=(
-            "The location where the table starts in the document. When specified, the updates are applied to all ",
-            "the cells in the table.",
+            "The location where the table starts in the document. When specified, the updates are applied to all "
+            "the cells in the table."
         ),
         default=None,
     )
@@ -680,34 +672,35 @@ class UpdateTableColumnPropertiesRequest(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#updatetablecolumnpropertiesrequest
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
-    table_start_location: Optional[list[Location]] = Field(
+    table_start_location: Optional[Location] = Field(
+        alias="tableStartLocation",
         description="The location where the table starts in the document.",
         default=None,
     )
-    column_indices: Optional[int] = Field(
+    column_indices: Optional[list[int]] = Field(
+        alias="columnIndices",
         description=(
-            "The list of zero-based column indices whose property should be updated. If no indices are specified,",
-            " all columns will be updated.",
+            "The list of zero-based column indices whose property should be updated. If no indices are specified,"
+            " all columns will be updated."
         ),
         default=None,
     )
     table_column_properties: Optional[TableColumnProperties] = Field(
+        alias="tableColumnProperties",
         description=(
-            "The table column properties to update. If the value of tableColumnProperties#width is less than 5 po",
-            "ints (5/72 inch), a 400 bad request error is returned.",
+            "The table column properties to update. If the value of tableColumnProperties#width is less than 5 po"
+            "ints (5/72 inch), a 400 bad request error is returned."
         ),
         default=None,
     )
     fields: Optional[str] = Field(
+        alias="fields",
         description=(
-            "The fields that should be updated. At least one field must be specified. The root tableColumnPropert",
-            'ies is implied and should not be specified. A single "*" can be used as short-hand for listing eve',
-            'ry field. For example to update the column width, set fields to "width".',
+            "The fields that should be updated. At least one field must be specified. The root tableColumnPropert"
+            'ies is implied and should not be specified. A single "*" can be used as short-hand for listing eve'
+            'ry field. For example to update the column width, set fields to "width".'
         ),
         default=None,
     )
@@ -719,31 +712,32 @@ class UpdateTableRowStyleRequest(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#updatetablerowstylerequest
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
-    table_start_location: Optional[list[Location]] = Field(
+    table_start_location: Optional[Location] = Field(
+        alias="tableStartLocation",
         description="The location where the table starts in the document.",
         default=None,
     )
-    row_indices: Optional[int] = Field(
+    row_indices: Optional[list[int]] = Field(
+        alias="rowIndices",
         description=(
-            "The list of zero-based row indices whose style should be updated. If no indices are specified, all r",
-            "ows will be updated.",
+            "The list of zero-based row indices whose style should be updated. If no indices are specified, all r"
+            "ows will be updated."
         ),
         default=None,
     )
     table_row_style: Optional[TableRowStyle] = Field(
+        alias="tableRowStyle",
         description="The styles to be set on the rows.",
         default=None,
     )
     fields: Optional[str] = Field(
+        alias="fields",
         description=(
-            "The fields that should be updated. At least one field must be specified. The root tableRowStyle is i",
-            'mplied and should not be specified. A single "*" can be used as short-hand for listing every field',
-            '. For example to update the minimum row height, set fields to "minRowHeight".',
+            "The fields that should be updated. At least one field must be specified. The root tableRowStyle is i"
+            'mplied and should not be specified. A single "*" can be used as short-hand for listing every field'
+            '. For example to update the minimum row height, set fields to "minRowHeight".'
         ),
         default=None,
     )
@@ -755,33 +749,33 @@ class UpdateTextStyleRequest(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#updatetextstylerequest
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     text_style: Optional[TextStyle] = Field(
+        alias="textStyle",
         description=(
-            "The styles to set on the text. If the value for a particular style matches that of the parent, that ",
-            "style will be set to inherit. Certain text style changes may cause other changes in order to to mirr",
-            "or the behavior of the Docs editor. See the documentation of TextStyle for more information.",
+            "The styles to set on the text. If the value for a particular style matches that of the parent, that "
+            "style will be set to inherit. Certain text style changes may cause other changes in order to to mirr"
+            "or the behavior of the Docs editor. See the documentation of TextStyle for more information."
         ),
         default=None,
     )
     fields: Optional[str] = Field(
+        alias="fields",
         description=(
-            "The fields that should be updated. At least one field must be specified. The root textStyle is impli",
-            'ed and should not be specified. A single "*" can be used as short-hand for listing every field. Fo',
-            'r example, to update the text style to bold, set fields to "bold". To reset a property to its defa',
-            "ult value, include its field name in the field mask but leave the field itself unset.",
+            "The fields that should be updated. At least one field must be specified. The root textStyle is impli"
+            'ed and should not be specified. A single "*" can be used as short-hand for listing every field. Fo'
+            'r example, to update the text style to bold, set fields to "bold". To reset a property to its defa'
+            "ult value, include its field name in the field mask but leave the field itself unset."
         ),
         default=None,
     )
     range: Optional[Range] = Field(
+        alias="range",
         description=(
-            "The range of text to style. The range may be extended to include adjacent newlines. If the range ful",
-            "ly contains a paragraph belonging to a list, the paragraph's bullet is also updated with the matchin",
-            "g text style. Ranges cannot be inserted inside a relative UpdateTextStyleRequest.",
+            "The range of text to style. The range may be extended to include adjacent newlines. If the range ful"
+            "ly contains a paragraph belonging to a list, the paragraph's bullet is also updated with the matchin"
+            "g text style. Ranges cannot be inserted inside a relative UpdateTextStyleRequest."
         ),
         default=None,
     )
@@ -793,20 +787,19 @@ class CreateFooterRequest(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#createfooterrequest
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
-    type: HeaderFooterType = Field(
+    type: Optional[HeaderFooterType] = Field(
+        alias="type",
         description="The type of footer to create.",
         default=None,
     )
     section_break_location: Optional[Location] = Field(
+        alias="sectionBreakLocation",
         description=(
-            "The location of the SectionBreak immediately preceding the section whose SectionStyle this footer sh",
-            "ould belong to. If this is unset or refers to the first section break in the document, the footer ap",
-            "plies to the document style.",
+            "The location of the SectionBreak immediately preceding the section whose SectionStyle this footer sh"
+            "ould belong to. If this is unset or refers to the first section break in the document, the footer ap"
+            "plies to the document style."
         ),
         default=None,
     )
@@ -818,26 +811,25 @@ class CreateFootnoteRequest(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#createfootnoterequest
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     location: Optional[Location] = Field(
+        alias="location",
         description=(
-            "Inserts the footnote reference at a specific index in the document. The footnote reference must be i",
-            "nserted inside the bounds of an existing Paragraph. For instance, it cannot be inserted at a table's",
-            " start index (i.e. between the table and its preceding paragraph). Footnote references cannot be ins",
-            "erted inside an equation, header, footer or footnote. Since footnote references can only be inserted",
-            " in the body, the segment ID field must be empty.",
+            "Inserts the footnote reference at a specific index in the document. The footnote reference must be i"
+            "nserted inside the bounds of an existing Paragraph. For instance, it cannot be inserted at a table's"
+            " start index (i.e. between the table and its preceding paragraph). Footnote references cannot be ins"
+            "erted inside an equation, header, footer or footnote. Since footnote references can only be inserted"
+            " in the body, the segment ID field must be empty."
         ),
         default=None,
     )
     end_of_segment_location: Optional[EndOfSegmentLocation] = Field(
+        alias="endOfSegmentLocation",
         description=(
-            "Inserts the footnote reference at the end of the document body. Footnote references cannot be insert",
-            "ed inside a header, footer or footnote. Since footnote references can only be inserted in the body, ",
-            "the segment ID field must be empty.",
+            "Inserts the footnote reference at the end of the document body. Footnote references cannot be insert"
+            "ed inside a header, footer or footnote. Since footnote references can only be inserted in the body, "
+            "the segment ID field must be empty."
         ),
         default=None,
     )
@@ -849,20 +841,19 @@ class CreateHeaderRequest(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#createheaderrequest
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
-    type: HeaderFooterType = Field(
+    type: Optional[HeaderFooterType] = Field(
+        alias="type",
         description="The type of header to create.",
         default=None,
     )
     section_break_location: Optional[Location] = Field(
+        alias="sectionBreakLocation",
         description=(
-            "The location of the SectionBreak which begins the section this header should belong to. If `sectionB",
-            "reakLocation' is unset or if it refers to the first section break in the document body, the header a",
-            "pplies to the DocumentStyle",
+            "The location of the SectionBreak which begins the section this header should belong to. If `sectionB"
+            "reakLocation' is unset or if it refers to the first section break in the document body, the header a"
+            "pplies to the DocumentStyle"
         ),
         default=None,
     )
@@ -874,26 +865,26 @@ class DeleteNamedRangeRequest(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#deletenamedrangerequest
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     tabs_criteria: Optional[TabsCriteria] = Field(
+        alias="tabsCriteria",
         description=(
-            "Optional. The criteria used to specify which tab(s) the range deletion should occur in. When omitted",
-            ", the range deletion is applied to all tabs. In a document containing a single tab: If provided, mus",
-            "t match the singular tab's ID. If omitted, the range deletion applies to the singular tab. In a docu",
-            "ment containing multiple tabs: If provided, the range deletion applies to the specified tabs. If not",
-            " provided, the range deletion applies to all tabs.",
+            "Optional. The criteria used to specify which tab(s) the range deletion should occur in. When omitted"
+            ", the range deletion is applied to all tabs. In a document containing a single tab: If provided, mus"
+            "t match the singular tab's ID. If omitted, the range deletion applies to the singular tab. In a docu"
+            "ment containing multiple tabs: If provided, the range deletion applies to the specified tabs. If not"
+            " provided, the range deletion applies to all tabs."
         ),
         default=None,
     )
     named_range_id: Optional[str] = Field(
+        alias="namedRangeId",
         description="The ID of the named range to delete.",
         default=None,
     )
     name: Optional[str] = Field(
+        alias="name",
         description="The name of the range(s) to delete. All named ranges with the given name will be deleted.",
         default=None,
     )
@@ -905,17 +896,15 @@ class DeleteTableColumnRequest(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#deletetablecolumnrequest
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     table_cell_location: Optional[TableCellLocation] = Field(
+        alias="tableCellLocation",
         description=(
-            "The reference table cell location from which the column will be deleted. The column this cell spans ",
-            "will be deleted. If this is a merged cell that spans multiple columns, all columns that the cell spa",
-            "ns will be deleted. If no columns remain in the table after this deletion, the whole table is delete",
-            "d.",
+            "The reference table cell location from which the column will be deleted. The column this cell spans "
+            "will be deleted. If this is a merged cell that spans multiple columns, all columns that the cell spa"
+            "ns will be deleted. If no columns remain in the table after this deletion, the whole table is delete"
+            "d."
         ),
         default=None,
     )
@@ -927,16 +916,14 @@ class DeleteTableRowRequest(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#deletetablerowrequest
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     table_cell_location: Optional[TableCellLocation] = Field(
+        alias="tableCellLocation",
         description=(
-            "The reference table cell location from which the row will be deleted. The row this cell spans will b",
-            "e deleted. If this is a merged cell that spans multiple rows, all rows that the cell spans will be d",
-            "eleted. If no rows remain in the table after this deletion, the whole table is deleted.",
+            "The reference table cell location from which the row will be deleted. The row this cell spans will b"
+            "e deleted. If this is a merged cell that spans multiple rows, all rows that the cell spans will be d"
+            "eleted. If no rows remain in the table after this deletion, the whole table is deleted."
         ),
         default=None,
     )
@@ -948,44 +935,45 @@ class InsertInlineImageRequest(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#insertinlineimagerequest
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     uri: Optional[str] = Field(
+        alias="uri",
         description=(
-            "The image URI. The image is fetched once at insertion time and a copy is stored for display inside t",
-            "he document. Images must be less than 50MB in size, cannot exceed 25 megapixels, and must be in one ",
-            "of PNG, JPEG, or GIF format. The provided URI must be publicly accessible and at most 2 kB in length",
-            ". The URI itself is saved with the image, and exposed via the ImageProperties.content_uri field.",
+            "The image URI. The image is fetched once at insertion time and a copy is stored for display inside t"
+            "he document. Images must be less than 50MB in size, cannot exceed 25 megapixels, and must be in one "
+            "of PNG, JPEG, or GIF format. The provided URI must be publicly accessible and at most 2 kB in length"
+            ". The URI itself is saved with the image, and exposed via the ImageProperties.content_uri field."
         ),
         default=None,
     )
     object_size: Optional[Size] = Field(
+        alias="objectSize",
         description=(
-            "The size that the image should appear as in the document. This property is optional and the final si",
-            "ze of the image in the document is determined by the following rules: * If neither width nor height ",
-            "is specified, then a default size of the image is calculated based on its resolution. * If one dimen",
-            "sion is specified then the other dimension is calculated to preserve the aspect ratio of the image. ",
-            "* If both width and height are specified, the image is scaled to fit within the provided dimensions ",
-            "while maintaining its aspect ratio.",
+            "The size that the image should appear as in the document. This property is optional and the final si"
+            "ze of the image in the document is determined by the following rules: * If neither width nor height "
+            "is specified, then a default size of the image is calculated based on its resolution. * If one dimen"
+            "sion is specified then the other dimension is calculated to preserve the aspect ratio of the image. "
+            "* If both width and height are specified, the image is scaled to fit within the provided dimensions "
+            "while maintaining its aspect ratio."
         ),
         default=None,
     )
     location: Optional[Location] = Field(
+        alias="location",
         description=(
-            "Inserts the image at a specific index in the document. The image must be inserted inside the bounds ",
-            "of an existing Paragraph. For instance, it cannot be inserted at a table's start index (i.e. between",
-            " the table and its preceding paragraph). Inline images cannot be inserted inside a footnote or equat",
-            "ion.",
+            "Inserts the image at a specific index in the document. The image must be inserted inside the bounds "
+            "of an existing Paragraph. For instance, it cannot be inserted at a table's start index (i.e. between"
+            " the table and its preceding paragraph). Inline images cannot be inserted inside a footnote or equat"
+            "ion."
         ),
         default=None,
     )
     end_of_segment_location: Optional[EndOfSegmentLocation] = Field(
+        alias="endOfSegmentLocation",
         description=(
-            "Inserts the text at the end of a header, footer or the document body. Inline images cannot be insert",
-            "ed inside a footnote.",
+            "Inserts the text at the end of a header, footer or the document body. Inline images cannot be insert"
+            "ed inside a footnote."
         ),
         default=None,
     )
@@ -997,26 +985,25 @@ class InsertPageBreakRequest(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#insertpagebreakrequest
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     location: Optional[Location] = Field(
+        alias="location",
         description=(
-            "Inserts the page break at a specific index in the document. The page break must be inserted inside t",
-            "he bounds of an existing Paragraph. For instance, it cannot be inserted at a table's start index (i.",
-            "e. between the table and its preceding paragraph). Page breaks cannot be inserted inside a table, eq",
-            "uation, footnote, header or footer. Since page breaks can only be inserted inside the body, the segm",
-            "ent ID field must be empty.",
+            "Inserts the page break at a specific index in the document. The page break must be inserted inside t"
+            "he bounds of an existing Paragraph. For instance, it cannot be inserted at a table's start index (i."
+            "e. between the table and its preceding paragraph). Page breaks cannot be inserted inside a table, eq"
+            "uation, footnote, header or footer. Since page breaks can only be inserted inside the body, the segm"
+            "ent ID field must be empty."
         ),
         default=None,
     )
     end_of_segment_location: Optional[EndOfSegmentLocation] = Field(
+        alias="endOfSegmentLocation",
         description=(
-            "Inserts the page break at the end of the document body. Page breaks cannot be inserted inside a foot",
-            "note, header or footer. Since page breaks can only be inserted inside the body, the segment ID field",
-            " must be empty.",
+            "Inserts the page break at the end of the document body. Page breaks cannot be inserted inside a foot"
+            "note, header or footer. Since page breaks can only be inserted inside the body, the segment ID field"
+            " must be empty."
         ),
         default=None,
     )
@@ -1028,30 +1015,30 @@ class InsertSectionBreakRequest(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#insertsectionbreakrequest
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
-    section_type: SectionType = Field(
+    section_type: Optional[SectionType] = Field(
+        alias="sectionType",
         description="The type of section to insert.",
         default=None,
     )
     location: Optional[Location] = Field(
+        alias="location",
         description=(
-            "Inserts a newline and a section break at a specific index in the document. The section break must be",
-            " inserted inside the bounds of an existing Paragraph. For instance, it cannot be inserted at a table",
-            "'s start index (i.e. between the table and its preceding paragraph). Section breaks cannot be insert",
-            "ed inside a table, equation, footnote, header, or footer. Since section breaks can only be inserted ",
-            "inside the body, the segment ID field must be empty.",
+            "Inserts a newline and a section break at a specific index in the document. The section break must be"
+            " inserted inside the bounds of an existing Paragraph. For instance, it cannot be inserted at a table"
+            "'s start index (i.e. between the table and its preceding paragraph). Section breaks cannot be insert"
+            "ed inside a table, equation, footnote, header, or footer. Since section breaks can only be inserted "
+            "inside the body, the segment ID field must be empty."
         ),
         default=None,
     )
     end_of_segment_location: Optional[EndOfSegmentLocation] = Field(
+        alias="endOfSegmentLocation",
         description=(
-            "Inserts a newline and a section break at the end of the document body. Section breaks cannot be inse",
-            "rted inside a footnote, header or footer. Because section breaks can only be inserted inside the bod",
-            "y, the segment ID field must be empty.",
+            "Inserts a newline and a section break at the end of the document body. Section breaks cannot be inse"
+            "rted inside a footnote, header or footer. Because section breaks can only be inserted inside the bod"
+            "y, the segment ID field must be empty."
         ),
         default=None,
     )
@@ -1063,20 +1050,19 @@ class InsertTableColumnRequest(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#inserttablecolumnrequest
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     table_cell_location: Optional[TableCellLocation] = Field(
+        alias="tableCellLocation",
         description=(
-            "The reference table cell location from which columns will be inserted. A new column will be inserted",
-            " to the left (or right) of the column where the reference cell is. If the reference cell is a merged",
-            " cell, a new column will be inserted to the left (or right) of the merged cell.",
+            "The reference table cell location from which columns will be inserted. A new column will be inserted"
+            " to the left (or right) of the column where the reference cell is. If the reference cell is a merged"
+            " cell, a new column will be inserted to the left (or right) of the merged cell."
         ),
         default=None,
     )
     insert_right: Optional[bool] = Field(
+        alias="insertRight",
         description="Whether to insert new column to the right of the reference cell location.",
         default=None,
     )
@@ -1088,33 +1074,34 @@ class InsertTableRequest(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#inserttablerequest
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     rows: Optional[int] = Field(
+        alias="rows",
         description="The number of rows in the table.",
         default=None,
     )
     columns: Optional[int] = Field(
+        alias="columns",
         description="The number of columns in the table.",
         default=None,
     )
     location: Optional[Location] = Field(
+        alias="location",
         description=(
-            "Inserts the table at a specific model index. A newline character will be inserted before the inserte",
-            "d table, therefore the table start index will be at the specified location index + 1. The table must",
-            " be inserted inside the bounds of an existing Paragraph. For instance, it cannot be inserted at a ta",
-            "ble's start index (i.e. between an existing table and its preceding paragraph). Tables cannot be ins",
-            "erted inside a footnote or equation.",
+            "Inserts the table at a specific model index. A newline character will be inserted before the inserte"
+            "d table, therefore the table start index will be at the specified location index + 1. The table must"
+            " be inserted inside the bounds of an existing Paragraph. For instance, it cannot be inserted at a ta"
+            "ble's start index (i.e. between an existing table and its preceding paragraph). Tables cannot be ins"
+            "erted inside a footnote or equation."
         ),
         default=None,
     )
     end_of_segment_location: Optional[EndOfSegmentLocation] = Field(
+        alias="endOfSegmentLocation",
         description=(
-            "Inserts the table at the end of the given header, footer or document body. A newline character will ",
-            "be inserted before the inserted table. Tables cannot be inserted inside a footnote.",
+            "Inserts the table at the end of the given header, footer or document body. A newline character will "
+            "be inserted before the inserted table. Tables cannot be inserted inside a footnote."
         ),
         default=None,
     )
@@ -1126,20 +1113,19 @@ class InsertTableRowRequest(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#inserttablerowrequest
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     table_cell_location: Optional[TableCellLocation] = Field(
+        alias="tableCellLocation",
         description=(
-            "The reference table cell location from which rows will be inserted. A new row will be inserted above",
-            " (or below) the row where the reference cell is. If the reference cell is a merged cell, a new row w",
-            "ill be inserted above (or below) the merged cell.",
+            "The reference table cell location from which rows will be inserted. A new row will be inserted above"
+            " (or below) the row where the reference cell is. If the reference cell is a merged cell, a new row w"
+            "ill be inserted above (or below) the merged cell."
         ),
         default=None,
     )
     insert_below: Optional[bool] = Field(
+        alias="insertBelow",
         description="Whether to insert new row below the reference cell location.",
         default=None,
     )
@@ -1151,32 +1137,32 @@ class InsertTextRequest(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#inserttextrequest
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     text: Optional[str] = Field(
+        alias="text",
         description=(
-            "The text to be inserted. Inserting a newline character will implicitly create a new Paragraph at tha",
-            "t index. The paragraph style of the new paragraph will be copied from the paragraph at the current i",
-            "nsertion index, including lists and bullets. Text styles for inserted text will be determined automa",
-            "tically, generally preserving the styling of neighboring text. In most cases, the text style for the",
-            " inserted text will match the text immediately before the insertion index. Some control characters (",
-            "U+0000-U+0008, U+000C-U+001F) and characters from the Unicode Basic Multilingual Plane Private Use A",
-            "rea (U+E000-U+F8FF) will be stripped out of the inserted text.",
+            "The text to be inserted. Inserting a newline character will implicitly create a new Paragraph at tha"
+            "t index. The paragraph style of the new paragraph will be copied from the paragraph at the current i"
+            "nsertion index, including lists and bullets. Text styles for inserted text will be determined automa"
+            "tically, generally preserving the styling of neighboring text. In most cases, the text style for the"
+            " inserted text will match the text immediately before the insertion index. Some control characters ("
+            "U+0000-U+0008, U+000C-U+001F) and characters from the Unicode Basic Multilingual Plane Private Use A"
+            "rea (U+E000-U+F8FF) will be stripped out of the inserted text."
         ),
         default=None,
     )
     location: Optional[Location] = Field(
+        alias="location",
         description=(
-            "Inserts the text at a specific index in the document. Text must be inserted inside the bounds of an ",
-            "existing Paragraph. For instance, text cannot be inserted at a table's start index (i.e. between the",
-            " table and its preceding paragraph). The text must be inserted in the preceding paragraph.",
+            "Inserts the text at a specific index in the document. Text must be inserted inside the bounds of an "
+            "existing Paragraph. For instance, text cannot be inserted at a table's start index (i.e. between the"
+            " table and its preceding paragraph). The text must be inserted in the preceding paragraph."
         ),
         default=None,
     )
     end_of_segment_location: Optional[EndOfSegmentLocation] = Field(
+        alias="endOfSegmentLocation",
         description="Inserts the text at the end of a header, footer, footnote or the document body.",
         default=None,
     )
@@ -1188,18 +1174,16 @@ class MergeTableCellsRequest(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#mergetablecellsrequest
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     table_range: Optional[TableRange] = Field(
+        alias="tableRange",
         description=(
-            "The table range specifying which cells of the table to merge. Any text in the cells being merged wil",
-            'l be concatenated and stored in the "head" cell of the range. This is the upper-left cell of the r',
-            "ange when the content direction is left to right, and the upper-right cell of the range otherwise. I",
-            "f the range is non-rectangular (which can occur in some cases where the range covers cells that are ",
-            "already merged or where the table is non-rectangular), a 400 bad request error is returned.",
+            "The table range specifying which cells of the table to merge. Any text in the cells being merged wil"
+            'l be concatenated and stored in the "head" cell of the range. This is the upper-left cell of the r'
+            "ange when the content direction is left to right, and the upper-right cell of the range otherwise. I"
+            "f the range is non-rectangular (which can occur in some cases where the range covers cells that are "
+            "already merged or where the table is non-rectangular), a 400 bad request error is returned."
         ),
         default=None,
     )
@@ -1211,26 +1195,26 @@ class ReplaceAllTextRequest(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#replacealltextrequest
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     replace_text: Optional[str] = Field(
+        alias="replaceText",
         description="The text that will replace the matched text.",
         default=None,
     )
     tabs_criteria: Optional[TabsCriteria] = Field(
+        alias="tabsCriteria",
         description=(
-            "Optional. The criteria used to specify in which tabs the replacement occurs. When omitted, the repla",
-            "cement applies to all tabs. In a document containing a single tab: If provided, must match the singu",
-            "lar tab's ID. If omitted, the replacement applies to the singular tab. In a document containing mult",
-            "iple tabs: If provided, the replacement applies to the specified tabs. If omitted, the replacement a",
-            "pplies to all tabs.",
+            "Optional. The criteria used to specify in which tabs the replacement occurs. When omitted, the repla"
+            "cement applies to all tabs. In a document containing a single tab: If provided, must match the singu"
+            "lar tab's ID. If omitted, the replacement applies to the singular tab. In a document containing mult"
+            "iple tabs: If provided, the replacement applies to the specified tabs. If omitted, the replacement a"
+            "pplies to all tabs."
         ),
         default=None,
     )
     contains_text: Optional[SubstringMatchCriteria] = Field(
+        alias="containsText",
         description="Finds text in the document matching this substring.",
         default=None,
     )
@@ -1242,37 +1226,38 @@ class ReplaceNamedRangeContentRequest(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#replacenamedrangecontentrequest
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     tabs_criteria: Optional[TabsCriteria] = Field(
+        alias="tabsCriteria",
         description=(
-            "Optional. The criteria used to specify in which tabs the replacement occurs. When omitted, the repla",
-            "cement applies to all tabs. In a document containing a single tab: If provided, must match the singu",
-            "lar tab's ID. If omitted, the replacement applies to the singular tab. In a document containing mult",
-            "iple tabs: If provided, the replacement applies to the specified tabs. If omitted, the replacement a",
-            "pplies to all tabs.",
+            "Optional. The criteria used to specify in which tabs the replacement occurs. When omitted, the repla"
+            "cement applies to all tabs. In a document containing a single tab: If provided, must match the singu"
+            "lar tab's ID. If omitted, the replacement applies to the singular tab. In a document containing mult"
+            "iple tabs: If provided, the replacement applies to the specified tabs. If omitted, the replacement a"
+            "pplies to all tabs."
         ),
         default=None,
     )
     text: Optional[str] = Field(
+        alias="text",
         description="Replaces the content of the specified named range(s) with the given text.",
         default=None,
     )
     named_range_id: Optional[str] = Field(
+        alias="namedRangeId",
         description=(
-            "The ID of the named range whose content will be replaced. If there is no named range with the given ",
-            "ID a 400 bad request error is returned.",
+            "The ID of the named range whose content will be replaced. If there is no named range with the given "
+            "ID a 400 bad request error is returned."
         ),
         default=None,
     )
     named_range_name: Optional[str] = Field(
+        alias="namedRangeName",
         description=(
-            "The name of the NamedRanges whose content will be replaced. If there are multiple named ranges with ",
-            "the given name, then the content of each one will be replaced. If there are no named ranges with the",
-            " given name, then the request will be a no-op.",
+            "The name of the NamedRanges whose content will be replaced. If there are multiple named ranges with "
+            "the given name, then the content of each one will be replaced. If there are no named ranges with the"
+            " given name, then the request will be a no-op."
         ),
         default=None,
     )
@@ -1284,142 +1269,172 @@ class Request(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#request
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     replace_all_text: Optional[ReplaceAllTextRequest] = Field(
+        alias="replaceAllText",
         description="Replaces all instances of the specified text.",
         default=None,
     )
     insert_text: Optional[InsertTextRequest] = Field(
+        alias="insertText",
         description="Inserts text at the specified location.",
         default=None,
     )
     update_text_style: Optional[UpdateTextStyleRequest] = Field(
+        alias="updateTextStyle",
         description="Updates the text style at the specified range.",
         default=None,
     )
     create_paragraph_bullets: Optional[CreateParagraphBulletsRequest] = Field(
+        alias="createParagraphBullets",
         description="Creates bullets for paragraphs.",
         default=None,
     )
     delete_paragraph_bullets: Optional[DeleteParagraphBulletsRequest] = Field(
+        alias="deleteParagraphBullets",
         description="Deletes bullets from paragraphs.",
         default=None,
     )
     create_named_range: Optional[CreateNamedRangeRequest] = Field(
+        alias="createNamedRange",
         description="Creates a named range.",
         default=None,
     )
     delete_named_range: Optional[DeleteNamedRangeRequest] = Field(
+        alias="deleteNamedRange",
         description="Deletes a named range.",
         default=None,
     )
     update_paragraph_style: Optional[UpdateParagraphStyleRequest] = Field(
+        alias="updateParagraphStyle",
         description="Updates the paragraph style at the specified range.",
         default=None,
     )
     delete_content_range: Optional[DeleteContentRangeRequest] = Field(
+        alias="deleteContentRange",
         description="Deletes content from the document.",
         default=None,
     )
     insert_inline_image: Optional[InsertInlineImageRequest] = Field(
+        alias="insertInlineImage",
         description="Inserts an inline image at the specified location.",
         default=None,
     )
     insert_table: Optional[InsertTableRequest] = Field(
+        alias="insertTable",
         description="Inserts a table at the specified location.",
         default=None,
     )
     insert_table_row: Optional[InsertTableRowRequest] = Field(
+        alias="insertTableRow",
         description="Inserts an empty row into a table.",
         default=None,
     )
     insert_table_column: Optional[InsertTableColumnRequest] = Field(
+        alias="insertTableColumn",
         description="Inserts an empty column into a table.",
         default=None,
     )
     delete_table_row: Optional[DeleteTableRowRequest] = Field(
+        alias="deleteTableRow",
         description="Deletes a row from a table.",
         default=None,
     )
     delete_table_column: Optional[DeleteTableColumnRequest] = Field(
+        alias="deleteTableColumn",
         description="Deletes a column from a table.",
         default=None,
     )
     insert_page_break: Optional[InsertPageBreakRequest] = Field(
+        alias="insertPageBreak",
         description="Inserts a page break at the specified location.",
         default=None,
     )
     delete_positioned_object: Optional[DeletePositionedObjectRequest] = Field(
+        alias="deletePositionedObject",
         description="Deletes a positioned object from the document.",
         default=None,
     )
     update_table_column_properties: Optional[UpdateTableColumnPropertiesRequest] = (
         Field(
+            alias="updateTableColumnProperties",
             description="Updates the properties of columns in a table.",
             default=None,
         )
     )
     update_table_cell_style: Optional[UpdateTableCellStyleRequest] = Field(
+        alias="updateTableCellStyle",
         description="Updates the style of table cells.",
         default=None,
     )
     update_table_row_style: Optional[UpdateTableRowStyleRequest] = Field(
+        alias="updateTableRowStyle",
         description="Updates the row style in a table.",
         default=None,
     )
     replace_image: Optional[ReplaceImageRequest] = Field(
+        alias="replaceImage",
         description="Replaces an image in the document.",
         default=None,
     )
     update_document_style: Optional[UpdateDocumentStyleRequest] = Field(
+        alias="updateDocumentStyle",
         description="Updates the style of the document.",
         default=None,
     )
     merge_table_cells: Optional[MergeTableCellsRequest] = Field(
+        alias="mergeTableCells",
         description="Merges cells in a table.",
         default=None,
     )
     unmerge_table_cells: Optional[UnmergeTableCellsRequest] = Field(
+        alias="unmergeTableCells",
         description="Unmerges cells in a table.",
         default=None,
     )
     create_header: Optional[CreateHeaderRequest] = Field(
+        alias="createHeader",
         description="Creates a header.",
         default=None,
     )
     create_footer: Optional[CreateFooterRequest] = Field(
+        alias="createFooter",
         description="Creates a footer.",
         default=None,
     )
     create_footnote: Optional[CreateFootnoteRequest] = Field(
+        alias="createFootnote",
         description="Creates a footnote.",
         default=None,
     )
     replace_named_range_content: Optional[ReplaceNamedRangeContentRequest] = Field(
+        alias="replaceNamedRangeContent",
         description="Replaces the content in a named range.",
         default=None,
     )
     update_section_style: Optional[UpdateSectionStyleRequest] = Field(
+        alias="updateSectionStyle",
         description="Updates the section style of the specified range.",
         default=None,
     )
     insert_section_break: Optional[InsertSectionBreakRequest] = Field(
+        alias="insertSectionBreak",
         description="Inserts a section break at the specified location.",
         default=None,
     )
     delete_header: Optional[DeleteHeaderRequest] = Field(
+        alias="deleteHeader",
         description="Deletes a header from the document.",
         default=None,
     )
     delete_footer: Optional[DeleteFooterRequest] = Field(
+        alias="deleteFooter",
         description="Deletes a footer from the document.",
         default=None,
     )
     pin_table_header_rows: Optional[PinTableHeaderRowsRequest] = Field(
+        alias="pinTableHeaderRows",
         description="Updates the number of pinned header rows in a table.",
         default=None,
     )
@@ -3,7 +3,12 @@ from __future__ import annotations
 from enum import Enum
 from typing import Any, Optional, Union
 
-from pydantic import BaseModel, ConfigDict, Field, alias_generators
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+_CAMEL_CONFIG = ConfigDict(
+    populate_by_name=True,
+    defer_build=True,
+)
 
 
 class GlyphType(str, Enum):
@@ -162,12 +167,10 @@ class BackgroundSuggestionState(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#backgroundsuggestionstate
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     background_color_suggested: Optional[bool] = Field(
+        alias="backgroundColorSuggested",
         description="Indicates whether the current background color has been modified in this suggestion.",
         default=None,
     )
@@ -199,16 +202,15 @@ class BookmarkLink(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#bookmarklink
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     id: Optional[str] = Field(
+        alias="id",
         description="The ID of a bookmark in this document.",
         default=None,
     )
     tab_id: Optional[str] = Field(
+        alias="tabId",
         description="The ID of the tab containing this bookmark.",
         default=None,
     )
@@ -303,43 +305,45 @@ class CropProperties(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#cropproperties
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     offset_left: Optional[float] = Field(
+        alias="offsetLeft",
         description=(
-            "The offset specifies how far inwards the left edge of the crop rectangle is from the left edge of th",
-            "e original content as a fraction of the original content's width.",
+            "The offset specifies how far inwards the left edge of the crop rectangle is from the left edge of th"
+            "e original content as a fraction of the original content's width."
         ),
         default=None,
     )
     offset_right: Optional[float] = Field(
+        alias="offsetRight",
         description=(
-            "The offset specifies how far inwards the right edge of the crop rectangle is from the right edge of ",
-            "the original content as a fraction of the original content's width.",
+            "The offset specifies how far inwards the right edge of the crop rectangle is from the right edge of "
+            "the original content as a fraction of the original content's width."
         ),
         default=None,
     )
     offset_top: Optional[float] = Field(
+        alias="offsetTop",
         description=(
-            "The offset specifies how far inwards the top edge of the crop rectangle is from the top edge of the ",
-            "original content as a fraction of the original content's height.",
+            "The offset specifies how far inwards the top edge of the crop rectangle is from the top edge of the "
+            "original content as a fraction of the original content's height."
         ),
         default=None,
     )
     offset_bottom: Optional[float] = Field(
+        alias="offsetBottom",
         description=(
-            "The offset specifies how far inwards the bottom edge of the crop rectangle is from the bottom edge o",
-            "f the original content as a fraction of the original content's height.",
+            "The offset specifies how far inwards the bottom edge of the crop rectangle is from the bottom edge o"
+            "f the original content as a fraction of the original content's height."
         ),
         default=None,
     )
     angle: Optional[float] = Field(
+        alias="angle",
         description=(
-            "The clockwise rotation angle of the crop rectangle around its center, in radians. Rotation is applie",
-            "d after the offsets.",
+            "The clockwise rotation angle of the crop rectangle around its center, in radians. Rotation is applie"
+            "d after the offsets."
         ),
         default=None,
     )
@@ -351,28 +355,30 @@ class CropPropertiesSuggestionState(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#croppropertiessuggestionstate
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     offset_left_suggested: Optional[bool] = Field(
+        alias="offsetLeftSuggested",
         description="Indicates if there was a suggested change to offsetLeft.",
         default=None,
     )
     offset_right_suggested: Optional[bool] = Field(
+        alias="offsetRightSuggested",
         description="Indicates if there was a suggested change to offsetRight.",
         default=None,
     )
     offset_top_suggested: Optional[bool] = Field(
+        alias="offsetTopSuggested",
         description="Indicates if there was a suggested change to offsetTop.",
         default=None,
     )
     offset_bottom_suggested: Optional[bool] = Field(
+        alias="offsetBottomSuggested",
         description="Indicates if there was a suggested change to offsetBottom.",
         default=None,
     )
     angle_suggested: Optional[bool] = Field(
+        alias="angleSuggested",
         description="Indicates if there was a suggested change to angle.",
         default=None,
     )
@@ -405,10 +411,7 @@ class EmbeddedDrawingProperties(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#embeddeddrawingproperties
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     pass
 
@@ -419,10 +422,7 @@ class EmbeddedDrawingPropertiesSuggestionState(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#embeddeddrawingpropertiessuggestionstate
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     pass
 
@@ -433,36 +433,37 @@ class EmbeddedObjectBorderSuggestionState(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#embeddedobjectbordersuggestionstate
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     color_suggested: Optional[bool] = Field(
+        alias="colorSuggested",
         description=(
-            "Indicates if there was a suggested change to [color] [google.apps.docs.v1.EmbeddedBorderObject.color",
-            "].",
+            "Indicates if there was a suggested change to [color] [google.apps.docs.v1.EmbeddedBorderObject.color"
+            "]."
         ),
         default=None,
     )
     width_suggested: Optional[bool] = Field(
+        alias="widthSuggested",
         description=(
-            "Indicates if there was a suggested change to [width] [google.apps.docs.v1.EmbeddedBorderObject.width",
-            "].",
+            "Indicates if there was a suggested change to [width] [google.apps.docs.v1.EmbeddedBorderObject.width"
+            "]."
         ),
         default=None,
     )
     dash_style_suggested: Optional[bool] = Field(
+        alias="dashStyleSuggested",
         description=(
-            "Indicates if there was a suggested change to [dashStyle] [google.apps.docs.v1.EmbeddedBorderObject.d",
-            "ash_style].",
+            "Indicates if there was a suggested change to [dashStyle] [google.apps.docs.v1.EmbeddedBorderObject.d"
+            "ash_style]."
         ),
         default=None,
     )
     property_state_suggested: Optional[bool] = Field(
+        alias="propertyStateSuggested",
         description=(
-            "Indicates if there was a suggested change to [propertyState] [google.apps.docs.v1.EmbeddedBorderObje",
-            "ct.property_state].",
+            "Indicates if there was a suggested change to [propertyState] [google.apps.docs.v1.EmbeddedBorderObje"
+            "ct.property_state]."
         ),
         default=None,
     )
@@ -474,19 +475,18 @@ class Equation(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#equation
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     suggested_insertion_ids: Optional[list[str]] = Field(
+        alias="suggestedInsertionIds",
         description=(
-            "The suggested insertion IDs. An Equation may have multiple insertion IDs if it's a nested suggested ",
-            "change. If empty, then this is not a suggested insertion.",
+            "The suggested insertion IDs. An Equation may have multiple insertion IDs if it's a nested suggested "
+            "change. If empty, then this is not a suggested insertion."
         ),
         default=None,
     )
-    suggested_deletion_ids: Optional[str] = Field(
+    suggested_deletion_ids: Optional[list[str]] = Field(
+        alias="suggestedDeletionIds",
         description="The suggested deletion IDs. If empty, then there are no suggested deletions of this content.",
         default=None,
     )
@@ -498,16 +498,15 @@ class HeadingLink(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#headinglink
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     id: Optional[str] = Field(
+        alias="id",
         description="The ID of a heading in this document.",
         default=None,
     )
     tab_id: Optional[str] = Field(
+        alias="tabId",
         description="The ID of the tab containing this heading.",
         default=None,
     )
@@ -519,49 +518,53 @@ class ImageProperties(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#imageproperties
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     content_uri: Optional[str] = Field(
+        alias="contentUri",
         description=(
-            "A URI to the image with a default lifetime of 30 minutes. This URI is tagged with the account of the",
-            " requester. Anyone with the URI effectively accesses the image as the original requester. Access to ",
-            "the image may be lost if the document's sharing settings change.",
+            "A URI to the image with a default lifetime of 30 minutes. This URI is tagged with the account of the"
+            " requester. Anyone with the URI effectively accesses the image as the original requester. Access to "
+            "the image may be lost if the document's sharing settings change."
         ),
         default=None,
     )
     source_uri: Optional[str] = Field(
+        alias="sourceUri",
         description="The source URI is the URI used to insert the image. The source URI can be empty.",
         default=None,
     )
     brightness: Optional[float] = Field(
+        alias="brightness",
         description=(
-            "The brightness effect of the image. The value should be in the interval [-1.0, 1.0], where 0 means n",
-            "o effect.",
+            "The brightness effect of the image. The value should be in the interval [-1.0, 1.0], where 0 means n"
+            "o effect."
         ),
         default=None,
     )
     contrast: Optional[float] = Field(
+        alias="contrast",
         description=(
-            "The contrast effect of the image. The value should be in the interval [-1.0, 1.0], where 0 means no ",
-            "effect.",
+            "The contrast effect of the image. The value should be in the interval [-1.0, 1.0], where 0 means no "
+            "effect."
         ),
         default=None,
     )
     transparency: Optional[float] = Field(
+        alias="transparency",
         description=(
-            "The transparency effect of the image. The value should be in the interval [0.0, 1.0], where 0 means ",
-            "no effect and 1 means transparent.",
+            "The transparency effect of the image. The value should be in the interval [0.0, 1.0], where 0 means "
+            "no effect and 1 means transparent."
         ),
         default=None,
     )
     crop_properties: Optional[CropProperties] = Field(
+        alias="cropProperties",
         description="The crop properties of the image.",
         default=None,
     )
     angle: Optional[float] = Field(
+        alias="angle",
         description="The clockwise rotation angle of the image, in radians.",
         default=None,
     )
@@ -573,48 +576,52 @@ class ImagePropertiesSuggestionState(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#imagepropertiessuggestionstate
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     content_uri_suggested: Optional[bool] = Field(
+        alias="contentUriSuggested",
         description="Indicates if there was a suggested change to contentUri.",
         default=None,
     )
     source_uri_suggested: Optional[bool] = Field(
+        alias="sourceUriSuggested",
         description=(
-            "Indicates if there was a suggested change to [sourceUri] [google.apps.docs.v1.EmbeddedObject.source_",
-            "uri].",
+            "Indicates if there was a suggested change to [sourceUri] [google.apps.docs.v1.EmbeddedObject.source_"
+            "uri]."
         ),
         default=None,
     )
     brightness_suggested: Optional[bool] = Field(
+        alias="brightnessSuggested",
         description=(
-            "Indicates if there was a suggested change to [brightness] [google.apps.docs.v1.EmbeddedObject.bright",
-            "ness].",
+            "Indicates if there was a suggested change to [brightness] [google.apps.docs.v1.EmbeddedObject.bright"
+            "ness]."
         ),
         default=None,
     )
     contrast_suggested: Optional[bool] = Field(
+        alias="contrastSuggested",
         description=(
-            "Indicates if there was a suggested change to [contrast] [google.apps.docs.v1.EmbeddedObject.contrast",
-            "].",
+            "Indicates if there was a suggested change to [contrast] [google.apps.docs.v1.EmbeddedObject.contrast"
+            "]."
         ),
         default=None,
     )
     transparency_suggested: Optional[bool] = Field(
+        alias="transparencySuggested",
         description=(
-            "Indicates if there was a suggested change to [transparency] [google.apps.docs.v1.EmbeddedObject.tran",
-            "sparency].",
+            "Indicates if there was a suggested change to [transparency] [google.apps.docs.v1.EmbeddedObject.tran"
+            "sparency]."
         ),
         default=None,
     )
     crop_properties_suggestion_state: Optional[CropPropertiesSuggestionState] = Field(
+        alias="cropPropertiesSuggestionState",
         description="A mask that indicates which of the fields in cropProperties have been changed in this suggestion.",
         default=None,
     )
     angle_suggested: Optional[bool] = Field(
+        alias="angleSuggested",
         description="Indicates if there was a suggested change to [angle] [google.apps.docs.v1.EmbeddedObject.angle].",
         default=None,
     )
@@ -626,54 +633,57 @@ class Link(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#link
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     url: Optional[str] = Field(
+        alias="url",
         description="An external URL.",
         default=None,
     )
     tab_id: Optional[str] = Field(
+        alias="tabId",
         description="The ID of a tab in this document.",
         default=None,
     )
     bookmark: Optional[BookmarkLink] = Field(
+        alias="bookmark",
         description=(
-            "A bookmark in this document. In documents containing a single tab, links to bookmarks within the sin",
-            "gular tab continue to return Link.bookmarkId when the includeTabsContent parameter is set to false o",
-            "r unset. Otherwise, this field is returned.",
+            "A bookmark in this document. In documents containing a single tab, links to bookmarks within the sin"
+            "gular tab continue to return Link.bookmarkId when the includeTabsContent parameter is set to false o"
+            "r unset. Otherwise, this field is returned."
         ),
         default=None,
     )
     heading: Optional[HeadingLink] = Field(
+        alias="heading",
         description=(
-            "A heading in this document. In documents containing a single tab, links to headings within the singu",
-            "lar tab continue to return Link.headingId when the includeTabsContent parameter is set to false or u",
-            "nset. Otherwise, this field is returned.",
+            "A heading in this document. In documents containing a single tab, links to headings within the singu"
+            "lar tab continue to return Link.headingId when the includeTabsContent parameter is set to false or u"
+            "nset. Otherwise, this field is returned."
         ),
         default=None,
     )
     bookmark_id: Optional[str] = Field(
+        alias="bookmarkId",
         description=(
-            "The ID of a bookmark in this document. Legacy field: Instead, set includeTabsContent to true and use",
-            " Link.bookmark for read and write operations. This field is only returned when includeTabsContent is",
-            " set to false in documents containing a single tab and links to a bookmark within the singular tab. ",
-            "Otherwise, Link.bookmark is returned. If this field is used in a write request, the bookmark is cons",
-            "idered to be from the tab ID specified in the request. If a tab ID is not specified in the request, ",
-            "it is considered to be from the first tab in the document.",
+            "The ID of a bookmark in this document. Legacy field: Instead, set includeTabsContent to true and use"
+            " Link.bookmark for read and write operations. This field is only returned when includeTabsContent is"
+            " set to false in documents containing a single tab and links to a bookmark within the singular tab. "
+            "Otherwise, Link.bookmark is returned. If this field is used in a write request, the bookmark is cons"
+            "idered to be from the tab ID specified in the request. If a tab ID is not specified in the request, "
+            "it is considered to be from the first tab in the document."
         ),
         default=None,
     )
     heading_id: Optional[str] = Field(
+        alias="headingId",
         description=(
-            "The ID of a heading in this document. Legacy field: Instead, set includeTabsContent to true and use ",
-            "Link.heading for read and write operations. This field is only returned when includeTabsContent is s",
-            "et to false in documents containing a single tab and links to a heading within the singular tab. Oth",
-            "erwise, Link.heading is returned. If this field is used in a write request, the heading is considere",
-            "d to be from the tab ID specified in the request. If a tab ID is not specified in the request, it is",
-            " considered to be from the first tab in the document.",
+            "The ID of a heading in this document. Legacy field: Instead, set includeTabsContent to true and use "
+            "Link.heading for read and write operations. This field is only returned when includeTabsContent is s"
+            "et to false in documents containing a single tab and links to a heading within the singular tab. Oth"
+            "erwise, Link.heading is returned. If this field is used in a write request, the heading is considere"
+            "d to be from the tab ID specified in the request. If a tab ID is not specified in the request, it is"
+            " considered to be from the first tab in the document."
         ),
         default=None,
     )
@@ -685,10 +695,7 @@ class METHODS_SUMMARY(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#methods
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     pass
 
@@ -699,12 +706,10 @@ class ObjectReferences(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#objectreferences
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     object_ids: Optional[list[str]] = Field(
+        alias="objectIds",
         description="The object IDs.",
         default=None,
     )
@@ -716,19 +721,18 @@ class PersonProperties(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#personproperties
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     name: Optional[str] = Field(
+        alias="name",
         description=(
-            "Output only. The name of the person if it's displayed in the link text instead of the person's email",
-            " address.",
+            "Output only. The name of the person if it's displayed in the link text instead of the person's email"
+            " address."
         ),
         default=None,
     )
     email: Optional[str] = Field(
+        alias="email",
         description="Output only. The email address linked to this Person. This field is always present.",
         default=None,
     )
@@ -769,20 +773,20 @@ class PositionedObjectPositioningSuggestionState(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#positionedobjectpositioningsuggestionstate
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     layout_suggested: Optional[bool] = Field(
+        alias="layoutSuggested",
         description="Indicates if there was a suggested change to layout.",
         default=None,
     )
     left_offset_suggested: Optional[bool] = Field(
+        alias="leftOffsetSuggested",
         description="Indicates if there was a suggested change to leftOffset.",
         default=None,
     )
     top_offset_suggested: Optional[bool] = Field(
+        alias="topOffsetSuggested",
         description="Indicates if there was a suggested change to topOffset.",
         default=None,
     )
@@ -810,40 +814,41 @@ class Range(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#range
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     segment_id: Optional[str] = Field(
+        alias="segmentId",
         description=(
-            "The ID of the header, footer, or footnote that this range is contained in. An empty segment ID signi",
-            "fies the document's body.",
+            "The ID of the header, footer, or footnote that this range is contained in. An empty segment ID signi"
+            "fies the document's body."
         ),
         default=None,
     )
     start_index: Optional[int] = Field(
+        alias="startIndex",
         description=(
-            "The zero-based start index of this range, in UTF-16 code units. In all current uses, a start index m",
-            "ust be provided. This field is an Int32Value in order to accommodate future use cases with open-ende",
-            "d ranges.",
+            "The zero-based start index of this range, in UTF-16 code units. In all current uses, a start index m"
+            "ust be provided. This field is an Int32Value in order to accommodate future use cases with open-ende"
+            "d ranges."
         ),
         default=None,
     )
     end_index: Optional[int] = Field(
+        alias="endIndex",
         description=(
-            "The zero-based end index of this range, exclusive, in UTF-16 code units. In all current uses, an end",
-            " index must be provided. This field is an Int32Value in order to accommodate future use cases with o",
-            "pen-ended ranges.",
+            "The zero-based end index of this range, exclusive, in UTF-16 code units. In all current uses, an end"
+            " index must be provided. This field is an Int32Value in order to accommodate future use cases with o"
+            "pen-ended ranges."
         ),
         default=None,
     )
     tab_id: Optional[str] = Field(
+        alias="tabId",
         description=(
-            "The tab that contains this range. When omitted, the request applies to the first tab. In a document ",
-            "containing a single tab: If provided, must match the singular tab's ID. If omitted, the request appl",
-            "ies to the singular tab. In a document containing multiple tabs: If provided, the request applies to",
-            " the specified tab. If omitted, the request applies to the first tab in the document.",
+            "The tab that contains this range. When omitted, the request applies to the first tab. In a document "
+            "containing a single tab: If provided, must match the singular tab's ID. If omitted, the request appl"
+            "ies to the singular tab. In a document containing multiple tabs: If provided, the request applies to"
+            " the specified tab. If omitted, the request applies to the first tab in the document."
         ),
         default=None,
     )
@@ -855,20 +860,20 @@ class RgbColor(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#rgbcolor
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     red: Optional[float] = Field(
+        alias="red",
         description="The red component of the color, from 0.0 to 1.0.",
         default=None,
     )
     green: Optional[float] = Field(
+        alias="green",
         description="The green component of the color, from 0.0 to 1.0.",
         default=None,
     )
     blue: Optional[float] = Field(
+        alias="blue",
         description="The blue component of the color, from 0.0 to 1.0.",
         default=None,
     )
@@ -880,24 +885,24 @@ class RichLinkProperties(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#richlinkproperties
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     title: Optional[str] = Field(
+        alias="title",
         description=(
-            "Output only. The title of the RichLink as displayed in the link. This title matches the title of the",
-            " linked resource at the time of the insertion or last update of the link. This field is always prese",
-            "nt.",
+            "Output only. The title of the RichLink as displayed in the link. This title matches the title of the"
+            " linked resource at the time of the insertion or last update of the link. This field is always prese"
+            "nt."
         ),
         default=None,
     )
     uri: Optional[str] = Field(
+        alias="uri",
         description="Output only. The URI to the RichLink. This is always present.",
         default=None,
     )
     mime_type: Optional[str] = Field(
+        alias="mimeType",
         description="Output only. The MIME type of the RichLink, if there's one (for example, when it's a file in Drive).",
         default=None,
     )
@@ -909,12 +914,10 @@ class ShadingSuggestionState(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#shadingsuggestionstate
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     background_color_suggested: Optional[bool] = Field(
+        alias="backgroundColorSuggested",
         description="Indicates if there was a suggested change to the Shading.",
         default=None,
     )
@@ -926,16 +929,15 @@ class SheetsChartReference(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#sheetschartreference
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     spreadsheet_id: Optional[str] = Field(
+        alias="spreadsheetId",
         description="The ID of the Google Sheets spreadsheet that contains the source chart.",
         default=None,
     )
     chart_id: Optional[int] = Field(
+        alias="chartId",
         description="The ID of the specific chart in the Google Sheets spreadsheet that's embedded.",
         default=None,
     )
@@ -947,16 +949,15 @@ class SheetsChartReferenceSuggestionState(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#sheetschartreferencesuggestionstate
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     spreadsheet_id_suggested: Optional[bool] = Field(
+        alias="spreadsheetIdSuggested",
         description="Indicates if there was a suggested change to spreadsheetId.",
         default=None,
     )
     chart_id_suggested: Optional[bool] = Field(
+        alias="chartIdSuggested",
         description="Indicates if there was a suggested change to chartId.",
         default=None,
     )
@@ -968,16 +969,15 @@ class SizeSuggestionState(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#sizesuggestionstate
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     height_suggested: Optional[bool] = Field(
+        alias="heightSuggested",
         description="Indicates if there was a suggested change to height.",
         default=None,
     )
-    width_suggested: Optional[list[bool]] = Field(
+    width_suggested: Optional[bool] = Field(
+        alias="widthSuggested",
         description="Indicates if there was a suggested change to width.",
         default=None,
     )
@@ -1035,31 +1035,33 @@ class TabProperties(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#tabproperties
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     tab_id: Optional[str] = Field(
+        alias="tabId",
         description="Output only. The ID of the tab. This field can't be changed.",
         default=None,
     )
     title: Optional[str] = Field(
+        alias="title",
         description="The user-visible name of the tab.",
         default=None,
     )
     parent_tab_id: Optional[str] = Field(
+        alias="parentTabId",
         description=(
-            "Optional. The ID of the parent tab. Empty when the current tab is a root-level tab, which means it d",
-            "oesn't have any parents.",
+            "Optional. The ID of the parent tab. Empty when the current tab is a root-level tab, which means it d"
+            "oesn't have any parents."
         ),
         default=None,
     )
     index: Optional[int] = Field(
+        alias="index",
         description="The zero-based index of the tab within the parent.",
         default=None,
     )
     nesting_level: Optional[int] = Field(
+        alias="nestingLevel",
         description="Output only. The depth of the tab within the document. Root-level tabs start at 0.",
         default=None,
     )
@@ -1091,56 +1093,65 @@ class TableCellStyleSuggestionState(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#tablecellstylesuggestionstate
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     row_span_suggested: Optional[bool] = Field(
+        alias="rowSpanSuggested",
         description="Indicates if there was a suggested change to rowSpan.",
         default=None,
     )
     column_span_suggested: Optional[bool] = Field(
+        alias="columnSpanSuggested",
         description="Indicates if there was a suggested change to columnSpan.",
         default=None,
     )
     background_color_suggested: Optional[bool] = Field(
+        alias="backgroundColorSuggested",
         description="Indicates if there was a suggested change to backgroundColor.",
         default=None,
     )
     border_left_suggested: Optional[bool] = Field(
+        alias="borderLeftSuggested",
         description="Indicates if there was a suggested change to borderLeft.",
         default=None,
     )
     border_right_suggested: Optional[bool] = Field(
+        alias="borderRightSuggested",
         description="Indicates if there was a suggested change to borderRight.",
         default=None,
     )
     border_top_suggested: Optional[bool] = Field(
+        alias="borderTopSuggested",
         description="Indicates if there was a suggested change to borderTop.",
         default=None,
     )
     border_bottom_suggested: Optional[bool] = Field(
+        alias="borderBottomSuggested",
         description="Indicates if there was a suggested change to borderBottom.",
         default=None,
     )
     padding_left_suggested: Optional[bool] = Field(
+        alias="paddingLeftSuggested",
         description="Indicates if there was a suggested change to paddingLeft.",
         default=None,
     )
     padding_right_suggested: Optional[bool] = Field(
+        alias="paddingRightSuggested",
         description="Indicates if there was a suggested change to paddingRight.",
         default=None,
     )
     padding_top_suggested: Optional[bool] = Field(
+        alias="paddingTopSuggested",
         description="Indicates if there was a suggested change to paddingTop.",
         default=None,
     )
     padding_bottom_suggested: Optional[bool] = Field(
+        alias="paddingBottomSuggested",
         description="Indicates if there was a suggested change to paddingBottom.",
         default=None,
     )
     content_alignment_suggested: Optional[bool] = Field(
+        alias="contentAlignmentSuggested",
         description="Indicates if there was a suggested change to contentAlignment.",
         default=None,
     )
@@ -1152,12 +1163,10 @@ class TableRowStyleSuggestionState(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#tablerowstylesuggestionstate
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
-    min_row_height_suggested: Optional[list[bool]] = Field(
+    min_row_height_suggested: Optional[bool] = Field(
+        alias="minRowHeightSuggested",
         description="Indicates if there was a suggested change to minRowHeight.",
         default=None,
     )
@@ -1169,52 +1178,60 @@ class TextStyleSuggestionState(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#textstylesuggestionstate
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     bold_suggested: Optional[bool] = Field(
+        alias="boldSuggested",
         description="Indicates if there was a suggested change to bold.",
         default=None,
     )
     italic_suggested: Optional[bool] = Field(
+        alias="italicSuggested",
         description="Indicates if there was a suggested change to italic.",
         default=None,
     )
     underline_suggested: Optional[bool] = Field(
+        alias="underlineSuggested",
         description="Indicates if there was a suggested change to underline.",
         default=None,
     )
     strikethrough_suggested: Optional[bool] = Field(
+        alias="strikethroughSuggested",
         description="Indicates if there was a suggested change to strikethrough.",
         default=None,
     )
     small_caps_suggested: Optional[bool] = Field(
+        alias="smallCapsSuggested",
         description="Indicates if there was a suggested change to smallCaps.",
         default=None,
     )
     background_color_suggested: Optional[bool] = Field(
+        alias="backgroundColorSuggested",
         description="Indicates if there was a suggested change to backgroundColor.",
         default=None,
     )
     foreground_color_suggested: Optional[bool] = Field(
+        alias="foregroundColorSuggested",
         description="Indicates if there was a suggested change to foregroundColor.",
         default=None,
     )
     font_size_suggested: Optional[bool] = Field(
+        alias="fontSizeSuggested",
         description="Indicates if there was a suggested change to fontSize.",
         default=None,
     )
     weighted_font_family_suggested: Optional[bool] = Field(
+        alias="weightedFontFamilySuggested",
         description="Indicates if there was a suggested change to weightedFontFamily.",
         default=None,
     )
     baseline_offset_suggested: Optional[bool] = Field(
+        alias="baselineOffsetSuggested",
         description="Indicates if there was a suggested change to baselineOffset.",
         default=None,
     )
     link_suggested: Optional[bool] = Field(
+        alias="linkSuggested",
         description="Indicates if there was a suggested change to link.",
         default=None,
     )
@@ -1240,25 +1257,24 @@ class WeightedFontFamily(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#weightedfontfamily
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     font_family: Optional[str] = Field(
+        alias="fontFamily",
         description=(
-            "The font family of the text. The font family can be any font from the Font menu in Docs or from Goog",
-            "le Fonts. If the font name is unrecognized, the text is rendered in Arial.",
+            "The font family of the text. The font family can be any font from the Font menu in Docs or from Goog"
+            "le Fonts. If the font name is unrecognized, the text is rendered in Arial."
         ),
         default=None,
     )
     weight: Optional[int] = Field(
+        alias="weight",
         description=(
-            "The weight of the font. This field can have any value that's a multiple of 100 between 100 and 900, ",
-            "inclusive. This range corresponds to the numerical values described in the CSS 2.1 Specification, se",
-            'ction 15.6, with non-numerical values disallowed. The default value is 400 ("normal"). The font we',
-            "ight makes up just one component of the rendered font weight. A combination of the weight and the te",
-            "xt style's resolved bold value determine the rendered weight, after accounting for inheritance:",
+            "The weight of the font. This field can have any value that's a multiple of 100 between 100 and 900, "
+            "inclusive. This range corresponds to the numerical values described in the CSS 2.1 Specification, se"
+            'ction 15.6, with non-numerical values disallowed. The default value is 400 ("normal"). The font we'
+            "ight makes up just one component of the rendered font weight. A combination of the weight and the te"
+            "xt style's resolved bold value determine the rendered weight, after accounting for inheritance:"
         ),
         default=None,
     )
@@ -1270,20 +1286,20 @@ class BulletSuggestionState(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#bulletsuggestionstate
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     list_id_suggested: Optional[bool] = Field(
+        alias="listIdSuggested",
         description="Indicates if there was a suggested change to the listId.",
         default=None,
     )
     nesting_level_suggested: Optional[bool] = Field(
+        alias="nestingLevelSuggested",
         description="Indicates if there was a suggested change to the nestingLevel.",
         default=None,
     )
-    text_style_suggestion_state: Optional[list[TextStyleSuggestionState]] = Field(
+    text_style_suggestion_state: Optional[TextStyleSuggestionState] = Field(
+        alias="textStyleSuggestionState",
         description="A mask that indicates which of the fields in text style have been changed in this suggestion.",
         default=None,
     )
@@ -1295,12 +1311,10 @@ class Color(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#color
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     rgb_color: Optional[RgbColor] = Field(
+        alias="rgbColor",
         description="The RGB color value.",
         default=None,
     )
@@ -1312,16 +1326,15 @@ class Dimension(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#dimension
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     magnitude: Optional[float] = Field(
+        alias="magnitude",
         description="The magnitude.",
         default=None,
     )
-    unit: Unit = Field(
+    unit: Optional[Unit] = Field(
+        alias="unit",
         description="The units for magnitude.",
         default=None,
     )
@@ -1333,87 +1346,103 @@ class DocumentStyleSuggestionState(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#documentstylesuggestionstate
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     background_suggestion_state: Optional[BackgroundSuggestionState] = Field(
+        alias="backgroundSuggestionState",
         description="A mask that indicates which of the fields in background have been changed in this suggestion.",
         default=None,
     )
     default_header_id_suggested: Optional[bool] = Field(
+        alias="defaultHeaderIdSuggested",
         description="Indicates if there was a suggested change to defaultHeaderId.",
         default=None,
     )
     default_footer_id_suggested: Optional[bool] = Field(
+        alias="defaultFooterIdSuggested",
         description="Indicates if there was a suggested change to defaultFooterId.",
         default=None,
     )
     even_page_header_id_suggested: Optional[bool] = Field(
+        alias="evenPageHeaderIdSuggested",
         description="Indicates if there was a suggested change to evenPageHeaderId.",
         default=None,
     )
     even_page_footer_id_suggested: Optional[bool] = Field(
+        alias="evenPageFooterIdSuggested",
         description="Indicates if there was a suggested change to evenPageFooterId.",
         default=None,
     )
     first_page_header_id_suggested: Optional[bool] = Field(
+        alias="firstPageHeaderIdSuggested",
         description="Indicates if there was a suggested change to firstPageHeaderId.",
         default=None,
     )
     first_page_footer_id_suggested: Optional[bool] = Field(
+        alias="firstPageFooterIdSuggested",
         description="Indicates if there was a suggested change to firstPageFooterId.",
         default=None,
     )
     use_first_page_header_footer_suggested: Optional[bool] = Field(
+        alias="useFirstPageHeaderFooterSuggested",
         description="Indicates if there was a suggested change to useFirstPageHeaderFooter.",
         default=None,
     )
     use_even_page_header_footer_suggested: Optional[bool] = Field(
+        alias="useEvenPageHeaderFooterSuggested",
         description="Indicates if there was a suggested change to useEvenPageHeaderFooter.",
         default=None,
     )
     page_number_start_suggested: Optional[bool] = Field(
+        alias="pageNumberStartSuggested",
         description="Indicates if there was a suggested change to pageNumberStart.",
         default=None,
     )
     margin_top_suggested: Optional[bool] = Field(
+        alias="marginTopSuggested",
         description="Indicates if there was a suggested change to marginTop.",
         default=None,
     )
     margin_bottom_suggested: Optional[bool] = Field(
+        alias="marginBottomSuggested",
         description="Indicates if there was a suggested change to marginBottom.",
         default=None,
     )
     margin_right_suggested: Optional[bool] = Field(
+        alias="marginRightSuggested",
         description="Indicates if there was a suggested change to marginRight.",
         default=None,
     )
     margin_left_suggested: Optional[bool] = Field(
+        alias="marginLeftSuggested",
         description="Indicates if there was a suggested change to marginLeft.",
         default=None,
     )
     page_size_suggestion_state: Optional[SizeSuggestionState] = Field(
+        alias="pageSizeSuggestionState",
         description=(
-            "A mask that indicates which of the fields in [size] [google.apps.docs.v1.DocumentStyle.size] have be",
-            "en changed in this suggestion.",
+            "A mask that indicates which of the fields in [size] [google.apps.docs.v1.DocumentStyle.size] have be"
+            "en changed in this suggestion."
         ),
         default=None,
     )
     margin_header_suggested: Optional[bool] = Field(
+        alias="marginHeaderSuggested",
         description="Indicates if there was a suggested change to marginHeader.",
         default=None,
     )
     margin_footer_suggested: Optional[bool] = Field(
+        alias="marginFooterSuggested",
         description="Indicates if there was a suggested change to marginFooter.",
         default=None,
     )
     use_custom_header_footer_margins_suggested: Optional[bool] = Field(
+        alias="useCustomHeaderFooterMarginsSuggested",
         description="Indicates if there was a suggested change to useCustomHeaderFooterMargins.",
         default=None,
     )
     flip_page_orientation_suggested: Optional[bool] = Field(
+        alias="flipPageOrientationSuggested",
         description="Optional. Indicates if there was a suggested change to flipPageOrientation.",
         default=None,
     )
@@ -1425,12 +1454,10 @@ class LinkedContentReference(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#linkedcontentreference
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     sheets_chart_reference: Optional[SheetsChartReference] = Field(
+        alias="sheetsChartReference",
         description="A reference to the linked chart.",
         default=None,
     )
@@ -1442,17 +1469,15 @@ class LinkedContentReferenceSuggestionState(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#linkedcontentreferencesuggestionstate
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     sheets_chart_reference_suggestion_state: Optional[
         SheetsChartReferenceSuggestionState
     ] = Field(
+        alias="sheetsChartReferenceSuggestionState",
         description=(
-            "A mask that indicates which of the fields in sheetsChartReference have been changed in this suggesti",
-            "on.",
+            "A mask that indicates which of the fields in sheetsChartReference have been changed in this suggesti"
+            "on."
         ),
         default=None,
     )
@@ -1464,20 +1489,20 @@ class NamedRange(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#namedrange
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     named_range_id: Optional[str] = Field(
+        alias="namedRangeId",
         description="The ID of the named range.",
         default=None,
     )
-    name: Optional[list[str]] = Field(
+    name: Optional[str] = Field(
+        alias="name",
         description="The name of the named range.",
         default=None,
     )
-    ranges: Optional[Range] = Field(
+    ranges: Optional[list[Range]] = Field(
+        alias="ranges",
         description="The ranges that belong to this named range.",
         default=None,
     )
@@ -1489,16 +1514,15 @@ class NamedRanges(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#namedranges
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
-    name: Optional[list[str]] = Field(
+    name: Optional[str] = Field(
+        alias="name",
         description="The name that all the named ranges share.",
         default=None,
     )
-    named_ranges: Optional[NamedRange] = Field(
+    named_ranges: Optional[list[NamedRange]] = Field(
+        alias="namedRanges",
         description="The NamedRanges that share the same name.",
         default=None,
     )
@@ -1510,40 +1534,45 @@ class NestingLevelSuggestionState(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#nestinglevelsuggestionstate
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     bullet_alignment_suggested: Optional[bool] = Field(
+        alias="bulletAlignmentSuggested",
         description="Indicates if there was a suggested change to bulletAlignment.",
         default=None,
     )
     glyph_type_suggested: Optional[bool] = Field(
+        alias="glyphTypeSuggested",
         description="Indicates if there was a suggested change to glyphType.",
         default=None,
     )
     glyph_format_suggested: Optional[bool] = Field(
+        alias="glyphFormatSuggested",
         description="Indicates if there was a suggested change to glyphFormat.",
         default=None,
     )
     glyph_symbol_suggested: Optional[bool] = Field(
+        alias="glyphSymbolSuggested",
         description="Indicates if there was a suggested change to glyphSymbol.",
         default=None,
     )
     indent_first_line_suggested: Optional[bool] = Field(
+        alias="indentFirstLineSuggested",
         description="Indicates if there was a suggested change to indentFirstLine.",
         default=None,
     )
     indent_start_suggested: Optional[bool] = Field(
+        alias="indentStartSuggested",
         description="Indicates if there was a suggested change to indentStart.",
         default=None,
     )
     text_style_suggestion_state: Optional[TextStyleSuggestionState] = Field(
+        alias="textStyleSuggestionState",
         description="A mask that indicates which of the fields in text style have been changed in this suggestion.",
         default=None,
     )
     start_number_suggested: Optional[bool] = Field(
+        alias="startNumberSuggested",
         description="Indicates if there was a suggested change to startNumber.",
         default=None,
     )
@@ -1555,12 +1584,10 @@ class OptionalColor(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#optionalcolor
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     color: Optional[Color] = Field(
+        alias="color",
         description="If set, this will be used as an opaque color. If unset, this represents a transparent color.",
         default=None,
     )
@@ -1572,24 +1599,25 @@ class ParagraphBorder(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#paragraphborder
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     color: Optional[OptionalColor] = Field(
+        alias="color",
         description="The color of the border.",
         default=None,
     )
     width: Optional[Dimension] = Field(
+        alias="width",
         description="The width of the border.",
         default=None,
     )
     padding: Optional[Dimension] = Field(
+        alias="padding",
         description="The padding of the border.",
         default=None,
     )
-    dash_style: DashStyle = Field(
+    dash_style: Optional[DashStyle] = Field(
+        alias="dashStyle",
         description="The dash style of the border.",
         default=None,
     )
@@ -1601,92 +1629,110 @@ class ParagraphStyleSuggestionState(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#paragraphstylesuggestionstate
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     heading_id_suggested: Optional[bool] = Field(
+        alias="headingIdSuggested",
         description="Indicates if there was a suggested change to headingId.",
         default=None,
     )
     named_style_type_suggested: Optional[bool] = Field(
+        alias="namedStyleTypeSuggested",
         description="Indicates if there was a suggested change to namedStyleType.",
         default=None,
     )
     alignment_suggested: Optional[bool] = Field(
+        alias="alignmentSuggested",
         description="Indicates if there was a suggested change to alignment.",
         default=None,
     )
     line_spacing_suggested: Optional[bool] = Field(
+        alias="lineSpacingSuggested",
         description="Indicates if there was a suggested change to lineSpacing.",
         default=None,
     )
     direction_suggested: Optional[bool] = Field(
+        alias="directionSuggested",
         description="Indicates if there was a suggested change to direction.",
         default=None,
     )
     spacing_mode_suggested: Optional[bool] = Field(
+        alias="spacingModeSuggested",
         description="Indicates if there was a suggested change to spacingMode.",
         default=None,
     )
     space_above_suggested: Optional[bool] = Field(
+        alias="spaceAboveSuggested",
         description="Indicates if there was a suggested change to spaceAbove.",
         default=None,
     )
     space_below_suggested: Optional[bool] = Field(
+        alias="spaceBelowSuggested",
         description="Indicates if there was a suggested change to spaceBelow.",
         default=None,
     )
     border_between_suggested: Optional[bool] = Field(
+        alias="borderBetweenSuggested",
         description="Indicates if there was a suggested change to borderBetween.",
         default=None,
     )
     border_top_suggested: Optional[bool] = Field(
+        alias="borderTopSuggested",
         description="Indicates if there was a suggested change to borderTop.",
         default=None,
     )
     border_bottom_suggested: Optional[bool] = Field(
+        alias="borderBottomSuggested",
         description="Indicates if there was a suggested change to borderBottom.",
         default=None,
     )
     border_left_suggested: Optional[bool] = Field(
+        alias="borderLeftSuggested",
         description="Indicates if there was a suggested change to borderLeft.",
         default=None,
     )
     border_right_suggested: Optional[bool] = Field(
+        alias="borderRightSuggested",
         description="Indicates if there was a suggested change to borderRight.",
         default=None,
     )
     indent_first_line_suggested: Optional[bool] = Field(
+        alias="indentFirstLineSuggested",
         description="Indicates if there was a suggested change to indentFirstLine.",
         default=None,
     )
     indent_start_suggested: Optional[bool] = Field(
+        alias="indentStartSuggested",
         description="Indicates if there was a suggested change to indentStart.",
         default=None,
     )
     indent_end_suggested: Optional[bool] = Field(
+        alias="indentEndSuggested",
         description="Indicates if there was a suggested change to indentEnd.",
         default=None,
     )
     keep_lines_together_suggested: Optional[bool] = Field(
+        alias="keepLinesTogetherSuggested",
         description="Indicates if there was a suggested change to keepLinesTogether.",
         default=None,
     )
     keep_with_next_suggested: Optional[bool] = Field(
+        alias="keepWithNextSuggested",
         description="Indicates if there was a suggested change to keepWithNext.",
         default=None,
     )
     avoid_widow_and_orphan_suggested: Optional[bool] = Field(
+        alias="avoidWidowAndOrphanSuggested",
         description="Indicates if there was a suggested change to avoidWidowAndOrphan.",
         default=None,
     )
     shading_suggestion_state: Optional[ShadingSuggestionState] = Field(
+        alias="shadingSuggestionState",
         description="A mask that indicates which of the fields in shading have been changed in this suggestion.",
         default=None,
     )
     page_break_before_suggested: Optional[bool] = Field(
+        alias="pageBreakBeforeSuggested",
         description="Indicates if there was a suggested change to pageBreakBefore.",
         default=None,
     )
@@ -1698,28 +1744,28 @@ class PositionedObjectPositioning(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#positionedobjectpositioning
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
-    layout: PositionedObjectLayout = Field(
+    layout: Optional[PositionedObjectLayout] = Field(
+        alias="layout",
         description="The layout of this positioned object.",
         default=None,
     )
     left_offset: Optional[Dimension] = Field(
+        alias="leftOffset",
         description=(
-            "The offset of the left edge of the positioned object relative to the beginning of the Paragraph it's",
-            " tethered to. The exact positioning of the object can depend on other content in the document and th",
-            "e document's styling.",
+            "The offset of the left edge of the positioned object relative to the beginning of the Paragraph it's"
+            " tethered to. The exact positioning of the object can depend on other content in the document and th"
+            "e document's styling."
         ),
         default=None,
     )
     top_offset: Optional[Dimension] = Field(
+        alias="topOffset",
         description=(
-            "The offset of the top edge of the positioned object relative to the beginning of the Paragraph it's ",
-            "tethered to. The exact positioning of the object can depend on other content in the document and the",
-            " document's styling.",
+            "The offset of the top edge of the positioned object relative to the beginning of the Paragraph it's "
+            "tethered to. The exact positioning of the object can depend on other content in the document and the"
+            " document's styling."
         ),
         default=None,
     )
@@ -1731,16 +1777,15 @@ class SectionColumnProperties(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#sectioncolumnproperties
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     width: Optional[Dimension] = Field(
+        alias="width",
         description="Output only. The width of the column.",
         default=None,
     )
     padding_end: Optional[Dimension] = Field(
+        alias="paddingEnd",
         description="The padding at the end of the column.",
         default=None,
     )
@@ -1752,174 +1797,190 @@ class SectionStyle(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#sectionstyle
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
-    column_properties: Optional[SectionColumnProperties] = Field(
+    column_properties: Optional[list[SectionColumnProperties]] = Field(
+        alias="columnProperties",
         description=(
-            "The section's columns properties. If empty, the section contains one column with the default propert",
-            "ies in the Docs editor. A section can be updated to have no more than 3 columns. When updating this ",
-            "property, setting a concrete value is required. Unsetting this property will result in a 400 bad req",
-            "uest error.",
+            "The section's columns properties. If empty, the section contains one column with the default propert"
+            "ies in the Docs editor. A section can be updated to have no more than 3 columns. When updating this "
+            "property, setting a concrete value is required. Unsetting this property will result in a 400 bad req"
+            "uest error."
         ),
         default=None,
     )
-    column_separator_style: ColumnSeparatorStyle = Field(
+    column_separator_style: Optional[ColumnSeparatorStyle] = Field(
+        alias="columnSeparatorStyle",
         description=(
-            "The style of column separators. This style can be set even when there's one column in the section. W",
-            "hen updating this property, setting a concrete value is required. Unsetting this property results in",
-            " a 400 bad request error.",
+            "The style of column separators. This style can be set even when there's one column in the section. W"
+            "hen updating this property, setting a concrete value is required. Unsetting this property results in"
+            " a 400 bad request error."
         ),
         default=None,
     )
-    content_direction: ContentDirection = Field(
+    content_direction: Optional[ContentDirection] = Field(
+        alias="contentDirection",
         description=(
-            "The content direction of this section. If unset, the value defaults to LEFT_TO_RIGHT. When updating ",
-            "this property, setting a concrete value is required. Unsetting this property results in a 400 bad re",
-            "quest error.",
+            "The content direction of this section. If unset, the value defaults to LEFT_TO_RIGHT. When updating "
+            "this property, setting a concrete value is required. Unsetting this property results in a 400 bad re"
+            "quest error."
         ),
         default=None,
     )
     margin_top: Optional[Dimension] = Field(
+        alias="marginTop",
         description=(
-            "The top page margin of the section. If unset, the value defaults to marginTop from DocumentStyle. Wh",
-            "en updating this property, setting a concrete value is required. Unsetting this property results in ",
-            "a 400 bad request error.",
+            "The top page margin of the section. If unset, the value defaults to marginTop from DocumentStyle. Wh"
+            "en updating this property, setting a concrete value is required. Unsetting this property results in "
+            "a 400 bad request error."
         ),
         default=None,
     )
     margin_bottom: Optional[Dimension] = Field(
+        alias="marginBottom",
         description=(
-            "The bottom page margin of the section. If unset, the value defaults to marginBottom from DocumentSty",
-            "le. When updating this property, setting a concrete value is required. Unsetting this property resul",
-            "ts in a 400 bad request error.",
+            "The bottom page margin of the section. If unset, the value defaults to marginBottom from DocumentSty"
+            "le. When updating this property, setting a concrete value is required. Unsetting this property resul"
+            "ts in a 400 bad request error."
         ),
         default=None,
     )
     margin_right: Optional[Dimension] = Field(
+        alias="marginRight",
         description=(
-            "The right page margin of the section. If unset, the value defaults to marginRight from DocumentStyle",
-            ". Updating the right margin causes columns in this section to resize. Since the margin affects colum",
-            "n width, it's applied before column properties. When updating this property, setting a concrete valu",
-            "e is required. Unsetting this property results in a 400 bad request error.",
+            "The right page margin of the section. If unset, the value defaults to marginRight from DocumentStyle"
+            ". Updating the right margin causes columns in this section to resize. Since the margin affects colum"
+            "n width, it's applied before column properties. When updating this property, setting a concrete valu"
+            "e is required. Unsetting this property results in a 400 bad request error."
         ),
         default=None,
     )
     margin_left: Optional[Dimension] = Field(
+        alias="marginLeft",
         description=(
-            "The left page margin of the section. If unset, the value defaults to marginLeft from DocumentStyle. ",
-            "Updating the left margin causes columns in this section to resize. Since the margin affects column w",
-            "idth, it's applied before column properties. When updating this property, setting a concrete value i",
-            "s required. Unsetting this property results in a 400 bad request error.",
+            "The left page margin of the section. If unset, the value defaults to marginLeft from DocumentStyle. "
+            "Updating the left margin causes columns in this section to resize. Since the margin affects column w"
+            "idth, it's applied before column properties. When updating this property, setting a concrete value i"
+            "s required. Unsetting this property results in a 400 bad request error."
         ),
         default=None,
     )
     margin_header: Optional[Dimension] = Field(
+        alias="marginHeader",
         description=(
-            "The header margin of the section. If unset, the value defaults to marginHeader from DocumentStyle. I",
-            "f updated, useCustomHeaderFooterMargins is set to true on DocumentStyle. The value of useCustomHeade",
-            "rFooterMargins on DocumentStyle indicates if a header margin is being respected for this section. Wh",
-            "en updating this property, setting a concrete value is required. Unsetting this property results in ",
-            "a 400 bad request error.",
+            "The header margin of the section. If unset, the value defaults to marginHeader from DocumentStyle. I"
+            "f updated, useCustomHeaderFooterMargins is set to true on DocumentStyle. The value of useCustomHeade"
+            "rFooterMargins on DocumentStyle indicates if a header margin is being respected for this section. Wh"
+            "en updating this property, setting a concrete value is required. Unsetting this property results in "
+            "a 400 bad request error."
         ),
         default=None,
     )
     margin_footer: Optional[Dimension] = Field(
+        alias="marginFooter",
         description=(
-            "The footer margin of the section. If unset, the value defaults to marginFooter from DocumentStyle. I",
-            "f updated, useCustomHeaderFooterMargins is set to true on DocumentStyle. The value of useCustomHeade",
-            "rFooterMargins on DocumentStyle indicates if a footer margin is being respected for this section Whe",
-            "n updating this property, setting a concrete value is required. Unsetting this property results in a",
-            " 400 bad request error.",
+            "The footer margin of the section. If unset, the value defaults to marginFooter from DocumentStyle. I"
+            "f updated, useCustomHeaderFooterMargins is set to true on DocumentStyle. The value of useCustomHeade"
+            "rFooterMargins on DocumentStyle indicates if a footer margin is being respected for this section Whe"
+            "n updating this property, setting a concrete value is required. Unsetting this property results in a"
+            " 400 bad request error."
         ),
         default=None,
     )
-    section_type: SectionType = Field(
+    section_type: Optional[SectionType] = Field(
+        alias="sectionType",
         description="Output only. The type of section.",
         default=None,
     )
     default_header_id: Optional[str] = Field(
+        alias="defaultHeaderId",
         description=(
-            "The ID of the default header. If unset, the value inherits from the previous SectionBreak's SectionS",
-            "tyle. If the value is unset in the first SectionBreak, it inherits from DocumentStyle's defaultHeade",
-            "rId. This property is read-only.",
+            "The ID of the default header. If unset, the value inherits from the previous SectionBreak's SectionS"
+            "tyle. If the value is unset in the first SectionBreak, it inherits from DocumentStyle's defaultHeade"
+            "rId. This property is read-only."
         ),
         default=None,
     )
     default_footer_id: Optional[str] = Field(
+        alias="defaultFooterId",
         description=(
-            "The ID of the default footer. If unset, the value inherits from the previous SectionBreak's SectionS",
-            "tyle. If the value is unset in the first SectionBreak, it inherits from DocumentStyle's defaultFoote",
-            "rId. This property is read-only.",
+            "The ID of the default footer. If unset, the value inherits from the previous SectionBreak's SectionS"
+            "tyle. If the value is unset in the first SectionBreak, it inherits from DocumentStyle's defaultFoote"
+            "rId. This property is read-only."
         ),
         default=None,
     )
     first_page_header_id: Optional[str] = Field(
+        alias="firstPageHeaderId",
         description=(
-            "The ID of the header used only for the first page of the section. If useFirstPageHeaderFooter is tru",
-            "e, this value is used for the header on the first page of the section. If it's false, the header on ",
-            "the first page of the section uses the defaultHeaderId. If unset, the value inherits from the previo",
-            "us SectionBreak's SectionStyle. If the value is unset in the first SectionBreak, it inherits from Do",
-            "cumentStyle's firstPageHeaderId. This property is read-only.",
+            "The ID of the header used only for the first page of the section. If useFirstPageHeaderFooter is tru"
+            "e, this value is used for the header on the first page of the section. If it's false, the header on "
+            "the first page of the section uses the defaultHeaderId. If unset, the value inherits from the previo"
+            "us SectionBreak's SectionStyle. If the value is unset in the first SectionBreak, it inherits from Do"
+            "cumentStyle's firstPageHeaderId. This property is read-only."
         ),
         default=None,
     )
     first_page_footer_id: Optional[str] = Field(
+        alias="firstPageFooterId",
         description=(
-            "The ID of the footer used only for the first page of the section. If useFirstPageHeaderFooter is tru",
-            "e, this value is used for the footer on the first page of the section. If it's false, the footer on ",
-            "the first page of the section uses the defaultFooterId. If unset, the value inherits from the previo",
-            "us SectionBreak's SectionStyle. If the value is unset in the first SectionBreak, it inherits from Do",
-            "cumentStyle's firstPageFooterId. This property is read-only.",
+            "The ID of the footer used only for the first page of the section. If useFirstPageHeaderFooter is tru"
+            "e, this value is used for the footer on the first page of the section. If it's false, the footer on "
+            "the first page of the section uses the defaultFooterId. If unset, the value inherits from the previo"
+            "us SectionBreak's SectionStyle. If the value is unset in the first SectionBreak, it inherits from Do"
+            "cumentStyle's firstPageFooterId. This property is read-only."
         ),
         default=None,
     )
     even_page_header_id: Optional[str] = Field(
+        alias="evenPageHeaderId",
         description=(
-            "The ID of the header used only for even pages. If the value of DocumentStyle's useEvenPageHeaderFoot",
-            "er is true, this value is used for the headers on even pages in the section. If it is false, the hea",
-            "ders on even pages use the defaultHeaderId. If unset, the value inherits from the previous SectionBr",
-            "eak's SectionStyle. If the value is unset in the first SectionBreak, it inherits from DocumentStyle'",
-            "s evenPageHeaderId. This property is read-only.",
+            "The ID of the header used only for even pages. If the value of DocumentStyle's useEvenPageHeaderFoot"
+            "er is true, this value is used for the headers on even pages in the section. If it is false, the hea"
+            "ders on even pages use the defaultHeaderId. If unset, the value inherits from the previous SectionBr"
+            "eak's SectionStyle. If the value is unset in the first SectionBreak, it inherits from DocumentStyle'"
+            "s evenPageHeaderId. This property is read-only."
         ),
         default=None,
     )
     even_page_footer_id: Optional[str] = Field(
+        alias="evenPageFooterId",
         description=(
-            "The ID of the footer used only for even pages. If the value of DocumentStyle's useEvenPageHeaderFoot",
-            "er is true, this value is used for the footers on even pages in the section. If it is false, the foo",
-            "ters on even pages use the defaultFooterId. If unset, the value inherits from the previous SectionBr",
-            "eak's SectionStyle. If the value is unset in the first SectionBreak, it inherits from DocumentStyle'",
-            "s evenPageFooterId. This property is read-only.",
+            "The ID of the footer used only for even pages. If the value of DocumentStyle's useEvenPageHeaderFoot"
+            "er is true, this value is used for the footers on even pages in the section. If it is false, the foo"
+            "ters on even pages use the defaultFooterId. If unset, the value inherits from the previous SectionBr"
+            "eak's SectionStyle. If the value is unset in the first SectionBreak, it inherits from DocumentStyle'"
+            "s evenPageFooterId. This property is read-only."
         ),
         default=None,
     )
     use_first_page_header_footer: Optional[bool] = Field(
+        alias="useFirstPageHeaderFooter",
         description=(
-            "Indicates whether to use the first page header / footer IDs for the first page of the section. If un",
-            "set, it inherits from DocumentStyle's useFirstPageHeaderFooter for the first section. If the value i",
-            "s unset for subsequent sectors, it should be interpreted as false. When updating this property, sett",
-            "ing a concrete value is required. Unsetting this property results in a 400 bad request error.",
+            "Indicates whether to use the first page header / footer IDs for the first page of the section. If un"
+            "set, it inherits from DocumentStyle's useFirstPageHeaderFooter for the first section. If the value i"
+            "s unset for subsequent sectors, it should be interpreted as false. When updating this property, sett"
+            "ing a concrete value is required. Unsetting this property results in a 400 bad request error."
         ),
         default=None,
     )
     page_number_start: Optional[int] = Field(
+        alias="pageNumberStart",
         description=(
-            "The page number from which to start counting the number of pages for this section. If unset, page nu",
-            "mbering continues from the previous section. If the value is unset in the first SectionBreak, refer ",
-            "to DocumentStyle's pageNumberStart. When updating this property, setting a concrete value is require",
-            "d. Unsetting this property results in a 400 bad request error.",
+            "The page number from which to start counting the number of pages for this section. If unset, page nu"
+            "mbering continues from the previous section. If the value is unset in the first SectionBreak, refer "
+            "to DocumentStyle's pageNumberStart. When updating this property, setting a concrete value is require"
+            "d. Unsetting this property results in a 400 bad request error."
         ),
         default=None,
     )
     flip_page_orientation: Optional[bool] = Field(
+        alias="flipPageOrientation",
         description=(
-            "Optional. Indicates whether to flip the dimensions of DocumentStyle's pageSize for this section, whi",
-            "ch allows changing the page orientation between portrait and landscape. If unset, the value inherits",
-            " from DocumentStyle's flipPageOrientation. When updating this property, setting a concrete value is ",
-            "required. Unsetting this property results in a 400 bad request error.",
+            "Optional. Indicates whether to flip the dimensions of DocumentStyle's pageSize for this section, whi"
+            "ch allows changing the page orientation between portrait and landscape. If unset, the value inherits"
+            " from DocumentStyle's flipPageOrientation. When updating this property, setting a concrete value is "
+            "required. Unsetting this property results in a 400 bad request error."
         ),
         default=None,
     )
@@ -1931,12 +1992,10 @@ class Shading(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#shading
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     background_color: Optional[OptionalColor] = Field(
+        alias="backgroundColor",
         description="The background color of this paragraph shading.",
         default=None,
     )
@@ -1948,16 +2007,15 @@ class Size(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#size
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     height: Optional[Dimension] = Field(
+        alias="height",
         description="The height of the object.",
         default=None,
     )
     width: Optional[Dimension] = Field(
+        alias="width",
         description="The width of the object.",
         default=None,
     )
@@ -1969,16 +2027,15 @@ class TabStop(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#tabstop
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     offset: Optional[Dimension] = Field(
+        alias="offset",
         description="The offset between this tab stop and the start margin.",
         default=None,
     )
-    alignment: TabStopAlignment = Field(
+    alignment: Optional[TabStopAlignment] = Field(
+        alias="alignment",
         description="The alignment of this tab stop. If unset, the value defaults to START.",
         default=None,
     )
@@ -1990,20 +2047,20 @@ class TableCellBorder(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#tablecellborder
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     color: Optional[OptionalColor] = Field(
+        alias="color",
         description="The color of the border. This color cannot be transparent.",
         default=None,
     )
     width: Optional[Dimension] = Field(
+        alias="width",
         description="The width of the border.",
         default=None,
     )
-    dash_style: DashStyle = Field(
+    dash_style: Optional[DashStyle] = Field(
+        alias="dashStyle",
         description="The dash style of the border.",
         default=None,
     )
@@ -2015,59 +2072,68 @@ class TableCellStyle(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#tablecellstyle
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     row_span: Optional[int] = Field(
+        alias="rowSpan",
         description="The row span of the cell. This property is read-only.",
         default=None,
     )
     column_span: Optional[int] = Field(
+        alias="columnSpan",
         description="The column span of the cell. This property is read-only.",
         default=None,
     )
     background_color: Optional[OptionalColor] = Field(
+        alias="backgroundColor",
         description="The background color of the cell.",
         default=None,
     )
     border_left: Optional[TableCellBorder] = Field(
+        alias="borderLeft",
         description="The left border of the cell.",
         default=None,
     )
     border_right: Optional[TableCellBorder] = Field(
+        alias="borderRight",
         description="The right border of the cell.",
         default=None,
     )
     border_top: Optional[TableCellBorder] = Field(
+        alias="borderTop",
         description="The top border of the cell.",
         default=None,
     )
     border_bottom: Optional[TableCellBorder] = Field(
+        alias="borderBottom",
         description="The bottom border of the cell.",
         default=None,
     )
     padding_left: Optional[Dimension] = Field(
+        alias="paddingLeft",
         description="The left padding of the cell.",
         default=None,
     )
     padding_right: Optional[Dimension] = Field(
+        alias="paddingRight",
         description="The right padding of the cell.",
         default=None,
     )
     padding_top: Optional[Dimension] = Field(
+        alias="paddingTop",
         description="The top padding of the cell.",
         default=None,
     )
     padding_bottom: Optional[Dimension] = Field(
+        alias="paddingBottom",
         description="The bottom padding of the cell.",
         default=None,
     )
-    content_alignment: ContentAlignment = Field(
+    content_alignment: Optional[ContentAlignment] = Field(
+        alias="contentAlignment",
         description=(
-            "The alignment of the content in the table cell. The default alignment matches the alignment for newl",
-            "y created table cells in the Docs editor.",
+            "The alignment of the content in the table cell. The default alignment matches the alignment for newl"
+            "y created table cells in the Docs editor."
         ),
         default=None,
     )
@@ -2079,16 +2145,15 @@ class TableColumnProperties(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#tablecolumnproperties
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
-    width_type: WidthType = Field(
+    width_type: Optional[WidthType] = Field(
+        alias="widthType",
         description="The width type of the column.",
         default=None,
     )
     width: Optional[Dimension] = Field(
+        alias="width",
         description="The width of the column. Set when the column's widthType is FIXED_WIDTH.",
         default=None,
     )
@@ -2100,23 +2165,23 @@ class TableRowStyle(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#tablerowstyle
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     min_row_height: Optional[Dimension] = Field(
+        alias="minRowHeight",
         description=(
-            "The minimum height of the row. The row will be rendered in the Docs editor at a height equal to or g",
-            "reater than this value in order to show all the content in the row's cells.",
+            "The minimum height of the row. The row will be rendered in the Docs editor at a height equal to or g"
+            "reater than this value in order to show all the content in the row's cells."
         ),
         default=None,
     )
     table_header: Optional[bool] = Field(
+        alias="tableHeader",
         description="Whether the row is a table header.",
         default=None,
     )
     prevent_overflow: Optional[bool] = Field(
+        alias="preventOverflow",
         description="Whether the row cannot overflow across page or column boundaries.",
         default=None,
     )
@@ -2128,15 +2193,13 @@ class TableStyle(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#tablestyle
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
-    table_column_properties: Optional[TableColumnProperties] = Field(
+    table_column_properties: Optional[list[TableColumnProperties]] = Field(
+        alias="tableColumnProperties",
         description=(
-            "The properties of each column. Note that in Docs, tables contain rows and rows contain cells, simila",
-            "r to HTML. So the properties for a row can be found on the row's tableRowStyle.",
+            "The properties of each column. Note that in Docs, tables contain rows and rows contain cells, simila"
+            "r to HTML. So the properties for a row can be found on the row's tableRowStyle."
         ),
         default=None,
     )
@@ -2148,71 +2211,79 @@ class TextStyle(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#textstyle
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     bold: Optional[bool] = Field(
+        alias="bold",
         description="Whether or not the text is rendered as bold.",
         default=None,
     )
     italic: Optional[bool] = Field(
+        alias="italic",
         description="Whether or not the text is italicized.",
         default=None,
     )
     underline: Optional[bool] = Field(
+        alias="underline",
         description="Whether or not the text is underlined.",
         default=None,
     )
     strikethrough: Optional[bool] = Field(
+        alias="strikethrough",
         description="Whether or not the text is struck through.",
         default=None,
     )
     small_caps: Optional[bool] = Field(
+        alias="smallCaps",
         description="Whether or not the text is in small capital letters.",
         default=None,
     )
     background_color: Optional[OptionalColor] = Field(
+        alias="backgroundColor",
         description=(
-            "The background color of the text. If set, the color is either an RGB color or transparent, depending",
-            " on the color field.",
+            "The background color of the text. If set, the color is either an RGB color or transparent, depending"
+            " on the color field."
         ),
         default=None,
     )
     foreground_color: Optional[OptionalColor] = Field(
+        alias="foregroundColor",
         description=(
-            "The foreground color of the text. If set, the color is either an RGB color or transparent, depending",
-            " on the color field.",
+            "The foreground color of the text. If set, the color is either an RGB color or transparent, depending"
+            " on the color field."
         ),
         default=None,
     )
     font_size: Optional[Dimension] = Field(
+        alias="fontSize",
         description="The size of the text's font.",
         default=None,
     )
     weighted_font_family: Optional[WeightedFontFamily] = Field(
+        alias="weightedFontFamily",
         description=(
-            "The font family and rendered weight of the text. If an update request specifies values for both weig",
-            "htedFontFamily and bold, the weightedFontFamily is applied first, then bold. If weightedFontFamily#w",
-            "eight is not set, it defaults to 400. If weightedFontFamily is set, then weightedFontFamily#fontFami",
-            "ly must also be set with a non-empty value. Otherwise, a 400 bad request error is returned.",
+            "The font family and rendered weight of the text. If an update request specifies values for both weig"
+            "htedFontFamily and bold, the weightedFontFamily is applied first, then bold. If weightedFontFamily#w"
+            "eight is not set, it defaults to 400. If weightedFontFamily is set, then weightedFontFamily#fontFami"
+            "ly must also be set with a non-empty value. Otherwise, a 400 bad request error is returned."
         ),
         default=None,
     )
-    baseline_offset: BaselineOffset = Field(
+    baseline_offset: Optional[BaselineOffset] = Field(
+        alias="baselineOffset",
         description=(
-            "The text's vertical offset from its normal position. Text with SUPERSCRIPT or SUBSCRIPT baseline off",
-            "sets is automatically rendered in a smaller font size, computed based on the fontSize field. Changes",
-            " in this field don't affect the fontSize.",
+            "The text's vertical offset from its normal position. Text with SUPERSCRIPT or SUBSCRIPT baseline off"
+            "sets is automatically rendered in a smaller font size, computed based on the fontSize field. Changes"
+            " in this field don't affect the fontSize."
         ),
         default=None,
     )
     link: Optional[Link] = Field(
+        alias="link",
         description=(
-            "The hyperlink destination of the text. If unset, there's no link. Links are not inherited from paren",
-            "t text. Changing the link in an update request causes some other changes to the text style of the ra",
-            "nge:",
+            "The hyperlink destination of the text. If unset, there's no link. Links are not inherited from paren"
+            "t text. Changing the link in an update request causes some other changes to the text style of the ra"
+            "nge:"
         ),
         default=None,
     )
@@ -2224,12 +2295,10 @@ class Background(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#background
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     color: Optional[OptionalColor] = Field(
+        alias="color",
         description="The background color.",
         default=None,
     )
@@ -2241,20 +2310,20 @@ class Bullet(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#bullet
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     list_id: Optional[str] = Field(
+        alias="listId",
         description="The ID of the list this paragraph belongs to.",
         default=None,
     )
     nesting_level: Optional[int] = Field(
+        alias="nestingLevel",
         description="The nesting level of this paragraph in the list.",
         default=None,
     )
     text_style: Optional[TextStyle] = Field(
+        alias="textStyle",
         description="The paragraph-specific text style applied to this bullet.",
         default=None,
     )
@@ -2266,121 +2335,137 @@ class DocumentStyle(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#documentstyle
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     background: Optional[Background] = Field(
+        alias="background",
         description="The background of the document. Documents cannot have a transparent background color.",
         default=None,
     )
     default_header_id: Optional[str] = Field(
+        alias="defaultHeaderId",
         description="The ID of the default header. If not set, there's no default header. This property is read-only.",
         default=None,
     )
     default_footer_id: Optional[str] = Field(
+        alias="defaultFooterId",
         description="The ID of the default footer. If not set, there's no default footer. This property is read-only.",
         default=None,
     )
     even_page_header_id: Optional[str] = Field(
+        alias="evenPageHeaderId",
         description=(
-            "The ID of the header used only for even pages. The value of useEvenPageHeaderFooter determines wheth",
-            "er to use the defaultHeaderId or this value for the header on even pages. If not set, there's no eve",
-            "n page header. This property is read-only.",
+            "The ID of the header used only for even pages. The value of useEvenPageHeaderFooter determines wheth"
+            "er to use the defaultHeaderId or this value for the header on even pages. If not set, there's no eve"
+            "n page header. This property is read-only."
         ),
         default=None,
     )
     even_page_footer_id: Optional[str] = Field(
+        alias="evenPageFooterId",
         description=(
-            "The ID of the footer used only for even pages. The value of useEvenPageHeaderFooter determines wheth",
-            "er to use the defaultFooterId or this value for the footer on even pages. If not set, there's no eve",
-            "n page footer. This property is read-only.",
+            "The ID of the footer used only for even pages. The value of useEvenPageHeaderFooter determines wheth"
+            "er to use the defaultFooterId or this value for the footer on even pages. If not set, there's no eve"
+            "n page footer. This property is read-only."
         ),
         default=None,
     )
     first_page_header_id: Optional[str] = Field(
+        alias="firstPageHeaderId",
         description=(
-            "The ID of the header used only for the first page. If not set then a unique header for the first pag",
-            "e does not exist. The value of useFirstPageHeaderFooter determines whether to use the defaultHeaderI",
-            "d or this value for the header on the first page. If not set, there's no first page header. This pro",
-            "perty is read-only.",
+            "The ID of the header used only for the first page. If not set then a unique header for the first pag"
+            "e does not exist. The value of useFirstPageHeaderFooter determines whether to use the defaultHeaderI"
+            "d or this value for the header on the first page. If not set, there's no first page header. This pro"
+            "perty is read-only."
         ),
         default=None,
     )
     first_page_footer_id: Optional[str] = Field(
+        alias="firstPageFooterId",
         description=(
-            "The ID of the footer used only for the first page. If not set then a unique footer for the first pag",
-            "e does not exist. The value of useFirstPageHeaderFooter determines whether to use the defaultFooterI",
-            "d or this value for the footer on the first page. If not set, there's no first page footer. This pro",
-            "perty is read-only.",
+            "The ID of the footer used only for the first page. If not set then a unique footer for the first pag"
+            "e does not exist. The value of useFirstPageHeaderFooter determines whether to use the defaultFooterI"
+            "d or this value for the footer on the first page. If not set, there's no first page footer. This pro"
+            "perty is read-only."
         ),
         default=None,
     )
     use_first_page_header_footer: Optional[bool] = Field(
+        alias="useFirstPageHeaderFooter",
         description="Indicates whether to use the first page header / footer IDs for the first page.",
         default=None,
     )
     use_even_page_header_footer: Optional[bool] = Field(
+        alias="useEvenPageHeaderFooter",
         description="Indicates whether to use the even page header / footer IDs for the even pages.",
         default=None,
     )
     page_number_start: Optional[int] = Field(
+        alias="pageNumberStart",
         description="The page number from which to start counting the number of pages.",
         default=None,
     )
     margin_top: Optional[Dimension] = Field(
+        alias="marginTop",
         description=(
-            "The top page margin. Updating the top page margin on the document style clears the top page margin o",
-            "n all section styles.",
+            "The top page margin. Updating the top page margin on the document style clears the top page margin o"
+            "n all section styles."
         ),
         default=None,
     )
     margin_bottom: Optional[Dimension] = Field(
+        alias="marginBottom",
         description=(
-            "The bottom page margin. Updating the bottom page margin on the document style clears the bottom page",
-            " margin on all section styles.",
+            "The bottom page margin. Updating the bottom page margin on the document style clears the bottom page"
+            " margin on all section styles."
         ),
         default=None,
     )
     margin_right: Optional[Dimension] = Field(
+        alias="marginRight",
         description=(
-            "The right page margin. Updating the right page margin on the document style clears the right page ma",
-            "rgin on all section styles. It may also cause columns to resize in all sections.",
+            "The right page margin. Updating the right page margin on the document style clears the right page ma"
+            "rgin on all section styles. It may also cause columns to resize in all sections."
         ),
         default=None,
     )
     margin_left: Optional[Dimension] = Field(
+        alias="marginLeft",
         description=(
-            "The left page margin. Updating the left page margin on the document style clears the left page margi",
-            "n on all section styles. It may also cause columns to resize in all sections.",
+            "The left page margin. Updating the left page margin on the document style clears the left page margi"
+            "n on all section styles. It may also cause columns to resize in all sections."
         ),
         default=None,
     )
     page_size: Optional[Size] = Field(
+        alias="pageSize",
         description="The size of a page in the document.",
         default=None,
     )
     margin_header: Optional[Dimension] = Field(
+        alias="marginHeader",
         description="The amount of space between the top of the page and the contents of the header.",
         default=None,
     )
     margin_footer: Optional[Dimension] = Field(
+        alias="marginFooter",
         description="The amount of space between the bottom of the page and the contents of the footer.",
         default=None,
     )
     use_custom_header_footer_margins: Optional[bool] = Field(
+        alias="useCustomHeaderFooterMargins",
         description=(
-            "Indicates whether DocumentStyle marginHeader, SectionStyle marginHeader and DocumentStyle marginFoot",
-            "er, SectionStyle marginFooter are respected. When false, the default values in the Docs editor for h",
-            "eader and footer margin is used. This property is read-only.",
+            "Indicates whether DocumentStyle marginHeader, SectionStyle marginHeader and DocumentStyle marginFoot"
+            "er, SectionStyle marginFooter are respected. When false, the default values in the Docs editor for h"
+            "eader and footer margin is used. This property is read-only."
         ),
         default=None,
     )
     flip_page_orientation: Optional[bool] = Field(
+        alias="flipPageOrientation",
         description=(
-            "Optional. Indicates whether to flip the dimensions of the pageSize, which allows changing the page o",
-            "rientation between portrait and landscape.",
+            "Optional. Indicates whether to flip the dimensions of the pageSize, which allows changing the page o"
+            "rientation between portrait and landscape."
         ),
         default=None,
     )
@@ -2392,24 +2477,25 @@ class EmbeddedObjectBorder(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#embeddedobjectborder
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     color: Optional[OptionalColor] = Field(
+        alias="color",
         description="The color of the border.",
         default=None,
     )
     width: Optional[Dimension] = Field(
+        alias="width",
         description="The width of the border.",
         default=None,
     )
-    dash_style: DashStyle = Field(
+    dash_style: Optional[DashStyle] = Field(
+        alias="dashStyle",
         description="The dash style of the border.",
         default=None,
     )
-    property_state: PropertyState = Field(
+    property_state: Optional[PropertyState] = Field(
+        alias="propertyState",
         description="The property state of the border property.",
         default=None,
     )
@@ -2421,67 +2507,75 @@ class EmbeddedObjectSuggestionState(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#embeddedobjectsuggestionstate
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     embedded_drawing_properties_suggestion_state: Optional[
         EmbeddedDrawingPropertiesSuggestionState
     ] = Field(
+        alias="embeddedDrawingPropertiesSuggestionState",
         description=(
-            "A mask that indicates which of the fields in embeddedDrawingProperties have been changed in this sug",
-            "gestion.",
+            "A mask that indicates which of the fields in embeddedDrawingProperties have been changed in this sug"
+            "gestion."
         ),
         default=None,
     )
     image_properties_suggestion_state: Optional[ImagePropertiesSuggestionState] = Field(
+        alias="imagePropertiesSuggestionState",
         description="A mask that indicates which of the fields in imageProperties have been changed in this suggestion.",
         default=None,
     )
     title_suggested: Optional[bool] = Field(
+        alias="titleSuggested",
         description="Indicates if there was a suggested change to title.",
         default=None,
     )
     description_suggested: Optional[bool] = Field(
+        alias="descriptionSuggested",
         description="Indicates if there was a suggested change to description.",
         default=None,
     )
     embedded_object_border_suggestion_state: Optional[
         EmbeddedObjectBorderSuggestionState
     ] = Field(
+        alias="embeddedObjectBorderSuggestionState",
         description=(
-            "A mask that indicates which of the fields in embeddedObjectBorder have been changed in this suggesti",
-            "on.",
+            "A mask that indicates which of the fields in embeddedObjectBorder have been changed in this suggesti"
+            "on."
         ),
         default=None,
     )
     size_suggestion_state: Optional[SizeSuggestionState] = Field(
+        alias="sizeSuggestionState",
         description="A mask that indicates which of the fields in size have been changed in this suggestion.",
         default=None,
     )
     margin_left_suggested: Optional[bool] = Field(
+        alias="marginLeftSuggested",
         description="Indicates if there was a suggested change to marginLeft.",
         default=None,
     )
     margin_right_suggested: Optional[bool] = Field(
+        alias="marginRightSuggested",
         description="Indicates if there was a suggested change to marginRight.",
         default=None,
     )
     margin_top_suggested: Optional[bool] = Field(
+        alias="marginTopSuggested",
         description="Indicates if there was a suggested change to marginTop.",
         default=None,
     )
     margin_bottom_suggested: Optional[bool] = Field(
+        alias="marginBottomSuggested",
         description="Indicates if there was a suggested change to marginBottom.",
         default=None,
     )
     linked_content_reference_suggestion_state: Optional[
         LinkedContentReferenceSuggestionState
     ] = Field(
+        alias="linkedContentReferenceSuggestionState",
         description=(
-            "A mask that indicates which of the fields in linkedContentReference have been changed in this sugges",
-            "tion.",
+            "A mask that indicates which of the fields in linkedContentReference have been changed in this sugges"
+            "tion."
         ),
         default=None,
     )
@@ -2493,12 +2587,10 @@ class InlineObjectPropertiesSuggestionState(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#inlineobjectpropertiessuggestionstate
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     embedded_object_suggestion_state: Optional[EmbeddedObjectSuggestionState] = Field(
+        alias="embeddedObjectSuggestionState",
         description="A mask that indicates which of the fields in embeddedObject have been changed in this suggestion.",
         default=None,
     )
@@ -2510,18 +2602,18 @@ class ListPropertiesSuggestionState(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#listpropertiessuggestionstate
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
-    nesting_levels_suggestion_states: Optional[NestingLevelSuggestionState] = Field(
-        description=(
-            "A mask that indicates which of the fields on the corresponding NestingLevel in nestingLevels have be",
-            "en changed in this suggestion. The nesting level suggestion states are returned in ascending order o",
-            "f the nesting level with the least nested returned first.",
-        ),
-        default=None,
+    nesting_levels_suggestion_states: Optional[list[NestingLevelSuggestionState]] = (
+        Field(
+            alias="nestingLevelsSuggestionStates",
+            description=(
+                "A mask that indicates which of the fields on the corresponding NestingLevel in nestingLevels have be"
+                "en changed in this suggestion. The nesting level suggestion states are returned in ascending order o"
+                "f the nesting level with the least nested returned first."
+            ),
+            default=None,
+        )
     )
 
 
@@ -2531,23 +2623,23 @@ class NamedStyleSuggestionState(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#namedstylesuggestionstate
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
-    named_style_type: NamedStyleType = Field(
+    named_style_type: Optional[NamedStyleType] = Field(
+        alias="namedStyleType",
         description=(
-            "The named style type that this suggestion state corresponds to. This field is provided as a convenie",
-            "nce for matching the NamedStyleSuggestionState with its corresponding NamedStyle.",
+            "The named style type that this suggestion state corresponds to. This field is provided as a convenie"
+            "nce for matching the NamedStyleSuggestionState with its corresponding NamedStyle."
         ),
         default=None,
     )
     text_style_suggestion_state: Optional[TextStyleSuggestionState] = Field(
+        alias="textStyleSuggestionState",
         description="A mask that indicates which of the fields in text style have been changed in this suggestion.",
         default=None,
     )
     paragraph_style_suggestion_state: Optional[ParagraphStyleSuggestionState] = Field(
+        alias="paragraphStyleSuggestionState",
         description="A mask that indicates which of the fields in paragraph style have been changed in this suggestion.",
         default=None,
     )
@@ -2559,16 +2651,14 @@ class NamedStylesSuggestionState(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#namedstylessuggestionstate
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
-    styles_suggestion_states: Optional[NamedStyleSuggestionState] = Field(
+    styles_suggestion_states: Optional[list[NamedStyleSuggestionState]] = Field(
+        alias="stylesSuggestionStates",
         description=(
-            "A mask that indicates which of the fields on the corresponding NamedStyle in styles have been change",
-            "d in this suggestion. The order of these named style suggestion states matches the order of the corr",
-            "esponding named style within the named styles suggestion.",
+            "A mask that indicates which of the fields on the corresponding NamedStyle in styles have been change"
+            "d in this suggestion. The order of these named style suggestion states matches the order of the corr"
+            "esponding named style within the named styles suggestion."
         ),
         default=None,
     )
@@ -2580,74 +2670,79 @@ class NestingLevel(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#nestinglevel
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
-    bullet_alignment: BulletAlignment = Field(
+    bullet_alignment: Optional[BulletAlignment] = Field(
+        alias="bulletAlignment",
         description="The alignment of the bullet within the space allotted for rendering the bullet.",
         default=None,
     )
     glyph_format: Optional[str] = Field(
+        alias="glyphFormat",
         description=(
-            "The format string used by bullets at this level of nesting. The glyph format contains one or more pl",
-            "aceholders, and these placeholders are replaced with the appropriate values depending on the glyphTy",
-            "pe or glyphSymbol. The placeholders follow the pattern %[nestingLevel]. Furthermore, placeholders ca",
-            "n have prefixes and suffixes. Thus, the glyph format follows the pattern %[nestingLevel]. Note that ",
-            "the prefix and suffix are optional and can be arbitrary strings. For example, the glyph format %0. i",
-            "ndicates that the rendered glyph will replace the placeholder with the corresponding glyph for nesti",
-            "ng level 0 followed by a period as the suffix. So a list with a glyph type of UPPER_ALPHA and glyph ",
-            "format %0. at nesting level 0 will result in a list with rendered glyphs A. B. C. The glyph format c",
-            "an contain placeholders for the current nesting level as well as placeholders for parent nesting lev",
-            "els. For example, a list can have a glyph format of %0. at nesting level 0 and a glyph format of %0.",
-            "%1. at nesting level 1. Assuming both nesting levels have DECIMAL glyph types, this would result in ",
-            "a list with rendered glyphs 1. 2. 2.1. 2.2. 3. For nesting levels that are ordered, the string that ",
-            "replaces a placeholder in the glyph format for a particular paragraph depends on the paragraph's ord",
-            "er within the list.",
+            "The format string used by bullets at this level of nesting. The glyph format contains one or more pl"
+            "aceholders, and these placeholders are replaced with the appropriate values depending on the glyphTy"
+            "pe or glyphSymbol. The placeholders follow the pattern %[nestingLevel]. Furthermore, placeholders ca"
+            "n have prefixes and suffixes. Thus, the glyph format follows the pattern %[nestingLevel]. Note that "
+            "the prefix and suffix are optional and can be arbitrary strings. For example, the glyph format %0. i"
+            "ndicates that the rendered glyph will replace the placeholder with the corresponding glyph for nesti"
+            "ng level 0 followed by a period as the suffix. So a list with a glyph type of UPPER_ALPHA and glyph "
+            "format %0. at nesting level 0 will result in a list with rendered glyphs A. B. C. The glyph format c"
+            "an contain placeholders for the current nesting level as well as placeholders for parent nesting lev"
+            "els. For example, a list can have a glyph format of %0. at nesting level 0 and a glyph format of %0."
+            "%1. at nesting level 1. Assuming both nesting levels have DECIMAL glyph types, this would result in "
+            "a list with rendered glyphs 1. 2. 2.1. 2.2. 3. For nesting levels that are ordered, the string that "
+            "replaces a placeholder in the glyph format for a particular paragraph depends on the paragraph's ord"
+            "er within the list."
         ),
         default=None,
     )
     indent_first_line: Optional[Dimension] = Field(
+        alias="indentFirstLine",
         description="The amount of indentation for the first line of paragraphs at this level of nesting.",
         default=None,
     )
     indent_start: Optional[Dimension] = Field(
+        alias="indentStart",
         description=(
-            "The amount of indentation for paragraphs at this level of nesting. Applied to the side that correspo",
-            "nds to the start of the text, based on the paragraph's content direction.",
+            "The amount of indentation for paragraphs at this level of nesting. Applied to the side that correspo"
+            "nds to the start of the text, based on the paragraph's content direction."
         ),
         default=None,
     )
     text_style: Optional[TextStyle] = Field(
+        alias="textStyle",
         description="The text style of bullets at this level of nesting.",
         default=None,
     )
     start_number: Optional[int] = Field(
+        alias="startNumber",
         description=(
-            "The number of the first list item at this nesting level. A value of 0 is treated as a value of 1 for",
-            " lettered lists and Roman numeral lists. For values of both 0 and 1, lettered and Roman numeral list",
-            "s will begin at a and i respectively. This value is ignored for nesting levels with unordered glyphs",
-            ".",
+            "The number of the first list item at this nesting level. A value of 0 is treated as a value of 1 for"
+            " lettered lists and Roman numeral lists. For values of both 0 and 1, lettered and Roman numeral list"
+            "s will begin at a and i respectively. This value is ignored for nesting levels with unordered glyphs"
+            "."
         ),
         default=None,
     )
-    glyph_type: GlyphType = Field(
+    glyph_type: Optional[GlyphType] = Field(
+        alias="glyphType",
         description=(
-            "The type of glyph used by bullets when paragraphs at this level of nesting is ordered. The glyph typ",
-            "e determines the type of glyph used to replace placeholders within the glyphFormat when paragraphs a",
-            "t this level of nesting are ordered. For example, if the nesting level is 0, the glyphFormat is %0. ",
-            "and the glyph type is DECIMAL, then the rendered glyph would replace the placeholder %0 in the glyph",
-            " format with a number corresponding to the list item's order within the list.",
+            "The type of glyph used by bullets when paragraphs at this level of nesting is ordered. The glyph typ"
+            "e determines the type of glyph used to replace placeholders within the glyphFormat when paragraphs a"
+            "t this level of nesting are ordered. For example, if the nesting level is 0, the glyphFormat is %0. "
+            "and the glyph type is DECIMAL, then the rendered glyph would replace the placeholder %0 in the glyph"
+            " format with a number corresponding to the list item's order within the list."
         ),
         default=None,
     )
     glyph_symbol: Optional[str] = Field(
+        alias="glyphSymbol",
         description=(
-            "A custom glyph symbol used by bullets when paragraphs at this level of nesting is unordered. The gly",
-            "ph symbol replaces placeholders within the glyphFormat. For example, if the glyphSymbol is the solid",
-            " circle corresponding to Unicode U+25cf code point and the glyphFormat is %0, the rendered glyph wou",
-            "ld be the solid circle.",
+            "A custom glyph symbol used by bullets when paragraphs at this level of nesting is unordered. The gly"
+            "ph symbol replaces placeholders within the glyphFormat. For example, if the glyphSymbol is the solid"
+            " circle corresponding to Unicode U+25cf code point and the glyphFormat is %0, the rendered glyph wou"
+            "ld be the solid circle."
         ),
         default=None,
     )
@@ -2659,157 +2754,176 @@ class ParagraphStyle(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#paragraphstyle
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     heading_id: Optional[str] = Field(
+        alias="headingId",
         description=(
-            "The heading ID of the paragraph. If empty, then this paragraph is not a heading. This property is re",
-            "ad-only.",
+            "The heading ID of the paragraph. If empty, then this paragraph is not a heading. This property is re"
+            "ad-only."
         ),
         default=None,
     )
-    named_style_type: NamedStyleType = Field(
+    named_style_type: Optional[NamedStyleType] = Field(
+        alias="namedStyleType",
         description=(
-            "The named style type of the paragraph. Since updating the named style type affects other properties ",
-            "within ParagraphStyle, the named style type is applied before the other properties are updated.",
+            "The named style type of the paragraph. Since updating the named style type affects other properties "
+            "within ParagraphStyle, the named style type is applied before the other properties are updated."
         ),
         default=None,
     )
-    alignment: Alignment = Field(
+    alignment: Optional[Alignment] = Field(
+        alias="alignment",
         description="The text alignment for this paragraph.",
         default=None,
     )
     line_spacing: Optional[float] = Field(
+        alias="lineSpacing",
         description=(
-            "The amount of space between lines, as a percentage of normal, where normal is represented as 100.0. ",
-            "If unset, the value is inherited from the parent.",
+            "The amount of space between lines, as a percentage of normal, where normal is represented as 100.0. "
+            "If unset, the value is inherited from the parent."
         ),
         default=None,
     )
-    direction: ContentDirection = Field(
+    direction: Optional[ContentDirection] = Field(
+        alias="direction",
         description=(
-            "The text direction of this paragraph. If unset, the value defaults to LEFT_TO_RIGHT since paragraph ",
-            "direction is not inherited.",
+            "The text direction of this paragraph. If unset, the value defaults to LEFT_TO_RIGHT since paragraph "
+            "direction is not inherited."
         ),
         default=None,
     )
-    spacing_mode: SpacingMode = Field(
+    spacing_mode: Optional[SpacingMode] = Field(
+        alias="spacingMode",
         description="The spacing mode for the paragraph.",
         default=None,
     )
     space_above: Optional[Dimension] = Field(
+        alias="spaceAbove",
         description="The amount of extra space above the paragraph. If unset, the value is inherited from the parent.",
         default=None,
     )
     space_below: Optional[Dimension] = Field(
+        alias="spaceBelow",
         description="The amount of extra space below the paragraph. If unset, the value is inherited from the parent.",
         default=None,
     )
     border_between: Optional[ParagraphBorder] = Field(
+        alias="borderBetween",
         description=(
-            "The border between this paragraph and the next and previous paragraphs. If unset, the value is inher",
-            "ited from the parent. The between border is rendered when the adjacent paragraph has the same border",
-            " and indent properties. Paragraph borders cannot be partially updated. When changing a paragraph bor",
-            "der, the new border must be specified in its entirety.",
+            "The border between this paragraph and the next and previous paragraphs. If unset, the value is inher"
+            "ited from the parent. The between border is rendered when the adjacent paragraph has the same border"
+            " and indent properties. Paragraph borders cannot be partially updated. When changing a paragraph bor"
+            "der, the new border must be specified in its entirety."
         ),
         default=None,
     )
     border_top: Optional[ParagraphBorder] = Field(
+        alias="borderTop",
         description=(
-            "The border at the top of this paragraph. If unset, the value is inherited from the parent. The top b",
-            "order is rendered when the paragraph above has different border and indent properties. Paragraph bor",
-            "ders cannot be partially updated. When changing a paragraph border, the new border must be specified",
-            " in its entirety.",
+            "The border at the top of this paragraph. If unset, the value is inherited from the parent. The top b"
+            "order is rendered when the paragraph above has different border and indent properties. Paragraph bor"
+            "ders cannot be partially updated. When changing a paragraph border, the new border must be specified"
+            " in its entirety."
         ),
         default=None,
     )
     border_bottom: Optional[ParagraphBorder] = Field(
+        alias="borderBottom",
         description=(
-            "The border at the bottom of this paragraph. If unset, the value is inherited from the parent. The bo",
-            "ttom border is rendered when the paragraph below has different border and indent properties. Paragra",
-            "ph borders cannot be partially updated. When changing a paragraph border, the new border must be spe",
-            "cified in its entirety.",
+            "The border at the bottom of this paragraph. If unset, the value is inherited from the parent. The bo"
+            "ttom border is rendered when the paragraph below has different border and indent properties. Paragra"
+            "ph borders cannot be partially updated. When changing a paragraph border, the new border must be spe"
+            "cified in its entirety."
         ),
         default=None,
     )
     border_left: Optional[ParagraphBorder] = Field(
+        alias="borderLeft",
         description=(
-            "The border to the left of this paragraph. If unset, the value is inherited from the parent. Paragrap",
-            "h borders cannot be partially updated. When changing a paragraph border, the new border must be spec",
-            "ified in its entirety.",
+            "The border to the left of this paragraph. If unset, the value is inherited from the parent. Paragrap"
+            "h borders cannot be partially updated. When changing a paragraph border, the new border must be spec"
+            "ified in its entirety."
         ),
         default=None,
     )
     border_right: Optional[ParagraphBorder] = Field(
+        alias="borderRight",
         description=(
-            "The border to the right of this paragraph. If unset, the value is inherited from the parent. Paragra",
-            "ph borders cannot be partially updated. When changing a paragraph border, the new border must be spe",
-            "cified in its entirety.",
+            "The border to the right of this paragraph. If unset, the value is inherited from the parent. Paragra"
+            "ph borders cannot be partially updated. When changing a paragraph border, the new border must be spe"
+            "cified in its entirety."
         ),
         default=None,
     )
     indent_first_line: Optional[Dimension] = Field(
+        alias="indentFirstLine",
         description=(
-            "The amount of indentation for the first line of the paragraph. If unset, the value is inherited from",
-            " the parent.",
+            "The amount of indentation for the first line of the paragraph. If unset, the value is inherited from"
+            " the parent."
         ),
         default=None,
     )
     indent_start: Optional[Dimension] = Field(
+        alias="indentStart",
         description=(
-            "The amount of indentation for the paragraph on the side that corresponds to the start of the text, b",
-            "ased on the current paragraph direction. If unset, the value is inherited from the parent.",
+            "The amount of indentation for the paragraph on the side that corresponds to the start of the text, b"
+            "ased on the current paragraph direction. If unset, the value is inherited from the parent."
         ),
         default=None,
     )
-    indent_end: Optional[list[Dimension]] = Field(
+    indent_end: Optional[Dimension] = Field(
+        alias="indentEnd",
         description=(
-            "The amount of indentation for the paragraph on the side that corresponds to the end of the text, bas",
-            "ed on the current paragraph direction. If unset, the value is inherited from the parent.",
+            "The amount of indentation for the paragraph on the side that corresponds to the end of the text, bas"
+            "ed on the current paragraph direction. If unset, the value is inherited from the parent."
         ),
         default=None,
     )
-    tab_stops: Optional[TabStop] = Field(
+    tab_stops: Optional[list[TabStop]] = Field(
+        alias="tabStops",
         description=(
-            "A list of the tab stops for this paragraph. The list of tab stops is not inherited. This property is",
-            " read-only.",
+            "A list of the tab stops for this paragraph. The list of tab stops is not inherited. This property is"
+            " read-only."
         ),
         default=None,
     )
     keep_lines_together: Optional[bool] = Field(
+        alias="keepLinesTogether",
         description=(
-            "Whether all lines of the paragraph should be laid out on the same page or column if possible. If uns",
-            "et, the value is inherited from the parent.",
+            "Whether all lines of the paragraph should be laid out on the same page or column if possible. If uns"
+            "et, the value is inherited from the parent."
         ),
         default=None,
     )
     keep_with_next: Optional[bool] = Field(
+        alias="keepWithNext",
         description=(
-            "Whether at least a part of this paragraph should be laid out on the same page or column as the next ",
-            "paragraph if possible. If unset, the value is inherited from the parent.",
+            "Whether at least a part of this paragraph should be laid out on the same page or column as the next "
+            "paragraph if possible. If unset, the value is inherited from the parent."
         ),
         default=None,
     )
     avoid_widow_and_orphan: Optional[bool] = Field(
+        alias="avoidWidowAndOrphan",
         description=(
-            "Whether to avoid widows and orphans for the paragraph. If unset, the value is inherited from the par",
-            "ent.",
+            "Whether to avoid widows and orphans for the paragraph. If unset, the value is inherited from the par"
+            "ent."
         ),
         default=None,
     )
     shading: Optional[Shading] = Field(
+        alias="shading",
         description="The shading of the paragraph. If unset, the value is inherited from the parent.",
         default=None,
     )
     page_break_before: Optional[bool] = Field(
+        alias="pageBreakBefore",
         description=(
-            "Whether the current paragraph should always start at the beginning of a page. If unset, the value is",
-            " inherited from the parent. Attempting to update pageBreakBefore for paragraphs in unsupported regio",
-            "ns, including Table, Header, Footer and Footnote, can result in an invalid document state that retur",
-            "ns a 400 bad request error.",
+            "Whether the current paragraph should always start at the beginning of a page. If unset, the value is"
+            " inherited from the parent. Attempting to update pageBreakBefore for paragraphs in unsupported regio"
+            "ns, including Table, Header, Footer and Footnote, can result in an invalid document state that retur"
+            "ns a 400 bad request error."
         ),
         default=None,
     )
@@ -2821,18 +2935,17 @@ class PositionedObjectPropertiesSuggestionState(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#positionedobjectpropertiessuggestionstate
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     positioning_suggestion_state: Optional[
         PositionedObjectPositioningSuggestionState
     ] = Field(
+        alias="positioningSuggestionState",
         description="A mask that indicates which of the fields in positioning have been changed in this suggestion.",
         default=None,
     )
     embedded_object_suggestion_state: Optional[EmbeddedObjectSuggestionState] = Field(
+        alias="embeddedObjectSuggestionState",
         description="A mask that indicates which of the fields in embeddedObject have been changed in this suggestion.",
         default=None,
     )
@@ -2844,23 +2957,23 @@ class SectionBreak(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#sectionbreak
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     suggested_insertion_ids: Optional[list[str]] = Field(
+        alias="suggestedInsertionIds",
         description=(
-            "The suggested insertion IDs. A SectionBreak may have multiple insertion IDs if it's a nested suggest",
-            "ed change. If empty, then this is not a suggested insertion.",
+            "The suggested insertion IDs. A SectionBreak may have multiple insertion IDs if it's a nested suggest"
+            "ed change. If empty, then this is not a suggested insertion."
         ),
         default=None,
     )
-    suggested_deletion_ids: Optional[str] = Field(
+    suggested_deletion_ids: Optional[list[str]] = Field(
+        alias="suggestedDeletionIds",
         description="The suggested deletion IDs. If empty, then there are no suggested deletions of this content.",
         default=None,
     )
-    section_style: Optional[list[SectionStyle]] = Field(
+    section_style: Optional[SectionStyle] = Field(
+        alias="sectionStyle",
         description="The style of the section after this section break.",
         default=None,
     )
@@ -2872,19 +2985,18 @@ class SuggestedBullet(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#suggestedbullet
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     bullet: Optional[Bullet] = Field(
+        alias="bullet",
         description=(
-            "A Bullet that only includes the changes made in this suggestion. This can be used along with the bul",
-            "letSuggestionState to see which fields have changed and their new values.",
+            "A Bullet that only includes the changes made in this suggestion. This can be used along with the bul"
+            "letSuggestionState to see which fields have changed and their new values."
         ),
         default=None,
     )
     bullet_suggestion_state: Optional[BulletSuggestionState] = Field(
+        alias="bulletSuggestionState",
         description="A mask that indicates which of the fields on the base Bullet have been changed in this suggestion.",
         default=None,
     )
@@ -2896,22 +3008,21 @@ class SuggestedDocumentStyle(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#suggesteddocumentstyle
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     document_style: Optional[DocumentStyle] = Field(
+        alias="documentStyle",
         description=(
-            "A DocumentStyle that only includes the changes made in this suggestion. This can be used along with ",
-            "the documentStyleSuggestionState to see which fields have changed and their new values.",
+            "A DocumentStyle that only includes the changes made in this suggestion. This can be used along with "
+            "the documentStyleSuggestionState to see which fields have changed and their new values."
         ),
         default=None,
     )
     document_style_suggestion_state: Optional[DocumentStyleSuggestionState] = Field(
+        alias="documentStyleSuggestionState",
         description=(
-            "A mask that indicates which of the fields on the base DocumentStyle have been changed in this sugges",
-            "tion.",
+            "A mask that indicates which of the fields on the base DocumentStyle have been changed in this sugges"
+            "tion."
         ),
         default=None,
     )
@@ -2923,22 +3034,21 @@ class SuggestedParagraphStyle(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#suggestedparagraphstyle
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     paragraph_style: Optional[ParagraphStyle] = Field(
+        alias="paragraphStyle",
         description=(
-            "A ParagraphStyle that only includes the changes made in this suggestion. This can be used along with",
-            " the paragraphStyleSuggestionState to see which fields have changed and their new values.",
+            "A ParagraphStyle that only includes the changes made in this suggestion. This can be used along with"
+            " the paragraphStyleSuggestionState to see which fields have changed and their new values."
         ),
         default=None,
     )
     paragraph_style_suggestion_state: Optional[ParagraphStyleSuggestionState] = Field(
+        alias="paragraphStyleSuggestionState",
         description=(
-            "A mask that indicates which of the fields on the base ParagraphStyle have been changed in this sugge",
-            "stion.",
+            "A mask that indicates which of the fields on the base ParagraphStyle have been changed in this sugge"
+            "stion."
         ),
         default=None,
     )
@@ -2950,22 +3060,21 @@ class SuggestedTableCellStyle(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#suggestedtablecellstyle
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     table_cell_style: Optional[TableCellStyle] = Field(
+        alias="tableCellStyle",
         description=(
-            "A TableCellStyle that only includes the changes made in this suggestion. This can be used along with",
-            " the tableCellStyleSuggestionState to see which fields have changed and their new values.",
+            "A TableCellStyle that only includes the changes made in this suggestion. This can be used along with"
+            " the tableCellStyleSuggestionState to see which fields have changed and their new values."
         ),
         default=None,
     )
     table_cell_style_suggestion_state: Optional[TableCellStyleSuggestionState] = Field(
+        alias="tableCellStyleSuggestionState",
         description=(
-            "A mask that indicates which of the fields on the base TableCellStyle have been changed in this sugge",
-            "stion.",
+            "A mask that indicates which of the fields on the base TableCellStyle have been changed in this sugge"
+            "stion."
         ),
         default=None,
     )
@@ -2977,22 +3086,21 @@ class SuggestedTableRowStyle(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#suggestedtablerowstyle
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     table_row_style: Optional[TableRowStyle] = Field(
+        alias="tableRowStyle",
         description=(
-            "A TableRowStyle that only includes the changes made in this suggestion. This can be used along with ",
-            "the tableRowStyleSuggestionState to see which fields have changed and their new values.",
+            "A TableRowStyle that only includes the changes made in this suggestion. This can be used along with "
+            "the tableRowStyleSuggestionState to see which fields have changed and their new values."
         ),
         default=None,
     )
     table_row_style_suggestion_state: Optional[TableRowStyleSuggestionState] = Field(
+        alias="tableRowStyleSuggestionState",
         description=(
-            "A mask that indicates which of the fields on the base TableRowStyle have been changed in this sugges",
-            "tion.",
+            "A mask that indicates which of the fields on the base TableRowStyle have been changed in this sugges"
+            "tion."
         ),
         default=None,
     )
@@ -3004,22 +3112,21 @@ class SuggestedTextStyle(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#suggestedtextstyle
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     text_style: Optional[TextStyle] = Field(
+        alias="textStyle",
         description=(
-            "A TextStyle that only includes the changes made in this suggestion. This can be used along with the ",
-            "textStyleSuggestionState to see which fields have changed and their new values.",
+            "A TextStyle that only includes the changes made in this suggestion. This can be used along with the "
+            "textStyleSuggestionState to see which fields have changed and their new values."
         ),
         default=None,
     )
     text_style_suggestion_state: Optional[TextStyleSuggestionState] = Field(
+        alias="textStyleSuggestionState",
         description=(
-            "A mask that indicates which of the fields on the base TextStyle have been changed in this suggestion",
-            ".",
+            "A mask that indicates which of the fields on the base TextStyle have been changed in this suggestion"
+            "."
         ),
         default=None,
     )
@@ -3031,34 +3138,36 @@ class TextRun(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#textrun
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
-    content: Optional[list[str]] = Field(
+    content: Optional[str] = Field(
+        alias="content",
         description=(
-            "The text of this run. Any non-text elements in the run are replaced with the Unicode character U+E90",
-            "7.",
+            "The text of this run. Any non-text elements in the run are replaced with the Unicode character U+E90"
+            "7."
         ),
         default=None,
     )
     suggested_insertion_ids: Optional[list[str]] = Field(
+        alias="suggestedInsertionIds",
         description=(
-            "The suggested insertion IDs. A TextRun may have multiple insertion IDs if it's a nested suggested ch",
-            "ange. If empty, then this is not a suggested insertion.",
+            "The suggested insertion IDs. A TextRun may have multiple insertion IDs if it's a nested suggested ch"
+            "ange. If empty, then this is not a suggested insertion."
         ),
         default=None,
     )
-    suggested_deletion_ids: Optional[str] = Field(
+    suggested_deletion_ids: Optional[list[str]] = Field(
+        alias="suggestedDeletionIds",
         description="The suggested deletion IDs. If empty, then there are no suggested deletions of this content.",
         default=None,
     )
     text_style: Optional[TextStyle] = Field(
+        alias="textStyle",
         description="The text style of this run.",
         default=None,
     )
     suggested_text_style_changes: Optional[dict[str, SuggestedTextStyle]] = Field(
+        alias="suggestedTextStyleChanges",
         description="The suggested text style changes to this run, keyed by suggestion ID.",
         default=None,
     )
@@ -3070,31 +3179,33 @@ class AutoText(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#autotext
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
-    type: Type = Field(
+    type: Optional[Type] = Field(
+        alias="type",
         description="The type of this auto text.",
         default=None,
     )
     suggested_insertion_ids: Optional[list[str]] = Field(
+        alias="suggestedInsertionIds",
         description=(
-            "The suggested insertion IDs. An AutoText may have multiple insertion IDs if it's a nested suggested ",
-            "change. If empty, then this is not a suggested insertion.",
+            "The suggested insertion IDs. An AutoText may have multiple insertion IDs if it's a nested suggested "
+            "change. If empty, then this is not a suggested insertion."
         ),
         default=None,
     )
-    suggested_deletion_ids: Optional[str] = Field(
+    suggested_deletion_ids: Optional[list[str]] = Field(
+        alias="suggestedDeletionIds",
         description="The suggested deletion IDs. If empty, then there are no suggested deletions of this content.",
         default=None,
     )
     text_style: Optional[TextStyle] = Field(
+        alias="textStyle",
         description="The text style of this AutoText.",
         default=None,
     )
     suggested_text_style_changes: Optional[dict[str, SuggestedTextStyle]] = Field(
+        alias="suggestedTextStyleChanges",
         description="The suggested text style changes to this AutoText, keyed by suggestion ID.",
         default=None,
     )
@@ -3106,31 +3217,32 @@ class ColumnBreak(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#columnbreak
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     suggested_insertion_ids: Optional[list[str]] = Field(
+        alias="suggestedInsertionIds",
         description=(
-            "The suggested insertion IDs. A ColumnBreak may have multiple insertion IDs if it's a nested suggeste",
-            "d change. If empty, then this is not a suggested insertion.",
+            "The suggested insertion IDs. A ColumnBreak may have multiple insertion IDs if it's a nested suggeste"
+            "d change. If empty, then this is not a suggested insertion."
         ),
         default=None,
     )
-    suggested_deletion_ids: Optional[str] = Field(
+    suggested_deletion_ids: Optional[list[str]] = Field(
+        alias="suggestedDeletionIds",
         description="The suggested deletion IDs. If empty, then there are no suggested deletions of this content.",
         default=None,
     )
     text_style: Optional[TextStyle] = Field(
+        alias="textStyle",
         description=(
-            "The text style of this ColumnBreak. Similar to text content, like text runs and footnote references,",
-            " the text style of a column break can affect content layout as well as the styling of text inserted ",
-            "next to it.",
+            "The text style of this ColumnBreak. Similar to text content, like text runs and footnote references,"
+            " the text style of a column break can affect content layout as well as the styling of text inserted "
+            "next to it."
         ),
         default=None,
     )
     suggested_text_style_changes: Optional[dict[str, SuggestedTextStyle]] = Field(
+        alias="suggestedTextStyleChanges",
         description="The suggested text style changes to this ColumnBreak, keyed by suggestion ID.",
         default=None,
     )
@@ -3142,59 +3254,67 @@ class EmbeddedObject(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#embeddedobject
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     title: Optional[str] = Field(
+        alias="title",
         description="The title of the embedded object. The title and description are both combined to display alt text.",
         default=None,
     )
     description: Optional[str] = Field(
+        alias="description",
         description=(
-            "The description of the embedded object. The title and description are both combined to display alt t",
-            "ext.",
+            "The description of the embedded object. The title and description are both combined to display alt t"
+            "ext."
         ),
         default=None,
     )
     embedded_object_border: Optional[EmbeddedObjectBorder] = Field(
+        alias="embeddedObjectBorder",
         description="The border of the embedded object.",
         default=None,
     )
     size: Optional[Size] = Field(
+        alias="size",
         description="The visible size of the image after cropping.",
         default=None,
     )
     margin_top: Optional[Dimension] = Field(
+        alias="marginTop",
         description="The top margin of the embedded object.",
         default=None,
     )
     margin_bottom: Optional[Dimension] = Field(
+        alias="marginBottom",
         description="The bottom margin of the embedded object.",
         default=None,
     )
     margin_right: Optional[Dimension] = Field(
+        alias="marginRight",
         description="The right margin of the embedded object.",
         default=None,
     )
     margin_left: Optional[Dimension] = Field(
+        alias="marginLeft",
         description="The left margin of the embedded object.",
         default=None,
     )
     linked_content_reference: Optional[LinkedContentReference] = Field(
+        alias="linkedContentReference",
         description=(
-            "A reference to the external linked source content. For example, it contains a reference to the sourc",
-            "e Google Sheets chart when the embedded object is a linked chart. If unset, then the embedded object",
-            " is not linked.",
+            "A reference to the external linked source content. For example, it contains a reference to the sourc"
+            "e Google Sheets chart when the embedded object is a linked chart. If unset, then the embedded object"
+            " is not linked."
         ),
         default=None,
     )
     embedded_drawing_properties: Optional[EmbeddedDrawingProperties] = Field(
+        alias="embeddedDrawingProperties",
         description="The properties of an embedded drawing.",
         default=None,
     )
     image_properties: Optional[ImageProperties] = Field(
+        alias="imageProperties",
         description="The properties of an image.",
         default=None,
     )
@@ -3206,35 +3326,38 @@ class FootnoteReference(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#footnotereference
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     footnote_id: Optional[str] = Field(
+        alias="footnoteId",
         description="The ID of the footnote that contains the content of this footnote reference.",
         default=None,
     )
-    footnote_number: Optional[list[str]] = Field(
+    footnote_number: Optional[str] = Field(
+        alias="footnoteNumber",
         description="The rendered number of this footnote.",
         default=None,
     )
     suggested_insertion_ids: Optional[list[str]] = Field(
+        alias="suggestedInsertionIds",
         description=(
-            "The suggested insertion IDs. A FootnoteReference may have multiple insertion IDs if it's a nested su",
-            "ggested change. If empty, then this is not a suggested insertion.",
+            "The suggested insertion IDs. A FootnoteReference may have multiple insertion IDs if it's a nested su"
+            "ggested change. If empty, then this is not a suggested insertion."
         ),
         default=None,
     )
-    suggested_deletion_ids: Optional[str] = Field(
+    suggested_deletion_ids: Optional[list[str]] = Field(
+        alias="suggestedDeletionIds",
         description="The suggested deletion IDs. If empty, then there are no suggested deletions of this content.",
         default=None,
     )
     text_style: Optional[TextStyle] = Field(
+        alias="textStyle",
         description="The text style of this FootnoteReference.",
         default=None,
     )
-    suggested_text_style_changes: Optional[list[dict[str, SuggestedTextStyle]]] = Field(
+    suggested_text_style_changes: Optional[dict[str, SuggestedTextStyle]] = Field(
+        alias="suggestedTextStyleChanges",
         description="The suggested text style changes to this FootnoteReference, keyed by suggestion ID.",
         default=None,
     )
@@ -3246,31 +3369,32 @@ class HorizontalRule(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#horizontalrule
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     suggested_insertion_ids: Optional[list[str]] = Field(
+        alias="suggestedInsertionIds",
         description=(
-            "The suggested insertion IDs. A HorizontalRule may have multiple insertion IDs if it is a nested sugg",
-            "ested change. If empty, then this is not a suggested insertion.",
+            "The suggested insertion IDs. A HorizontalRule may have multiple insertion IDs if it is a nested sugg"
+            "ested change. If empty, then this is not a suggested insertion."
         ),
         default=None,
     )
-    suggested_deletion_ids: Optional[str] = Field(
+    suggested_deletion_ids: Optional[list[str]] = Field(
+        alias="suggestedDeletionIds",
         description="The suggested deletion IDs. If empty, then there are no suggested deletions of this content.",
         default=None,
     )
     text_style: Optional[TextStyle] = Field(
+        alias="textStyle",
         description=(
-            "The text style of this HorizontalRule. Similar to text content, like text runs and footnote referenc",
-            "es, the text style of a horizontal rule can affect content layout as well as the styling of text ins",
-            "erted next to it.",
+            "The text style of this HorizontalRule. Similar to text content, like text runs and footnote referenc"
+            "es, the text style of a horizontal rule can affect content layout as well as the styling of text ins"
+            "erted next to it."
         ),
         default=None,
     )
-    suggested_text_style_changes: Optional[list[dict[str, SuggestedTextStyle]]] = Field(
+    suggested_text_style_changes: Optional[dict[str, SuggestedTextStyle]] = Field(
+        alias="suggestedTextStyleChanges",
         description="The suggested text style changes to this HorizontalRule, keyed by suggestion ID.",
         default=None,
     )
@@ -3282,35 +3406,37 @@ class InlineObjectElement(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#inlineobjectelement
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
-    inline_object_id: Optional[list[str]] = Field(
+    inline_object_id: Optional[str] = Field(
+        alias="inlineObjectId",
         description="The ID of the InlineObject this element contains.",
         default=None,
     )
     suggested_insertion_ids: Optional[list[str]] = Field(
+        alias="suggestedInsertionIds",
         description=(
-            "The suggested insertion IDs. An InlineObjectElement may have multiple insertion IDs if it's a nested",
-            " suggested change. If empty, then this is not a suggested insertion.",
+            "The suggested insertion IDs. An InlineObjectElement may have multiple insertion IDs if it's a nested"
+            " suggested change. If empty, then this is not a suggested insertion."
         ),
         default=None,
     )
-    suggested_deletion_ids: Optional[str] = Field(
+    suggested_deletion_ids: Optional[list[str]] = Field(
+        alias="suggestedDeletionIds",
         description="The suggested deletion IDs. If empty, then there are no suggested deletions of this content.",
         default=None,
     )
     text_style: Optional[TextStyle] = Field(
+        alias="textStyle",
         description=(
-            "The text style of this InlineObjectElement. Similar to text content, like text runs and footnote ref",
-            "erences, the text style of an inline object element can affect content layout as well as the styling",
-            " of text inserted next to it.",
+            "The text style of this InlineObjectElement. Similar to text content, like text runs and footnote ref"
+            "erences, the text style of an inline object element can affect content layout as well as the styling"
+            " of text inserted next to it."
         ),
         default=None,
     )
     suggested_text_style_changes: Optional[dict[str, SuggestedTextStyle]] = Field(
+        alias="suggestedTextStyleChanges",
         description="The suggested text style changes to this InlineObject, keyed by suggestion ID.",
         default=None,
     )
@@ -3322,12 +3448,10 @@ class InlineObjectProperties(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#inlineobjectproperties
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     embedded_object: Optional[EmbeddedObject] = Field(
+        alias="embeddedObject",
         description="The embedded object of this inline object.",
         default=None,
     )
@@ -3339,17 +3463,15 @@ class ListProperties(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#listproperties
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
-    nesting_levels: Optional[NestingLevel] = Field(
+    nesting_levels: Optional[list[NestingLevel]] = Field(
+        alias="nestingLevels",
         description=(
-            "Describes the properties of the bullets at the associated level. A list has at most 9 levels of nest",
-            "ing with nesting level 0 corresponding to the top-most level and nesting level 8 corresponding to th",
-            "e most nested level. The nesting levels are returned in ascending order with the least nested return",
-            "ed first.",
+            "Describes the properties of the bullets at the associated level. A list has at most 9 levels of nest"
+            "ing with nesting level 0 corresponding to the top-most level and nesting level 8 corresponding to th"
+            "e most nested level. The nesting levels are returned in ascending order with the least nested return"
+            "ed first."
         ),
         default=None,
     )
@@ -3361,20 +3483,20 @@ class NamedStyle(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#namedstyle
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
-    named_style_type: NamedStyleType = Field(
+    named_style_type: Optional[NamedStyleType] = Field(
+        alias="namedStyleType",
         description="The type of this named style.",
         default=None,
     )
     text_style: Optional[TextStyle] = Field(
+        alias="textStyle",
         description="The text style of this named style.",
         default=None,
     )
     paragraph_style: Optional[ParagraphStyle] = Field(
+        alias="paragraphStyle",
         description="The paragraph style of this named style.",
         default=None,
     )
@@ -3386,12 +3508,10 @@ class NamedStyles(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#namedstyles
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
-    styles: Optional[NamedStyle] = Field(
+    styles: Optional[list[NamedStyle]] = Field(
+        alias="styles",
         description="The named styles. There's an entry for each of the possible named style types.",
         default=None,
     )
@@ -3403,31 +3523,32 @@ class PageBreak(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#pagebreak
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     suggested_insertion_ids: Optional[list[str]] = Field(
+        alias="suggestedInsertionIds",
         description=(
-            "The suggested insertion IDs. A PageBreak may have multiple insertion IDs if it's a nested suggested ",
-            "change. If empty, then this is not a suggested insertion.",
+            "The suggested insertion IDs. A PageBreak may have multiple insertion IDs if it's a nested suggested "
+            "change. If empty, then this is not a suggested insertion."
         ),
         default=None,
     )
-    suggested_deletion_ids: Optional[str] = Field(
+    suggested_deletion_ids: Optional[list[str]] = Field(
+        alias="suggestedDeletionIds",
         description="The suggested deletion IDs. If empty, then there are no suggested deletions of this content.",
         default=None,
     )
     text_style: Optional[TextStyle] = Field(
+        alias="textStyle",
         description=(
-            "The text style of this PageBreak. Similar to text content, like text runs and footnote references, t",
-            "he text style of a page break can affect content layout as well as the styling of text inserted next",
-            " to it.",
+            "The text style of this PageBreak. Similar to text content, like text runs and footnote references, t"
+            "he text style of a page break can affect content layout as well as the styling of text inserted next"
+            " to it."
         ),
         default=None,
     )
-    suggested_text_style_changes: Optional[list[dict[str, SuggestedTextStyle]]] = Field(
+    suggested_text_style_changes: Optional[dict[str, SuggestedTextStyle]] = Field(
+        alias="suggestedTextStyleChanges",
         description="The suggested text style changes to this PageBreak, keyed by suggestion ID.",
         default=None,
     )
@@ -3439,40 +3560,43 @@ class Person(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#person
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
-    person_id: Optional[list[str]] = Field(
+    person_id: Optional[str] = Field(
+        alias="personId",
         description="Output only. The unique ID of this link.",
         default=None,
     )
     suggested_insertion_ids: Optional[list[str]] = Field(
+        alias="suggestedInsertionIds",
         description=(
-            "IDs for suggestions that insert this person link into the document. A Person might have multiple ins",
-            "ertion IDs if it's a nested suggested change (a suggestion within a suggestion made by a different u",
-            "ser, for example). If empty, then this person link isn't a suggested insertion.",
+            "IDs for suggestions that insert this person link into the document. A Person might have multiple ins"
+            "ertion IDs if it's a nested suggested change (a suggestion within a suggestion made by a different u"
+            "ser, for example). If empty, then this person link isn't a suggested insertion."
         ),
         default=None,
     )
-    suggested_deletion_ids: Optional[str] = Field(
+    suggested_deletion_ids: Optional[list[str]] = Field(
+        alias="suggestedDeletionIds",
         description=(
-            "IDs for suggestions that remove this person link from the document. A Person might have multiple del",
-            "etion IDs if, for example, multiple users suggest deleting it. If empty, then this person link isn't",
-            " suggested for deletion.",
+            "IDs for suggestions that remove this person link from the document. A Person might have multiple del"
+            "etion IDs if, for example, multiple users suggest deleting it. If empty, then this person link isn't"
+            " suggested for deletion."
         ),
         default=None,
     )
     text_style: Optional[TextStyle] = Field(
+        alias="textStyle",
         description="The text style of this Person.",
         default=None,
     )
     suggested_text_style_changes: Optional[dict[str, SuggestedTextStyle]] = Field(
+        alias="suggestedTextStyleChanges",
         description="The suggested text style changes to this Person, keyed by suggestion ID.",
         default=None,
     )
     person_properties: Optional[PersonProperties] = Field(
+        alias="personProperties",
         description="Output only. The properties of this Person. This field is always present.",
         default=None,
     )
@@ -3484,19 +3608,18 @@ class PositionedObjectProperties(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#positionedobjectproperties
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     positioning: Optional[PositionedObjectPositioning] = Field(
+        alias="positioning",
         description=(
-            "The positioning of this positioned object relative to the newline of the Paragraph that references t",
-            "his positioned object.",
+            "The positioning of this positioned object relative to the newline of the Paragraph that references t"
+            "his positioned object."
         ),
         default=None,
     )
     embedded_object: Optional[EmbeddedObject] = Field(
+        alias="embeddedObject",
         description="The embedded object of this positioned object.",
         default=None,
     )
@@ -3508,40 +3631,43 @@ class RichLink(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#richlink
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
-    rich_link_id: Optional[list[str]] = Field(
+    rich_link_id: Optional[str] = Field(
+        alias="richLinkId",
         description="Output only. The ID of this link.",
         default=None,
     )
     suggested_insertion_ids: Optional[list[str]] = Field(
+        alias="suggestedInsertionIds",
         description=(
-            "IDs for suggestions that insert this link into the document. A RichLink might have multiple insertio",
-            "n IDs if it's a nested suggested change (a suggestion within a suggestion made by a different user, ",
-            "for example). If empty, then this person link isn't a suggested insertion.",
+            "IDs for suggestions that insert this link into the document. A RichLink might have multiple insertio"
+            "n IDs if it's a nested suggested change (a suggestion within a suggestion made by a different user, "
+            "for example). If empty, then this person link isn't a suggested insertion."
         ),
         default=None,
     )
-    suggested_deletion_ids: Optional[str] = Field(
+    suggested_deletion_ids: Optional[list[str]] = Field(
+        alias="suggestedDeletionIds",
         description=(
-            "IDs for suggestions that remove this link from the document. A RichLink might have multiple deletion",
-            " IDs if, for example, multiple users suggest deleting it. If empty, then this person link isn't sugg",
-            "ested for deletion.",
+            "IDs for suggestions that remove this link from the document. A RichLink might have multiple deletion"
+            " IDs if, for example, multiple users suggest deleting it. If empty, then this person link isn't sugg"
+            "ested for deletion."
         ),
         default=None,
     )
     text_style: Optional[TextStyle] = Field(
+        alias="textStyle",
         description="The text style of this RichLink.",
         default=None,
     )
     suggested_text_style_changes: Optional[dict[str, SuggestedTextStyle]] = Field(
+        alias="suggestedTextStyleChanges",
         description="The suggested text style changes to this RichLink, keyed by suggestion ID.",
         default=None,
     )
     rich_link_properties: Optional[RichLinkProperties] = Field(
+        alias="richLinkProperties",
         description="Output only. The properties of this RichLink. This field is always present.",
         default=None,
     )
@@ -3553,25 +3679,24 @@ class SuggestedInlineObjectProperties(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#suggestedinlineobjectproperties
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     inline_object_properties: Optional[InlineObjectProperties] = Field(
+        alias="inlineObjectProperties",
         description=(
-            "An InlineObjectProperties that only includes the changes made in this suggestion. This can be used a",
-            "long with the inlineObjectPropertiesSuggestionState to see which fields have changed and their new v",
-            "alues.",
+            "An InlineObjectProperties that only includes the changes made in this suggestion. This can be used a"
+            "long with the inlineObjectPropertiesSuggestionState to see which fields have changed and their new v"
+            "alues."
         ),
         default=None,
     )
     inline_object_properties_suggestion_state: Optional[
         InlineObjectPropertiesSuggestionState
     ] = Field(
+        alias="inlineObjectPropertiesSuggestionState",
         description=(
-            "A mask that indicates which of the fields on the base InlineObjectProperties have been changed in th",
-            "is suggestion.",
+            "A mask that indicates which of the fields on the base InlineObjectProperties have been changed in th"
+            "is suggestion."
         ),
         default=None,
     )
@@ -3583,26 +3708,23 @@ class SuggestedListProperties(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#suggestedlistproperties
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     list_properties: Optional[ListProperties] = Field(
+        alias="listProperties",
         description=(
-            "A ListProperties that only includes the changes made in this suggestion. This can be used along with",
-            " the listPropertiesSuggestionState to see which fields have changed and their new values.",
+            "A ListProperties that only includes the changes made in this suggestion. This can be used along with"
+            " the listPropertiesSuggestionState to see which fields have changed and their new values."
         ),
         default=None,
     )
-    list_properties_suggestion_state: Optional[list[ListPropertiesSuggestionState]] = (
-        Field(
-            description=(
-                "A mask that indicates which of the fields on the base ListProperties have been changed in this sugge",
-                "stion.",
-            ),
-            default=None,
-        )
+    list_properties_suggestion_state: Optional[ListPropertiesSuggestionState] = Field(
+        alias="listPropertiesSuggestionState",
+        description=(
+            "A mask that indicates which of the fields on the base ListProperties have been changed in this sugge"
+            "stion."
+        ),
+        default=None,
     )
 
 
@@ -3612,22 +3734,21 @@ class SuggestedNamedStyles(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#suggestednamedstyles
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     named_styles: Optional[NamedStyles] = Field(
+        alias="namedStyles",
         description=(
-            "A NamedStyles that only includes the changes made in this suggestion. This can be used along with th",
-            "e namedStylesSuggestionState to see which fields have changed and their new values.",
+            "A NamedStyles that only includes the changes made in this suggestion. This can be used along with th"
+            "e namedStylesSuggestionState to see which fields have changed and their new values."
         ),
         default=None,
     )
-    named_styles_suggestion_state: Optional[list[NamedStylesSuggestionState]] = Field(
+    named_styles_suggestion_state: Optional[NamedStylesSuggestionState] = Field(
+        alias="namedStylesSuggestionState",
         description=(
-            "A mask that indicates which of the fields on the base NamedStyles have been changed in this suggesti",
-            "on.",
+            "A mask that indicates which of the fields on the base NamedStyles have been changed in this suggesti"
+            "on."
         ),
         default=None,
     )
@@ -3639,25 +3760,24 @@ class SuggestedPositionedObjectProperties(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#suggestedpositionedobjectproperties
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     positioned_object_properties: Optional[PositionedObjectProperties] = Field(
+        alias="positionedObjectProperties",
         description=(
-            "A PositionedObjectProperties that only includes the changes made in this suggestion. This can be use",
-            "d along with the positionedObjectPropertiesSuggestionState to see which fields have changed and thei",
-            "r new values.",
+            "A PositionedObjectProperties that only includes the changes made in this suggestion. This can be use"
+            "d along with the positionedObjectPropertiesSuggestionState to see which fields have changed and thei"
+            "r new values."
         ),
         default=None,
     )
     positioned_object_properties_suggestion_state: Optional[
         PositionedObjectPropertiesSuggestionState
     ] = Field(
+        alias="positionedObjectPropertiesSuggestionState",
         description=(
-            "A mask that indicates which of the fields on the base PositionedObjectProperties have been changed i",
-            "n this suggestion.",
+            "A mask that indicates which of the fields on the base PositionedObjectProperties have been changed i"
+            "n this suggestion."
         ),
         default=None,
     )
@@ -3669,30 +3789,32 @@ class InlineObject(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#inlineobject
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     object_id: Optional[str] = Field(
+        alias="objectId",
         description="The ID of this inline object. Can be used to update an object’s properties.",
         default=None,
     )
     inline_object_properties: Optional[InlineObjectProperties] = Field(
+        alias="inlineObjectProperties",
         description="The properties of this inline object.",
         default=None,
     )
     suggested_inline_object_properties_changes: Optional[
         dict[str, SuggestedInlineObjectProperties]
     ] = Field(
+        alias="suggestedInlineObjectPropertiesChanges",
         description="The suggested changes to the inline object properties, keyed by suggestion ID.",
         default=None,
     )
-    suggested_insertion_id: Optional[list[str]] = Field(
+    suggested_insertion_id: Optional[str] = Field(
+        alias="suggestedInsertionId",
         description="The suggested insertion ID. If empty, then this is not a suggested insertion.",
         default=None,
     )
-    suggested_deletion_ids: Optional[str] = Field(
+    suggested_deletion_ids: Optional[list[str]] = Field(
+        alias="suggestedDeletionIds",
         description="The suggested deletion IDs. If empty, then there are no suggested deletions of this content.",
         default=None,
     )
@@ -3704,26 +3826,27 @@ class List(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#list
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     list_properties: Optional[ListProperties] = Field(
+        alias="listProperties",
         description="The properties of the list.",
         default=None,
     )
     suggested_list_properties_changes: Optional[dict[str, SuggestedListProperties]] = (
         Field(
+            alias="suggestedListPropertiesChanges",
             description="The suggested changes to the list properties, keyed by suggestion ID.",
             default=None,
         )
     )
-    suggested_insertion_id: Optional[list[str]] = Field(
+    suggested_insertion_id: Optional[str] = Field(
+        alias="suggestedInsertionId",
         description="The suggested insertion ID. If empty, then this is not a suggested insertion.",
         default=None,
     )
     suggested_deletion_ids: Optional[list[str]] = Field(
+        alias="suggestedDeletionIds",
         description="The suggested deletion IDs. If empty, then there are no suggested deletions of this list.",
         default=None,
     )
@@ -3735,59 +3858,68 @@ class ParagraphElement(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#paragraphelement
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     start_index: Optional[int] = Field(
+        alias="startIndex",
         description="The zero-based start index of this paragraph element, in UTF-16 code units.",
         default=None,
     )
     end_index: Optional[int] = Field(
+        alias="endIndex",
         description="The zero-base end index of this paragraph element, exclusive, in UTF-16 code units.",
         default=None,
     )
     text_run: Optional[TextRun] = Field(
+        alias="textRun",
         description="A text run paragraph element.",
         default=None,
     )
     auto_text: Optional[AutoText] = Field(
+        alias="autoText",
         description="An auto text paragraph element.",
         default=None,
     )
     page_break: Optional[PageBreak] = Field(
+        alias="pageBreak",
         description="A page break paragraph element.",
         default=None,
     )
     column_break: Optional[ColumnBreak] = Field(
+        alias="columnBreak",
         description="A column break paragraph element.",
         default=None,
     )
     footnote_reference: Optional[FootnoteReference] = Field(
+        alias="footnoteReference",
         description="A footnote reference paragraph element.",
         default=None,
     )
     horizontal_rule: Optional[HorizontalRule] = Field(
+        alias="horizontalRule",
         description="A horizontal rule paragraph element.",
         default=None,
     )
     equation: Optional[Equation] = Field(
+        alias="equation",
         description="An equation paragraph element.",
         default=None,
     )
     inline_object_element: Optional[InlineObjectElement] = Field(
+        alias="inlineObjectElement",
         description="An inline object paragraph element.",
         default=None,
     )
     person: Optional[Person] = Field(
+        alias="person",
         description="A paragraph element that links to a person or email address.",
         default=None,
     )
     rich_link: Optional[RichLink] = Field(
+        alias="richLink",
         description=(
-            "A paragraph element that links to a Google resource (such as a file in Google Drive, a YouTube video",
-            ", or a Calendar event.)",
+            "A paragraph element that links to a Google resource (such as a file in Google Drive, a YouTube video"
+            ", or a Calendar event.)"
         ),
         default=None,
     )
@@ -3799,30 +3931,32 @@ class PositionedObject(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#positionedobject
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     object_id: Optional[str] = Field(
+        alias="objectId",
         description="The ID of this positioned object.",
         default=None,
     )
     positioned_object_properties: Optional[PositionedObjectProperties] = Field(
+        alias="positionedObjectProperties",
         description="The properties of this positioned object.",
         default=None,
     )
     suggested_positioned_object_properties_changes: Optional[
         dict[str, SuggestedPositionedObjectProperties]
     ] = Field(
+        alias="suggestedPositionedObjectPropertiesChanges",
         description="The suggested changes to the positioned object properties, keyed by suggestion ID.",
         default=None,
     )
-    suggested_insertion_id: Optional[list[str]] = Field(
+    suggested_insertion_id: Optional[str] = Field(
+        alias="suggestedInsertionId",
         description="The suggested insertion ID. If empty, then this is not a suggested insertion.",
         default=None,
     )
-    suggested_deletion_ids: Optional[str] = Field(
+    suggested_deletion_ids: Optional[list[str]] = Field(
+        alias="suggestedDeletionIds",
         description="The suggested deletion IDs. If empty, then there are no suggested deletions of this content.",
         default=None,
     )
@@ -3834,41 +3968,45 @@ class Paragraph(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#paragraph
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
-    elements: Optional[ParagraphElement] = Field(
+    elements: Optional[list[ParagraphElement]] = Field(
+        alias="elements",
         description="The content of the paragraph, broken down into its component parts.",
         default=None,
     )
     paragraph_style: Optional[ParagraphStyle] = Field(
+        alias="paragraphStyle",
         description="The style of this paragraph.",
         default=None,
     )
     suggested_paragraph_style_changes: Optional[dict[str, SuggestedParagraphStyle]] = (
         Field(
+            alias="suggestedParagraphStyleChanges",
             description="The suggested paragraph style changes to this paragraph, keyed by suggestion ID.",
             default=None,
         )
     )
     bullet: Optional[Bullet] = Field(
+        alias="bullet",
         description="The bullet for this paragraph. If not present, the paragraph does not belong to a list.",
         default=None,
     )
-    suggested_bullet_changes: Optional[list[dict[str, SuggestedBullet]]] = Field(
+    suggested_bullet_changes: Optional[dict[str, SuggestedBullet]] = Field(
+        alias="suggestedBulletChanges",
         description="The suggested changes to this paragraph's bullet.",
         default=None,
     )
-    positioned_object_ids: Optional[str] = Field(
+    positioned_object_ids: Optional[list[str]] = Field(
+        alias="positionedObjectIds",
         description="The IDs of the positioned objects tethered to this paragraph.",
         default=None,
     )
     suggested_positioned_object_ids: Optional[dict[str, ObjectReferences]] = Field(
+        alias="suggestedPositionedObjectIds",
         description=(
-            "The IDs of the positioned objects suggested to be attached to this paragraph, keyed by suggestion ID",
-            ".",
+            "The IDs of the positioned objects suggested to be attached to this paragraph, keyed by suggestion ID"
+            "."
         ),
         default=None,
     )
@@ -3880,12 +4018,10 @@ class Body(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#body
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
-    content: Optional[StructuralElement] = Field(
+    content: Optional[list[StructuralElement]] = Field(
+        alias="content",
         description="The contents of the body. The indexes for the body's content begin at zero.",
         default=None,
     )
@@ -3897,157 +4033,187 @@ class Document(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#resource:-document
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     document_id: Optional[str] = Field(
+        alias="documentId",
         description="Output only. The ID of the document.",
         default=None,
     )
-    title: Optional[list[str]] = Field(
+    title: Optional[str] = Field(
+        alias="title",
         description="The title of the document.",
         default=None,
     )
-    tabs: Optional[Tab] = Field(
+    tabs: Optional[list[Tab]] = Field(
+        alias="tabs",
         description=(
-            "Tabs that are part of a document. Tabs can contain child tabs, a tab nested within another tab. Chil",
-            "d tabs are represented by the Tab.childTabs field.",
+            "Tabs that are part of a document. Tabs can contain child tabs, a tab nested within another tab. Chil"
+            "d tabs are represented by the Tab.childTabs field."
         ),
         default=None,
     )
     revision_id: Optional[str] = Field(
+        alias="revisionId",
         description=(
-            "Output only. The revision ID of the document. Can be used in update requests to specify which revisi",
-            "on of a document to apply updates to and how the request should behave if the document has been edit",
-            "ed since that revision. Only populated if the user has edit access to the document. The revision ID ",
-            "is not a sequential number but an opaque string. The format of the revision ID might change over tim",
-            "e. A returned revision ID is only guaranteed to be valid for 24 hours after it has been returned and",
-            " cannot be shared across users. If the revision ID is unchanged between calls, then the document has",
-            " not changed. Conversely, a changed ID (for the same document and user) usually means the document h",
-            "as been updated. However, a changed ID can also be due to internal factors such as ID format changes",
-            ".",
+            "Output only. The revision ID of the document. Can be used in update requests to specify which revisi"
+            "on of a document to apply updates to and how the request should behave if the document has been edit"
+            "ed since that revision. Only populated if the user has edit access to the document. The revision ID "
+            "is not a sequential number but an opaque string. The format of the revision ID might change over tim"
+            "e. A returned revision ID is only guaranteed to be valid for 24 hours after it has been returned and"
+            " cannot be shared across users. If the revision ID is unchanged between calls, then the document has"
+            " not changed. Conversely, a changed ID (for the same document and user) usually means the document h"
+            "as been updated. However, a changed ID can also be due to internal factors such as ID format changes"
+            "."
         ),
         default=None,
     )
-    suggestions_view_mode: SuggestionsViewMode = Field(
+    suggestions_view_mode: Optional[SuggestionsViewMode] = Field(
+        alias="suggestionsViewMode",
         description=(
-            "Output only. The suggestions view mode applied to the document. Note: When editing a document, chang",
-            "es must be based on a document with SUGGESTIONS_INLINE.",
+            "Output only. The suggestions view mode applied to the document. Note: When editing a document, chang"
+            "es must be based on a document with SUGGESTIONS_INLINE."
         ),
         default=None,
     )
     body: Optional[Body] = Field(
+        alias="body",
         description=(
-            "Output only. The main body of the document. Legacy field: Instead, use Document.tabs.documentTab.bod",
-            "y, which exposes the actual document content from all tabs when the includeTabsContent parameter is ",
-            "set to true. If false or unset, this field contains information about the first tab in the document.",
+            "Output only. The main body of the document. Legacy field: Instead, use Document.tabs.documentTab.bod"
+            "y, which exposes the actual document content from all tabs when the includeTabsContent parameter is "
+            "set to true. If false or unset, this field contains information about the first tab in the document."
         ),
         default=None,
     )
     headers: Optional[dict[str, Header]] = Field(
+        alias="headers",
         description=(
-            "Output only. The headers in the document, keyed by header ID. Legacy field: Instead, use Document.ta",
-            "bs.documentTab.headers, which exposes the actual document content from all tabs when the includeTabs",
-            "Content parameter is set to true. If false or unset, this field contains information about the first",
-            " tab in the document.",
+            "Output only. The headers in the document, keyed by header ID. Legacy field: Instead, use Document.ta"
+            "bs.documentTab.headers, which exposes the actual document content from all tabs when the includeTabs"
+            "Content parameter is set to true. If false or unset, this field contains information about the first"
+            " tab in the document."
         ),
         default=None,
     )
     footers: Optional[dict[str, Footer]] = Field(
+        alias="footers",
         description=(
-            "Output only. The footers in the document, keyed by footer ID. Legacy field: Instead, use Document.ta",
-            "bs.documentTab.footers, which exposes the actual document content from all tabs when the includeTabs",
-            "Content parameter is set to true. If false or unset, this field contains information about the first",
-            " tab in the document.",
+            "Output only. The footers in the document, keyed by footer ID. Legacy field: Instead, use Document.ta"
+            "bs.documentTab.footers, which exposes the actual document content from all tabs when the includeTabs"
+            "Content parameter is set to true. If false or unset, this field contains information about the first"
+            " tab in the document."
         ),
         default=None,
     )
     footnotes: Optional[dict[str, Footnote]] = Field(
+        alias="footnotes",
         description=(
-            "Output only. The footnotes in the document, keyed by footnote ID. Legacy field: Instead, use Documen",
-            "t.tabs.documentTab.footnotes, which exposes the actual document content from all tabs when the inclu",
-            "deTabsContent parameter is set to true. If false or unset, this field contains information about the",
-            " first tab in the document.",
+            "Output only. The footnotes in the document, keyed by footnote ID. Legacy field: Instead, use Documen"
+            "t.tabs.documentTab.footnotes, which exposes the actual document content from all tabs when the inclu"
+            "deTabsContent parameter is set to true. If false or unset, this field contains information about the"
+            " first tab in the document."
         ),
         default=None,
     )
     document_style: Optional[DocumentStyle] = Field(
+        alias="documentStyle",
         description=(
-            "Output only. The style of the document. Legacy field: Instead, use Document.tabs.documentTab.documen",
-            "tStyle, which exposes the actual document content from all tabs when the includeTabsContent paramete",
-            "r is set to true. If false or unset, this field contains information about the first tab in the docu",
-            "ment.",
+            "Output only. The style of the document. Legacy field: Instead, use Document.tabs.documentTab.documen"
+            "tStyle, which exposes the actual document content from all tabs when the includeTabsContent paramete"
+            "r is set to true. If false or unset, this field contains information about the first tab in the docu"
+            "ment."
         ),
         default=None,
     )
     suggested_document_style_changes: Optional[dict[str, SuggestedDocumentStyle]] = (
         Field(
+            alias="suggestedDocumentStyleChanges",
             description=(
-                "Output only. The suggested changes to the style of the document, keyed by suggestion ID. Legacy fiel",
-                "d: Instead, use Document.tabs.documentTab.suggestedDocumentStyleChanges, which exposes the actual do",
-                "cument content from all tabs when the includeTabsContent parameter is set to true. If false or unset",
-                ", this field contains information about the first tab in the document.",
+                "Output only. The suggested changes to the style of the document, keyed by suggestion ID. Legacy fiel"
+                "d: Instead, use Document.tabs.documentTab.suggestedDocumentStyleChanges, which exposes the actual do"
+                "cument content from all tabs when the includeTabsContent parameter is set to true. If false or unset"
+                ", this field contains information about the first tab in the document."
             ),
             default=None,
         )
     )
     named_styles: Optional[NamedStyles] = Field(
+        alias="namedStyles",
         description=(
-            "Output only. The named styles of the document. Legacy field: Instead, use Document.tabs.documentTab.",
-            "namedStyles, which exposes the actual document content from all tabs when the includeTabsContent par",
-            "ameter is set to true. If false or unset, this field contains information about the first tab in the",
-            " document.",
+            "Output only. The named styles of the document. Legacy field: Instead, use Document.tabs.documentTab."
+            "namedStyles, which exposes the actual document content from all tabs when the includeTabsContent par"
+            "ameter is set to true. If false or unset, this field contains information about the first tab in the"
+            " document."
         ),
         default=None,
     )
     suggested_named_styles_changes: Optional[dict[str, SuggestedNamedStyles]] = Field(
+        alias="suggestedNamedStylesChanges",
         description=(
-            "Output only. The suggested changes to the named styles of the document, keyed by suggestion ID. Lega",
-            "cy field: Instead, use Document.tabs.documentTab.suggestedNamedStylesChanges, which exposes the actu",
-            "al document content from all tabs when the includeTabsContent parameter is set to true. If false or ",
-            "unset, this field contains information about the first tab in the document.",
+            "Output only. The suggested changes to the named styles of the document, keyed by suggestion ID. Lega"
+            "cy field: Instead, use Document.tabs.documentTab.suggestedNamedStylesChanges, which exposes the actu"
+            "al document content from all tabs when the includeTabsContent parameter is set to true. If false or "
+            "unset, this field contains information about the first tab in the document."
         ),
         default=None,
     )
     lists: Optional[dict[str, List]] = Field(
+        alias="lists",
         description=(
-            "Output only. The lists in the document, keyed by list ID. Legacy field: Instead, use Document.tabs.d",
-            "ocumentTab.lists, which exposes the actual document content from all tabs when the includeTabsConten",
-            "t parameter is set to true. If false or unset, this field contains information about the first tab i",
-            "n the document.",
+            "Output only. The lists in the document, keyed by list ID. Legacy field: Instead, use Document.tabs.d"
+            "ocumentTab.lists, which exposes the actual document content from all tabs when the includeTabsConten"
+            "t parameter is set to true. If false or unset, this field contains information about the first tab i"
+            "n the document."
         ),
         default=None,
     )
     named_ranges: Optional[dict[str, NamedRanges]] = Field(
+        alias="namedRanges",
         description=(
-            "Output only. The named ranges in the document, keyed by name. Legacy field: Instead, use Document.ta",
-            "bs.documentTab.namedRanges, which exposes the actual document content from all tabs when the include",
-            "TabsContent parameter is set to true. If false or unset, this field contains information about the f",
-            "irst tab in the document.",
+            "Output only. The named ranges in the document, keyed by name. Legacy field: Instead, use Document.ta"
+            "bs.documentTab.namedRanges, which exposes the actual document content from all tabs when the include"
+            "TabsContent parameter is set to true. If false or unset, this field contains information about the f"
+            "irst tab in the document."
         ),
         default=None,
     )
     inline_objects: Optional[dict[str, InlineObject]] = Field(
+        alias="inlineObjects",
         description=(
-            "Output only. The inline objects in the document, keyed by object ID. Legacy field: Instead, use Docu",
-            "ment.tabs.documentTab.inlineObjects, which exposes the actual document content from all tabs when th",
-            "e includeTabsContent parameter is set to true. If false or unset, this field contains information ab",
-            "out the first tab in the document.",
+            "Output only. The inline objects in the document, keyed by object ID. Legacy field: Instead, use Docu"
+            "ment.tabs.documentTab.inlineObjects, which exposes the actual document content from all tabs when th"
+            "e includeTabsContent parameter is set to true. If false or unset, this field contains information ab"
+            "out the first tab in the document."
         ),
         default=None,
     )
     positioned_objects: Optional[dict[str, PositionedObject]] = Field(
+        alias="positionedObjects",
         description=(
-            "Output only. The positioned objects in the document, keyed by object ID. Legacy field: Instead, use ",
-            "Document.tabs.documentTab.positionedObjects, which exposes the actual document content from all tabs",
-            " when the includeTabsContent parameter is set to true. If false or unset, this field contains inform",
-            "ation about the first tab in the document.",
+            "Output only. The positioned objects in the document, keyed by object ID. Legacy field: Instead, use "
+            "Document.tabs.documentTab.positionedObjects, which exposes the actual document content from all tabs"
+            " when the includeTabsContent parameter is set to true. If false or unset, this field contains inform"
+            "ation about the first tab in the document."
         ),
         default=None,
     )
 
+    @classmethod
+    def parse_api_response(cls, raw: Union[str, bytes]) -> Document:
+        """
+        Parse a raw documents.get response body into a Document.
+
+        The JSON is parsed and validated in one pass by pydantic-core,
+        without building an intermediate dict in Python.
+
+        Args:
+            raw (Union[str, bytes]): The JSON body returned by the Docs API.
+
+        Returns:
+            Document: The validated document.
+        """
+        return cls.model_validate_json(raw)
+
 
 class DocumentTab(BaseModel):
     """
@@ -4055,58 +4221,67 @@ class DocumentTab(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#documenttab
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     body: Optional[Body] = Field(
+        alias="body",
         description="The main body of the document tab.",
         default=None,
     )
     headers: Optional[dict[str, Header]] = Field(
+        alias="headers",
         description="The headers in the document tab, keyed by header ID.",
         default=None,
     )
     footers: Optional[dict[str, Footer]] = Field(
+        alias="footers",
         description="The footers in the document tab, keyed by footer ID.",
         default=None,
     )
     footnotes: Optional[dict[str, Footnote]] = Field(
+        alias="footnotes",
         description="The footnotes in the document tab, keyed by footnote ID.",
         default=None,
     )
     document_style: Optional[DocumentStyle] = Field(
+        alias="documentStyle",
         description="The style of the document tab.",
         default=None,
     )
     suggested_document_style_changes: Optional[dict[str, SuggestedDocumentStyle]] = (
         Field(
+            alias="suggestedDocumentStyleChanges",
             description="The suggested changes to the style of the document tab, keyed by suggestion ID.",
             default=None,
         )
     )
     named_styles: Optional[NamedStyles] = Field(
+        alias="namedStyles",
         description="The named styles of the document tab.",
         default=None,
     )
     suggested_named_styles_changes: Optional[dict[str, SuggestedNamedStyles]] = Field(
+        alias="suggestedNamedStylesChanges",
         description="The suggested changes to the named styles of the document tab, keyed by suggestion ID.",
         default=None,
     )
     lists: Optional[dict[str, List]] = Field(
+        alias="lists",
         description="The lists in the document tab, keyed by list ID.",
         default=None,
     )
     named_ranges: Optional[dict[str, NamedRanges]] = Field(
+        alias="namedRanges",
         description="The named ranges in the document tab, keyed by name.",
         default=None,
     )
     inline_objects: Optional[dict[str, InlineObject]] = Field(
+        alias="inlineObjects",
         description="The inline objects in the document tab, keyed by object ID.",
         default=None,
     )
-    positioned_objects: Optional[list[dict[str, PositionedObject]]] = Field(
+    positioned_objects: Optional[dict[str, PositionedObject]] = Field(
+        alias="positionedObjects",
         description="The positioned objects in the document tab, keyed by object ID.",
         default=None,
     )
@@ -4118,16 +4293,15 @@ class Footer(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#footer
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
-    footer_id: Optional[list[str]] = Field(
+    footer_id: Optional[str] = Field(
+        alias="footerId",
         description="The ID of the footer.",
         default=None,
     )
-    content: Optional[StructuralElement] = Field(
+    content: Optional[list[StructuralElement]] = Field(
+        alias="content",
         description="The contents of the footer. The indexes for a footer's content begin at zero.",
         default=None,
     )
@@ -4139,16 +4313,15 @@ class Footnote(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#footnote
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
-    footnote_id: Optional[list[str]] = Field(
+    footnote_id: Optional[str] = Field(
+        alias="footnoteId",
         description="The ID of the footnote.",
         default=None,
     )
-    content: Optional[StructuralElement] = Field(
+    content: Optional[list[StructuralElement]] = Field(
+        alias="content",
         description="The contents of the footnote. The indexes for a footnote's content begin at zero.",
         default=None,
     )
@@ -4160,16 +4333,15 @@ class Header(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#header
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
-    header_id: Optional[list[str]] = Field(
+    header_id: Optional[str] = Field(
+        alias="headerId",
         description="The ID of the header.",
         default=None,
     )
-    content: Optional[StructuralElement] = Field(
+    content: Optional[list[StructuralElement]] = Field(
+        alias="content",
         description="The contents of the header. The indexes for a header's content begin at zero.",
         default=None,
     )
@@ -4181,32 +4353,35 @@ class StructuralElement(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#structuralelement
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     start_index: Optional[int] = Field(
+        alias="startIndex",
         description="The zero-based start index of this structural element, in UTF-16 code units.",
         default=None,
     )
     end_index: Optional[int] = Field(
+        alias="endIndex",
         description="The zero-based end index of this structural element, exclusive, in UTF-16 code units.",
         default=None,
     )
     paragraph: Optional[Paragraph] = Field(
+        alias="paragraph",
         description="A paragraph type of structural element.",
         default=None,
     )
     section_break: Optional[SectionBreak] = Field(
+        alias="sectionBreak",
         description="A section break type of structural element.",
         default=None,
     )
     table: Optional[Table] = Field(
+        alias="table",
         description="A table type of structural element.",
         default=None,
     )
-    table_of_contents: Optional[list[TableOfContents]] = Field(
+    table_of_contents: Optional[TableOfContents] = Field(
+        alias="tableOfContents",
         description="A table of contents type of structural element.",
         default=None,
     )
@@ -4218,40 +4393,44 @@ class TableCell(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#tablecell
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     start_index: Optional[int] = Field(
+        alias="startIndex",
         description="The zero-based start index of this cell, in UTF-16 code units.",
         default=None,
     )
-    end_index: Optional[list[int]] = Field(
+    end_index: Optional[int] = Field(
+        alias="endIndex",
         description="The zero-based end index of this cell, exclusive, in UTF-16 code units.",
         default=None,
     )
-    content: Optional[StructuralElement] = Field(
+    content: Optional[list[StructuralElement]] = Field(
+        alias="content",
         description="The content of the cell.",
         default=None,
     )
-    table_cell_style: Optional[list[TableCellStyle]] = Field(
+    table_cell_style: Optional[TableCellStyle] = Field(
+        alias="tableCellStyle",
         description="The style of the cell.",
         default=None,
     )
     suggested_insertion_ids: Optional[list[str]] = Field(
+        alias="suggestedInsertionIds",
         description=(
-            "The suggested insertion IDs. A TableCell may have multiple insertion IDs if it's a nested suggested ",
-            "change. If empty, then this is not a suggested insertion.",
+            "The suggested insertion IDs. A TableCell may have multiple insertion IDs if it's a nested suggested "
+            "change. If empty, then this is not a suggested insertion."
         ),
         default=None,
     )
-    suggested_deletion_ids: Optional[str] = Field(
+    suggested_deletion_ids: Optional[list[str]] = Field(
+        alias="suggestedDeletionIds",
         description="The suggested deletion IDs. If empty, then there are no suggested deletions of this content.",
         default=None,
     )
     suggested_table_cell_style_changes: Optional[dict[str, SuggestedTableCellStyle]] = (
         Field(
+            alias="suggestedTableCellStyleChanges",
             description="The suggested changes to the table cell style, keyed by suggestion ID.",
             default=None,
         )
@@ -4264,23 +4443,23 @@ class TableOfContents(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#tableofcontents
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     content: Optional[list[StructuralElement]] = Field(
+        alias="content",
         description="The content of the table of contents.",
         default=None,
     )
     suggested_insertion_ids: Optional[list[str]] = Field(
+        alias="suggestedInsertionIds",
         description=(
-            "The suggested insertion IDs. A TableOfContents may have multiple insertion IDs if it is a nested sug",
-            "gested change. If empty, then this is not a suggested insertion.",
+            "The suggested insertion IDs. A TableOfContents may have multiple insertion IDs if it is a nested sug"
+            "gested change. If empty, then this is not a suggested insertion."
         ),
         default=None,
     )
-    suggested_deletion_ids: Optional[str] = Field(
+    suggested_deletion_ids: Optional[list[str]] = Field(
+        alias="suggestedDeletionIds",
         description="The suggested deletion IDs. If empty, then there are no suggested deletions of this content.",
         default=None,
     )
@@ -4292,43 +4471,47 @@ class TableRow(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#tablerow
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     start_index: Optional[int] = Field(
+        alias="startIndex",
         description="The zero-based start index of this row, in UTF-16 code units.",
         default=None,
     )
-    end_index: Optional[list[int]] = Field(
+    end_index: Optional[int] = Field(
+        alias="endIndex",
         description="The zero-based end index of this row, exclusive, in UTF-16 code units.",
         default=None,
     )
     table_cells: Optional[list[TableCell]] = Field(
+        alias="tableCells",
         description=(
-            "The contents and style of each cell in this row. It's possible for a table to be non-rectangular, so",
-            " some rows may have a different number of cells than other rows in the same table.",
+            "The contents and style of each cell in this row. It's possible for a table to be non-rectangular, so"
+            " some rows may have a different number of cells than other rows in the same table."
         ),
         default=None,
     )
     suggested_insertion_ids: Optional[list[str]] = Field(
+        alias="suggestedInsertionIds",
         description=(
-            "The suggested insertion IDs. A TableRow may have multiple insertion IDs if it's a nested suggested c",
-            "hange. If empty, then this is not a suggested insertion.",
+            "The suggested insertion IDs. A TableRow may have multiple insertion IDs if it's a nested suggested c"
+            "hange. If empty, then this is not a suggested insertion."
         ),
         default=None,
     )
-    suggested_deletion_ids: Optional[str] = Field(
+    suggested_deletion_ids: Optional[list[str]] = Field(
+        alias="suggestedDeletionIds",
         description="The suggested deletion IDs. If empty, then there are no suggested deletions of this content.",
         default=None,
     )
     table_row_style: Optional[TableRowStyle] = Field(
+        alias="tableRowStyle",
         description="The style of the table row.",
         default=None,
     )
     suggested_table_row_style_changes: Optional[dict[str, SuggestedTableRowStyle]] = (
         Field(
+            alias="suggestedTableRowStyleChanges",
             description="The suggested style changes to this row, keyed by suggestion ID.",
             default=None,
         )
@@ -4341,38 +4524,41 @@ class Table(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#table
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     rows: Optional[int] = Field(
+        alias="rows",
         description="Number of rows in the table.",
         default=None,
     )
-    columns: Optional[list[int]] = Field(
+    columns: Optional[int] = Field(
+        alias="columns",
         description=(
-            "Number of columns in the table. It's possible for a table to be non-rectangular, so some rows may ha",
-            "ve a different number of cells.",
+            "Number of columns in the table. It's possible for a table to be non-rectangular, so some rows may ha"
+            "ve a different number of cells."
         ),
         default=None,
     )
     table_rows: Optional[list[TableRow]] = Field(
+        alias="tableRows",
         description="The contents and style of each row.",
         default=None,
     )
     suggested_insertion_ids: Optional[list[str]] = Field(
+        alias="suggestedInsertionIds",
         description=(
-            "The suggested insertion IDs. A Table may have multiple insertion IDs if it's a nested suggested chan",
-            "ge. If empty, then this is not a suggested insertion.",
+            "The suggested insertion IDs. A Table may have multiple insertion IDs if it's a nested suggested chan"
+            "ge. If empty, then this is not a suggested insertion."
         ),
         default=None,
     )
-    suggested_deletion_ids: Optional[str] = Field(
+    suggested_deletion_ids: Optional[list[str]] = Field(
+        alias="suggestedDeletionIds",
         description="The suggested deletion IDs. If empty, then there are no suggested deletions of this content.",
         default=None,
     )
     table_style: Optional[TableStyle] = Field(
+        alias="tableStyle",
         description="The style of the table.",
         default=None,
     )
@@ -4384,20 +4570,32 @@ class Tab(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#tab
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
-    tab_properties: Optional[list[TabProperties]] = Field(
+    tab_properties: Optional[TabProperties] = Field(
+        alias="tabProperties",
         description="The properties of the tab, like ID and title.",
         default=None,
     )
-    child_tabs: Optional[Tab] = Field(
+    child_tabs: Optional[list[Tab]] = Field(
+        alias="childTabs",
         description="The child tabs nested within this tab.",
         default=None,
     )
     document_tab: Optional[DocumentTab] = Field(
+        alias="documentTab",
         description="A tab with document contents, like text and images.",
         default=None,
     )
+
+
+# Adapters for validating whole arrays in one pydantic-core call. Prefer
+# ``TEXT_RUN_LIST.validate_python(raw)`` over ``[TextRun.model_validate(r) for r in raw]``.
+_LIST_ADAPTER_CONFIG = ConfigDict(defer_build=True)
+TEXT_RUN_LIST = TypeAdapter(list[TextRun], config=_LIST_ADAPTER_CONFIG)
+PARAGRAPH_STYLE_LIST = TypeAdapter(list[ParagraphStyle], config=_LIST_ADAPTER_CONFIG)
+NESTING_LEVEL_LIST = TypeAdapter(list[NestingLevel], config=_LIST_ADAPTER_CONFIG)
+PARAGRAPH_LIST = TypeAdapter(list[Paragraph], config=_LIST_ADAPTER_CONFIG)
+PARAGRAPH_ELEMENT_LIST = TypeAdapter(
+    list[ParagraphElement], config=_LIST_ADAPTER_CONFIG
+)
@@ -2,7 +2,12 @@ from __future__ import annotations
 
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict, Field, alias_generators
+from pydantic import BaseModel, ConfigDict, Field
+
+_CAMEL_CONFIG = ConfigDict(
+    populate_by_name=True,
+    defer_build=True,
+)
 
 
 class CreateFooterResponse(BaseModel):
@@ -11,12 +16,10 @@ class CreateFooterResponse(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#createfooterresponse
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     footer_id: Optional[str] = Field(
+        alias="footerId",
         description="The ID of the created footer.",
         default=None,
     )
@@ -28,12 +31,10 @@ class CreateFootnoteResponse(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#createfootnoteresponse
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     footnote_id: Optional[str] = Field(
+        alias="footnoteId",
         description="The ID of the created footnote.",
         default=None,
     )
@@ -45,12 +46,10 @@ class CreateHeaderResponse(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#createheaderresponse
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     header_id: Optional[str] = Field(
+        alias="headerId",
         description="The ID of the created header.",
         default=None,
     )
@@ -62,12 +61,10 @@ class CreateNamedRangeResponse(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#createnamedrangeresponse
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     named_range_id: Optional[str] = Field(
+        alias="namedRangeId",
         description="The ID of the created named range.",
         default=None,
     )
@@ -79,12 +76,10 @@ class InsertInlineImageResponse(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#insertinlineimageresponse
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     object_id: Optional[str] = Field(
+        alias="objectId",
         description="The ID of the created InlineObject.",
         default=None,
     )
@@ -96,12 +91,10 @@ class InsertInlineSheetsChartResponse(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#insertinlinesheetschartresponse
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     object_id: Optional[str] = Field(
+        alias="objectId",
         description="The object ID of the inserted chart.",
         default=None,
     )
@@ -113,12 +106,10 @@ class ReplaceAllTextResponse(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#replacealltextresponse
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     occurrences_changed: Optional[int] = Field(
+        alias="occurrencesChanged",
         description="The number of occurrences changed by replacing all text.",
         default=None,
     )
@@ -130,36 +121,40 @@ class Response(BaseModel):
     https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#response
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=alias_generators.to_camel,
-    )
+    model_config = _CAMEL_CONFIG
 
     replace_all_text: Optional[ReplaceAllTextResponse] = Field(
+        alias="replaceAllText",
         description="The result of replacing text.",
         default=None,
     )
     create_named_range: Optional[CreateNamedRangeResponse] = Field(
+        alias="createNamedRange",
         description="The result of creating a named range.",
         default=None,
     )
     insert_inline_image: Optional[InsertInlineImageResponse] = Field(
+        alias="insertInlineImage",
         description="The result of inserting an inline image.",
         default=None,
     )
     insert_inline_sheets_chart: Optional[InsertInlineSheetsChartResponse] = Field(
+        alias="insertInlineSheetsChart",
         description="The result of inserting an inline Google Sheets chart.",
         default=None,
     )
     create_header: Optional[CreateHeaderResponse] = Field(
+        alias="createHeader",
         description="The result of creating a header.",
         default=None,
     )
     create_footer: Optional[CreateFooterResponse] = Field(
+        alias="createFooter",
         description="The result of creating a footer.",
         default=None,
     )
     create_footnote: Optional[CreateFootnoteResponse] = Field(
+        alias="createFootnote",
         description="The result of creating a footnote.",
         default=None,
     )
@@ -1,5 +1,27 @@
 from pydantic import BaseModel
 
+_FIELD_ALIASES: dict[type[BaseModel], tuple[tuple[str, str], ...]] = {}
+
+
+def _get_field_aliases(model_class: type[BaseModel]) -> tuple[tuple[str, str], ...]:
+    """
+    Get the (field name, alias) pairs of a Pydantic model class, cached per class.
+
+    Args:
+        model_class (type[BaseModel]): The Pydantic model class.
+
+    Returns:
+        tuple[tuple[str, str], ...]: The field names and aliases in declaration order.
+    """
+    aliases = _FIELD_ALIASES.get(model_class)
+    if aliases is None:
+        aliases = tuple(
+            (name, field.alias or name)
+            for name, field in model_class.model_fields.items()
+        )
+        _FIELD_ALIASES[model_class] = aliases
+    return aliases
+
 
 def get_fields(basemodel: BaseModel) -> str:
     """
@@ -11,7 +33,15 @@ def get_fields(basemodel: BaseModel) -> str:
     Returns:
         str: A list of used field names separated by commas.
     """
-    fields = [field for field in get_dict_request(basemodel).keys()]
+    # Every field defaults to None, so a model with nothing set has no fields to list.
+    if not basemodel.__pydantic_fields_set__:
+        return "*"
+    values = basemodel.__dict__
+    fields = [
+        alias
+        for name, alias in _get_field_aliases(type(basemodel))
+        if values[name] is not None
+    ]
     if len(fields) == 0:
         return "*"
     return ",".join(fields)
@@ -27,7 +57,9 @@ def get_dict_request(basemodel: BaseModel) -> dict:
     Returns:
         dict: A dictionary representation of the Pydantic model.
     """
-    return basemodel.model_dump(by_alias=True, exclude_defaults=True)
+    # Every field defaults to None, so dropping None values is equivalent to
+    # excluding defaults, and pydantic-core skips the per-field default comparison.
+    return basemodel.model_dump(by_alias=True, exclude_none=True)
 
 
 def get_dict_batch_request(basemodels: list[BaseModel]) -> list[dict]:
@@ -40,7 +72,4 @@ def get_dict_batch_request(basemodels: list[BaseModel]) -> list[dict]:
     Returns:
         dict: A dictionary representation of the Pydantic model for batch requests.
     """
-    result = []
-    for basemodel in basemodels:
-        result.append(get_dict_request(basemodel))
-    return result
+    return [get_dict_request(basemodel) for basemodel in basemodels]
@@ -2,17 +2,36 @@
 Script to parse Google Docs API XML documentation and generate Pydantic models
 """
 
+import bisect
+import functools
+import heapq
+import io
 import re
 import sys
+import textwrap
 from pathlib import Path
 from typing import Literal, Optional, Set, Tuple
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, FeatureNotFound, Tag
 
 
 class Field:
     """Represents a field in a resource model"""
 
+    __slots__ = (
+        "name",
+        "type_name",
+        "description",
+        "is_collection",
+        "is_map",
+        "map_key_type",
+        "map_value_type",
+        "is_enum",
+        "_type_key",
+        "_map_key_key",
+        "_map_value_key",
+    )
+
     def __init__(
         self,
         name: str,
@@ -32,11 +51,19 @@ class Field:
         self.map_key_type = map_key_type
         self.map_value_type = map_value_type
         self.is_enum = is_enum
+        # Lowercased lookup keys for _TYPE_MAPPING, computed once per field
+        self._type_key = type_name.lower() if type_name else ""
+        self._map_key_key = map_key_type.lower() if is_map and map_key_type else ""
+        self._map_value_key = (
+            map_value_type.lower() if is_map and map_value_type else ""
+        )
 
 
 class ResourceModel:
     """Represents a resource model from the API documentation"""
 
+    __slots__ = ("name", "description", "fields", "url", "resource_type")
+
     def __init__(self, name: str, description: str):
         self.name = name
         self.description = description
@@ -45,39 +72,71 @@ class ResourceModel:
         self.resource_type: Literal["object", "enum"] = "object"
 
 
+_TYPE_MAPPING = {
+    "string": "str",
+    "integer": "int",
+    "number": "float",
+    "boolean": "bool",
+}
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+_CAMEL_RE = re.compile(r"(?<!^)(?=[A-Z])")
+# Drops "[]" collection markers and turns nested "a.b" field paths into "a_b"
+_FIELD_NAME_TABLE = str.maketrans({"[": None, "]": None, ".": "_"})
+_DOCUMENT_CONTENT_START = "<document_content>"
+_DOCUMENT_CONTENT_END = "</document_content>"
+
+
+def _parse_wrapped(schema: str, prefix: str) -> Optional[str]:
+    """Return the inner text of ``prefix (inner)``, or None if schema has another shape"""
+    if not schema.startswith(prefix):
+        return None
+    rest = schema[len(prefix) :].lstrip()
+    if not (rest.startswith("(") and rest.endswith(")")):
+        return None
+    return rest[1:-1].strip()
+
+
 def _parse_map(schema: str) -> Optional[Tuple[str, str]]:
-    pattern = re.compile(
-        r"""map\s*\(\s*            # 'map (' とその前後の空白
-            key:\s*(?P<key>.+?)    # key: の後に続く xxx を非貪欲で取得
-            \s*,\s*               # カンマとその前後の空白
-            value:\s*(?P<value>.+?)# value: の後に続く yyy を非貪欲で取得
-            \s*\)$                # 終端の ')' とその前後の空白
-        """,
-        re.VERBOSE,
-    )
-    match = pattern.search(schema)
-    if match:
-        key_type = match.group("key").strip()
-        value_type = match.group("value").strip()
-        return key_type, value_type
+    inner = _parse_wrapped(schema, "map")
+    if inner is None:
+        return None
+    depth = 0
+    for i, char in enumerate(inner):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            key_part = inner[:i].strip()
+            value_part = inner[i + 1 :].strip()
+            break
+    else:
+        return None
+    if not (key_part.startswith("key:") and value_part.startswith("value:")):
+        return None
+    key_type = key_part[4:].strip()
+    value_type = value_part[6:].strip()
+    if not key_type or not value_type:
+        return None
+    return key_type, value_type
 
 
 def _parse_object(schema: str) -> Optional[str]:
-    pattern_obj = re.compile(r"object\s*\(\s*(?P<inner>[^)]+)\s*\)$")
-    match = pattern_obj.search(schema)
-    if match:
-        return match.group("inner").strip()
-    return None
+    inner = _parse_wrapped(schema, "object")
+    if not inner or ")" in inner:
+        return None
+    return inner
 
 
 def _parse_enum(schema: str) -> Optional[str]:
-    pattern_obj = re.compile(r"enum\s*\(\s*(?P<inner>[^)]+)\s*\)$")
-    match = pattern_obj.search(schema)
-    if match:
-        return match.group("inner").strip()
-    return None
+    inner = _parse_wrapped(schema, "enum")
+    if not inner or ")" in inner:
+        return None
+    return inner
 
 
+@functools.lru_cache(maxsize=None)
 def parse_field_type(
     type_text: str,
 ) -> Tuple[str, bool, bool, Optional[str], Optional[str], bool]:
@@ -95,7 +154,7 @@ def parse_field_type(
     map_key_type = None
     map_value_type = None
     is_enum = False
-    type_text = re.sub(r"<[^>]+>", "", type_text).strip()
+    type_text = _TAG_RE.sub("", type_text).strip()
     if type_text.endswith("[]") or type_text.startswith("array of"):
         is_collection = True
         type_text = type_text.replace("[]", "").replace("array of", "").strip()
@@ -116,16 +175,41 @@ def parse_field_type(
     return type_text, is_collection, is_map, map_key_type, map_value_type, is_enum
 
 
+def to_camel(name: str) -> str:
+    """Convert a snake_case field name to the camelCase name used by the API"""
+    head, *tail = name.split("_")
+    return head + "".join(part.capitalize() for part in tail)
+
+
 def clean_description(desc: str) -> str:
     """Clean up description text"""
-    desc = re.sub(r"\s+", " ", desc)
-    desc = re.sub(r"<[^>]+>", "", desc)
-    return desc.strip()
+    return _TAG_RE.sub("", _WS_RE.sub(" ", desc)).strip()
+
+
+def _find_by_id(
+    id_map: dict[str, Tag], tag_name: str, element_id: str
+) -> Optional[Tag]:
+    """Look up an element by id, requiring it to be the given tag"""
+    element = id_map.get(element_id)
+    if element is None or element.name != tag_name:
+        return None
+    return element
+
+
+def _make_soup(markup: str) -> BeautifulSoup:
+    """Parse with lxml when it is installed, falling back to the stdlib parser"""
+    try:
+        return BeautifulSoup(markup, "lxml")
+    except FeatureNotFound:
+        return BeautifulSoup(markup, "html.parser")
 
 
 def parse_models_from_xml(xml_content: str) -> list[ResourceModel]:
     """Parse resource models from the XML documentation"""
-    soup = BeautifulSoup(xml_content, "html.parser")
+    soup = _make_soup(xml_content)
+    id_map: dict[str, Tag] = {}
+    for element in soup.find_all(id=True):
+        id_map.setdefault(element["id"], element)
     models = []
     resource_root = soup.find("div", class_="devsite-article-body")
     resource_sections = resource_root.find_all("section")
@@ -147,7 +231,7 @@ def parse_models_from_xml(xml_content: str) -> list[ResourceModel]:
             continue
         resource_name = section_id
         description = ""
-        desc_section = soup.find("section", {"id": section_id + ".description"})
+        desc_section = _find_by_id(id_map, "section", section_id + ".description")
         if desc_section is not None and desc_section.find("p") is not None:
             description = clean_description(desc_section.find("p").text or "")
         model = ResourceModel(resource_name, description)
@@ -158,8 +242,8 @@ def parse_models_from_xml(xml_content: str) -> list[ResourceModel]:
         h2_id = h2_elem.get("id", "")
         if h2_id:
             model.url = f"https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#{h2_id}"
-        enum_section = section.find("section", {"id": section_id + ".ENUM_VALUES"})
-        fields_section = section.find("section", {"id": section_id + ".FIELDS"})
+        enum_section = _find_by_id(id_map, "section", section_id + ".ENUM_VALUES")
+        fields_section = _find_by_id(id_map, "section", section_id + ".FIELDS")
         if enum_section is not None:
             model.resource_type = "enum"
             enum_table = enum_section.find("tbody")
@@ -185,31 +269,25 @@ def parse_models_from_xml(xml_content: str) -> list[ResourceModel]:
                     model.fields.append(field)
         elif fields_section is not None:
             model.resource_type = "object"
-            fields_table = fields_section.find(
-                "table", {"id": section_id + ".FIELDS-table"}
-            )
+            fields_table = _find_by_id(id_map, "table", section_id + ".FIELDS-table")
             if fields_table is not None:
                 field_rows = fields_table.find_all("tr")
                 for row in field_rows:
-                    field_td = row.find_all("td")
+                    field_td = row.find_all("td", limit=2)
                     if len(field_td) < 2:
                         continue
                     field_name = field_td[0].find("code")
                     if field_name is None or not field_name.text:
                         continue
                     raw_name = field_name.text.strip()
-                    field_name_cleaned = re.sub(
-                        r"(?<!^)(?=[A-Z])", "_", raw_name
-                    ).lower()
-                    if field_name_cleaned.endswith("[]"):
-                        field.is_collection = True
-                    field_name_cleaned = field_name_cleaned.replace("[]", "")
-                    field_name_cleaned = field_name_cleaned.replace(".", "_")
-                    field_name_cleaned = re.sub(r"[\[\]]", "", field_name_cleaned)
-                    field_type_elem = field_td[1].find("p")
-                    if not field_type_elem:
+                    field_name_cleaned = _CAMEL_RE.sub("_", raw_name).lower()
+                    name_is_collection = field_name_cleaned.endswith("[]")
+                    field_name_cleaned = field_name_cleaned.translate(_FIELD_NAME_TABLE)
+                    # The first paragraph holds the type, the rest the description
+                    field_paras = field_td[1].find_all("p")
+                    if not field_paras:
                         continue
-                    field_type = field_type_elem.find("code", {"class": "apitype"})
+                    field_type = field_paras[0].find("code", {"class": "apitype"})
                     if field_type is None or not field_type.text:
                         continue
                     type_text = field_type.text.strip()
@@ -221,9 +299,9 @@ def parse_models_from_xml(xml_content: str) -> list[ResourceModel]:
                         map_value_type,
                         is_enum,
                     ) = parse_field_type(type_text)
-                    description_paras = field_td[1].find_all("p")
+                    is_collection = is_collection or name_is_collection
                     description = ""
-                    for p in description_paras[1:]:
+                    for p in field_paras[1:]:
                         if p.text:
                             description += clean_description(p.text) + " "
                     field = Field(
@@ -238,8 +316,10 @@ def parse_models_from_xml(xml_content: str) -> list[ResourceModel]:
                     )
                     model.fields.append(field)
         models.append(model)
+    existing_names = {model.name for model in models}
     for empty_type in empty_object_types:
-        if not any(model.name == empty_type for model in models):
+        if empty_type not in existing_names:
+            existing_names.add(empty_type)
             empty_model = ResourceModel(empty_type, "This type has no fields.")
             empty_model.url = f"https://developers.google.com/workspace/docs/api/reference/rest/v1/documents?hl=en#{empty_type}"
             empty_model.fields = []
@@ -249,81 +329,81 @@ def parse_models_from_xml(xml_content: str) -> list[ResourceModel]:
 
 def generate_pydantic_models(models: list[ResourceModel]) -> str:
     """Generate Pydantic model classes from the parsed models"""
-    type_mapping = {
-        "string": "str",
-        "integer": "int",
-        "number": "float",
-        "boolean": "bool",
-        "object": "dict",
-        "array": "list",
-    }
-    enum_models = []
-    regular_models = []
+    enum_flags: dict[str, bool] = {}
+    model_dict: dict[str, ResourceModel] = {}
+    enum_models: list[ResourceModel] = []
+    regular_models: list[ResourceModel] = []
     for model in models:
-        if model.name.endswith("Type") or (
-            model.fields
-            and any(field.is_enum for field in model.fields)
-            and len(model.fields) == 1
-        ):
-            enum_models.append(model)
+        is_enum = model.name.endswith("Type") or (
+            len(model.fields) == 1 and model.fields[0].is_enum
+        )
+        enum_flags[model.name] = is_enum
+        model_dict[model.name] = model
+        if is_enum:
+            bisect.insort(enum_models, model, key=lambda m: m.name)
         else:
             regular_models.append(model)
-    model_names = [m.name for m in models]
-    model_dict = {m.name: m for m in models}
+    model_names = enum_flags.keys()
+    enum_names = {name for name, is_enum in enum_flags.items() if is_enum}
+    # Fields may reference models defined later, so dependencies need every flag
     dependencies: dict[str, Set[str]] = {}
     for model in regular_models:
         dependencies[model.name] = set()
         for field in model.fields:
-            if field.type_name in model_names and field.type_name not in [
-                m.name for m in enum_models
-            ]:
+            if field.type_name in model_names and field.type_name not in enum_names:
                 dependencies[model.name].add(field.type_name)
             if (
                 field.is_map
                 and field.map_value_type in model_names
-                and field.map_value_type not in [m.name for m in enum_models]
+                and field.map_value_type not in enum_names
             ):
                 dependencies[model.name].add(field.map_value_type)
-    result = [
+    buf = io.StringIO()
+    header = [
         "from __future__ import annotations",
         "",
         "from enum import Enum",
         "from typing import Any, Optional, Union",
-        "from pydantic import BaseModel, ConfigDict, Field, alias_generators",
+        "from pydantic import BaseModel, ConfigDict, Field",
         "",
+        "_CAMEL_CONFIG = ConfigDict(",
+        "    populate_by_name=True,",
+        "    defer_build=True,",
+        ")",
         "",
     ]
-    for model in sorted(enum_models, key=lambda m: m.name):
-        model_code = generate_model_code(model, models)
-        result.append(model_code)
-    remaining_models = set(model.name for model in regular_models)
+    for line in header:
+        buf.write(line)
+        buf.write("\n")
+    for model in enum_models:
+        generate_model_code(model, models, buf)
+    indegree = {name: len(deps) for name, deps in dependencies.items()}
+    dependents: dict[str, list[str]] = {name: [] for name in dependencies}
+    for model_name, deps in dependencies.items():
+        for dep in deps:
+            dependents[dep].append(model_name)
+    ready = [name for name, count in indegree.items() if count == 0]
+    heapq.heapify(ready)
     added_models = set()
-    added_models.update(model.name for model in enum_models)
-    while remaining_models:
-        progress_made = False
-        for model_name in sorted(list(remaining_models)):
-            deps = dependencies.get(model_name, set())
-            if all(dep in added_models for dep in deps):
-                model = model_dict.get(model_name)
-                if model:
-                    model_code = generate_model_code(model, models)
-                    result.append(model_code)
-                added_models.add(model_name)
-                remaining_models.remove(model_name)
-                progress_made = True
-        if not progress_made and remaining_models:
-            model_name = sorted(list(remaining_models))[0]
-            model = model_dict.get(model_name)
-            if model:
-                model_code = generate_model_code(model, models)
-                result.append(model_code)
-            added_models.add(model_name)
-            remaining_models.remove(model_name)
-    return "\n".join(result)
-
-
-def generate_model_code(model: ResourceModel, all_models: list[ResourceModel]) -> str:
-    """Generate code for a specific model"""
+    while len(added_models) < len(indegree):
+        if ready:
+            model_name = heapq.heappop(ready)
+        else:
+            # Dependency cycle: emit the first remaining model to break it
+            model_name = min(name for name in indegree if name not in added_models)
+        added_models.add(model_name)
+        generate_model_code(model_dict[model_name], models, buf)
+        for dependent in dependents[model_name]:
+            indegree[dependent] -= 1
+            if indegree[dependent] == 0 and dependent not in added_models:
+                heapq.heappush(ready, dependent)
+    return buf.getvalue()
+
+
+def generate_model_code(
+    model: ResourceModel, all_models: list[ResourceModel], buf: io.StringIO
+) -> None:
+    """Write the code for a specific model to buf, preceded by a blank line"""
     lines = [
         f"class {model.name}(BaseModel):",
         f'    """',
@@ -334,10 +414,7 @@ def generate_model_code(model: ResourceModel, all_models: list[ResourceModel]) -
     lines.extend(
         [
             f'    """',
-            "    model_config = ConfigDict(",
-            "        populate_by_name=True,",
-            "        alias_generator=alias_generators.to_camel,",
-            "    )",
+            "    model_config = _CAMEL_CONFIG",
             "",
         ]
     )
@@ -370,40 +447,37 @@ def generate_model_code(model: ResourceModel, all_models: list[ResourceModel]) -
             for field in model.fields:
                 field_type = get_python_type(field)
                 description = field.description.replace('"', '\\"')
-                description_lines = []
-                for i in range(0, len(description), 100):
-                    description_lines.append(description[i : i + 100])
-                field_line = f"    {field.name}: {field_type} = Field(\n"
+                description_lines = textwrap.wrap(
+                    description, 100, drop_whitespace=False, break_on_hyphens=False
+                ) or [""]
+                parts = [
+                    f"    {field.name}: {field_type} = Field(\n",
+                    f'        alias="{to_camel(field.name)}",\n',
+                ]
                 if len(description_lines) == 1:
-                    field_line += f'        description="{description_lines[0]}",\n'
+                    parts.append(f'        description="{description_lines[0]}",\n')
                 else:
-                    field_line += f"        description=(\n"
-                    for line in description_lines:
-                        field_line += f'            "{line}",\n'
-                    field_line += f"        ),\n"
-                field_line += "        default=None,\n"
-                field_line += "    )"
-                lines.append(field_line)
-    lines.append("")
-    return "\n".join(lines)
+                    parts.append("        description=(\n")
+                    parts.extend(
+                        f'            "{line}"\n' for line in description_lines
+                    )
+                    parts.append("        ),\n")
+                parts.append("        default=None,\n    )")
+                lines.append("".join(parts))
+    buf.write("\n")
+    for line in lines:
+        buf.write(line)
+        buf.write("\n")
 
 
 def get_python_type(field: Field) -> str:
     """Determine the Python type annotation for a field"""
-    type_mapping = {
-        "string": "str",
-        "integer": "int",
-        "number": "float",
-        "boolean": "bool",
-    }
-    type_str = type_mapping.get(field.type_name.lower(), field.type_name)
+    type_str = _TYPE_MAPPING.get(field._type_key, field.type_name)
     if field.is_enum:
-        return type_str
+        return f"Optional[{type_str}]"
     if field.is_map:
-        key_type = type_mapping.get(field.map_key_type.lower(), field.map_key_type)
-        value_type = type_mapping.get(
-            field.map_value_type.lower(), field.map_value_type
-        )
+        key_type = _TYPE_MAPPING.get(field._map_key_key, field.map_key_type)
+        value_type = _TYPE_MAPPING.get(field._map_value_key, field.map_value_type)
         type_str = f"dict[{key_type}, {value_type}]"
     if field.is_collection:
         type_str = f"list[{type_str}]"
@@ -418,14 +492,15 @@ def main():
             xml_content = xml_file.read_text(encoding="utf-8")
     else:
         xml_content = sys.stdin.read()
-    doc_match = re.search(
-        r"<document_content>(.*?)</document_content>", xml_content, re.DOTALL
-    )
-    if doc_match:
-        xml_content = doc_match.group(1)
+    start = xml_content.find(_DOCUMENT_CONTENT_START)
+    if start != -1:
+        start += len(_DOCUMENT_CONTENT_START)
+        end = xml_content.find(_DOCUMENT_CONTENT_END, start)
+        if end != -1:
+            xml_content = xml_content[start:end]
     models = parse_models_from_xml(xml_content)
     code = generate_pydantic_models(models)
-    Path("draft.py").write_text(code, encoding="utf-8")
+    Path("draft.py").write_bytes(code.encode("utf-8"))
 
 
 if __name__ == "__main__":